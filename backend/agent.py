@@ -5,8 +5,9 @@ a structured BUY / WAIT / NEUTRAL recommendation with a plain-English explanatio
 
 Tools (called by the LLM in order):
   1. get_price_history        → MongoDB price_snapshots time series
-  2. run_forecast             → Prophet 30 / 90-day price forecast
+  2. run_forecast             → Prophet (or NumPy damped-trend) 30 / 90-day forecast
   3. run_price_prediction     → XGBoost inference + top-3 SHAP factors
+                                (served from the precomputed price grid when on-grid)
   4. get_market_context       → Inventory count, trend, regional range
   5. run_llm_price_analysis   → GPT-4o-mini enhanced 30/90-day forecast (blends
                                 statistical + AI reasoning for better accuracy)
@@ -26,27 +27,48 @@ import warnings
 warnings.filterwarnings("ignore")          # suppress XGBoost GPU/CPU device warnings
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 import numpy as np
 import pandas as pd
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from pymongo import MongoClient
 
 # ── Project imports ───────────────────────────────────────────────────────────
 _ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(_ROOT))
-from scripts.model_utils import predict_price, explain_prediction
+from scripts.model_utils import predict_and_explain, listing_row
+from scripts.price_grid import predict_from_grid
+from backend.utils.forecast_cache import BATCH_FIELDS, ForecastCache, batch_forecast, history_fingerprint
+from backend.utils.forecasting import (
+    SNAPSHOT_FIELDS, get_forecaster, history_from_snapshots, market_trend_forecast,
+)
+from backend.utils import query_counter
+from backend.utils.market_context import (
+    CONTEXT_FIELDS, GLOBAL_FILTER, MONTHLY_FIELDS, context_inputs, global_memo,
+    latest_months_pipeline, market_context_pipeline, price_range, price_range_pipeline,
+    summarize, vehicle_filter,
+)
+from backend.utils.snapshot_store import store as snapshot_store
+from backend.agents.instrumentation import record_cache, record_llm_usage
 
 # ── Bootstrap ─────────────────────────────────────────────────────────────────
 load_dotenv(_ROOT / ".env")
 
-_oai = OpenAI(api_key=os.environ["OPENAI_API_KEY"])
-_db  = MongoClient(os.environ["MONGO_URI"])["carmarket"]
+_oai  = OpenAI(api_key=os.environ["OPENAI_API_KEY"])
+_aoai = AsyncOpenAI(api_key=os.environ["OPENAI_API_KEY"])
+_db  = MongoClient(os.environ["MONGO_URI"], event_listeners=[query_counter.listener])["carmarket"]
 
 MODEL = "gpt-4o-mini"
 
+# ── Forecaster (FORECASTER=prophet|holt) + cache (LRU + optional Mongo tier) ──
+_forecaster     = get_forecaster()
+_forecast_cache = ForecastCache(
+    maxsize    = int(os.environ.get("FORECAST_CACHE_SIZE", "2048")),
+    collection = "forecast_cache" if os.environ.get("FORECAST_CACHE_MONGO") == "1" else None,
+)
+
 SYSTEM_PROMPT = (
     "You are a car market analyst. When given a car query, call these tools IN ORDER:\n"
     "1. get_price_history  → fetch historical price data from MongoDB\n"
@@ -66,169 +88,177 @@ SYSTEM_PROMPT = (
 # Tool implementations
 # ══════════════════════════════════════════════════════════════════════════════
 
+# Each data tool has an async twin (a-prefixed) taking the API's Motor
+# database, used by agents/async_orchestrator.py.  Query specs and result
+# shaping live in backend/utils (market_context, forecasting,
+# forecast_cache); these functions only do the I/O.  Motor commands bypass
+# the command listener, so the async twins count them with
+# query_counter.record.
+
+def _no_history(make: str, model: str, year: int) -> list[dict]:
+    return [{"error": f"No price history for {year} {make} {model}"}]
+
+
+def _has_history(price_history: list[dict] | None) -> bool:
+    return bool(price_history) and "error" not in price_history[0]
+
+
 def get_price_history(make: str, model: str, year: int) -> list[dict]:
-    """Query MongoDB price_snapshots for (make, model, year) time series."""
-    cursor = _db["price_snapshots"].find(
-        {"make": make.lower(), "model": model.lower(), "year": year},
-        {"_id": 0, "year_month": 1, "avg_price": 1, "median_price": 1, "listing_count": 1},
-    ).sort("year_month", 1)
-
-    history = [
-        {
-            "date":          doc["year_month"],
-            "avg_price":     round(doc.get("avg_price", 0), 2),
-            "median_price":  round(doc.get("median_price", 0), 2),
-            "listing_count": doc.get("listing_count", 0),
-        }
-        for doc in cursor
-    ]
-    return history if history else [{"error": f"No price history for {year} {make} {model}"}]
+    """Query MongoDB price_snapshots for (make, model, year) time series.
+
+    Served from the in-memory snapshot store instead when it is loaded
+    (SNAPSHOT_STORE=1).
+    """
+    if snapshot_store.loaded:
+        history = snapshot_store.history(make.lower(), model.lower(), year)
+    else:
+        cursor  = _db["price_snapshots"].find(vehicle_filter(make, model, year), SNAPSHOT_FIELDS)
+        history = history_from_snapshots(cursor.sort("year_month", 1))
+    return history or _no_history(make, model, year)
+
+
+async def aget_price_history(db, make: str, model: str, year: int) -> list[dict]:
+    """get_price_history through a Motor database."""
+    if snapshot_store.loaded:
+        history = snapshot_store.history(make.lower(), model.lower(), year)
+    else:
+        query_counter.record("price_snapshots.find")
+        cursor  = db["price_snapshots"].find(vehicle_filter(make, model, year), SNAPSHOT_FIELDS)
+        history = history_from_snapshots(await cursor.sort("year_month", 1).to_list(None))
+    return history or _no_history(make, model, year)
 
 
-def _market_trend_forecast() -> dict:
+def _latest_market_months(n: int) -> list[dict]:
     """
-    Fallback: derive a forecast from the most recent global price_snapshots
-    (all makes/models combined).  Used when a specific car has no history.
-    Falls back to US used-car industry averages when DB has no data.
+    Latest n months of the market-wide average price, newest first: from
+    the in-memory store, else the indexed market_monthly rollup, else (DB
+    not re-ingested yet) the same rollup aggregated from price_snapshots —
+    a collection scan, so its result is memoized like the other globals.
     """
-    recent = list(
-        _db["price_snapshots"]
-        .find({}, {"_id": 0, "year_month": 1, "avg_price": 1})
-        .sort("year_month", -1)
-        .limit(3)
+    if snapshot_store.loaded:
+        return snapshot_store.market_monthly(n)
+    recent = list(_db["market_monthly"].find({}, MONTHLY_FIELDS).sort("year_month", -1).limit(n))
+    return recent or global_memo.get(
+        f"market_months:{n}",
+        lambda: list(_db["price_snapshots"].aggregate(latest_months_pipeline(n))),
     )
 
-    # Industry default when DB has no global data
-    if len(recent) == 0:
-        last_price = 18500.0   # US median used car price
-        mom_rate   = 0.003     # ~3.6% annual appreciation
-        return {
-            "last_known_price": last_price,
-            "forecast_30d":     round(last_price * (1 + mom_rate), 2),
-            "forecast_90d":     round(last_price * (1 + mom_rate * 3), 2),
-            "trend_direction":  "rising",
-            "trend_pct_change": round(mom_rate * 100, 2),
-            "trend_pct_90d":    round(mom_rate * 3 * 100, 2),
-            "seasonality_note": "Industry default estimate (no market data in DB yet)",
-            "method":           "industry_default",
-        }
-
-    last_price = float(recent[0]["avg_price"])
-
-    if len(recent) < 2:
-        mom_rate = 0.003
-    else:
-        prev_price = float(recent[1]["avg_price"])
-        mom_rate   = (last_price - prev_price) / prev_price if prev_price else 0.003
 
-    fc_30  = round(last_price * (1 + mom_rate), 2)
-    fc_90  = round(last_price * (1 + mom_rate * 3), 2)
-    pct_30 = round(mom_rate * 100, 2)
+async def _alatest_market_months(db, n: int) -> list[dict]:
+    if snapshot_store.loaded:
+        return snapshot_store.market_monthly(n)
+    query_counter.record("market_monthly.find")
+    recent = await db["market_monthly"].find({}, MONTHLY_FIELDS).sort("year_month", -1).limit(n).to_list(n)
 
-    return {
-        "last_known_price": round(last_price, 2),
-        "forecast_30d":     fc_30,
-        "forecast_90d":     fc_90,
-        "trend_direction":  "rising" if pct_30 > 0 else "falling",
-        "trend_pct_change": pct_30,
-        "trend_pct_90d":    round(mom_rate * 3 * 100, 2),
-        "seasonality_note": "Market-wide trend estimate (no model-specific price history in DB)",
-        "method":           "market_avg",
-    }
+    async def load() -> list[dict]:
+        query_counter.record("price_snapshots.aggregate")
+        return await db["price_snapshots"].aggregate(latest_months_pipeline(n)).to_list(n)
+    return recent or await global_memo.aget(f"market_months:{n}", load)
 
 
-def run_forecast(make: str, model: str, year: int) -> dict:
+def run_forecast(make: str, model: str, year: int, price_history: list[dict] | None = None) -> dict:
     """
-    Fetch price history from MongoDB then run Facebook Prophet.
+    Fetch price history from MongoDB then run the configured forecaster
+    (Prophet by default, or the NumPy damped-trend model — FORECASTER=holt).
     Accepts make/model/year directly so the LLM doesn't need to pipe
     raw data between tool calls.
 
     Fallback chain:
       0 months of car data  → market-wide average trend (or industry default)
       1–2 months            → linear extrapolation
-      3+ months             → Prophet time-series model
-    """
-    try:
-        from prophet import Prophet  # lazy import — heavy dep
-    except ImportError:
-        return {"error": "prophet not installed. Run: pip install prophet"}
+      3+ months             → Prophet / damped-trend time-series model
 
-    price_history = get_price_history(make, model, year)
-    has_car_data  = price_history and "error" not in price_history[0]
+    Fitted forecasts are cached by a fingerprint of the history series, so
+    a vehicle is only refitted after its price_snapshots change.  Callers
+    that already hold the history (agents/context.py) pass it in to skip
+    the re-fetch.
+    """
+    if price_history is None:
+        price_history = get_price_history(make, model, year)
 
     # ── No car-specific data → fall back to market-wide trend ────────────────
-    if not has_car_data:
-        return _market_trend_forecast()
-
-    df = pd.DataFrame(price_history)
-    df["ds"] = pd.to_datetime(df["date"], format="%Y-%m", errors="coerce")
-    df["y"]  = pd.to_numeric(df["avg_price"], errors="coerce")
-    df = df.dropna(subset=["ds", "y"])
-
-    if len(df) == 0:
-        return _market_trend_forecast()
-
-    # ── Linear fallback for sparse data (1–2 months) ─────────────────────────
-    if len(df) < 3:
-        last_price  = float(df["y"].iloc[-1])
-        first_price = float(df["y"].iloc[0])
-        n_months    = max(1, len(df) - 1)
-        mom_rate    = (last_price - first_price) / first_price / n_months  # per-month rate
-
-        fc_30 = round(last_price * (1 + mom_rate), 2)
-        fc_90 = round(last_price * (1 + mom_rate * 3), 2)
-        pct_30 = round(mom_rate * 100, 2)
-
-        return {
-            "last_known_price":  round(last_price, 2),
-            "forecast_30d":      fc_30,
-            "forecast_90d":      fc_90,
-            "trend_direction":   "rising" if pct_30 > 0 else "falling",
-            "trend_pct_change":  pct_30,
-            "trend_pct_90d":     round(mom_rate * 3 * 100, 2),
-            "seasonality_note":  "Linear extrapolation (only 2 months of data — Prophet needs ≥ 3)",
-            "method":            "linear",
-        }
-
-    m = Prophet(
-        yearly_seasonality=True,
-        weekly_seasonality=False,
-        daily_seasonality=False,
-        changepoint_prior_scale=0.3,
-    )
-    m.fit(df[["ds", "y"]])
+    if not _has_history(price_history):
+        return market_trend_forecast(_latest_market_months(3))
 
-    future   = m.make_future_dataframe(periods=90, freq="D")
-    forecast = m.predict(future)
+    fingerprint = forecast_fingerprint(price_history)
+    cached = _forecast_cache.get(fingerprint, _db)
+    record_cache("forecast_cache", cached is not None)
+    if cached is not None:
+        return cached
 
-    last_price = float(df["y"].iloc[-1])
-    last_date  = df["ds"].max()
+    forecast = _forecaster.forecast(price_history)
+    if forecast is None:
+        return market_trend_forecast(_latest_market_months(3))
+    if "error" not in forecast:
+        _forecast_cache.set(fingerprint, forecast, _db)
+    return forecast
 
-    def _price_at(days: int) -> float:
-        target = last_date + timedelta(days=days)
-        idx    = (forecast["ds"] - target).abs().idxmin()
-        return round(float(forecast.loc[idx, "yhat"]), 2)
 
-    fc_30 = _price_at(30)
-    fc_90 = _price_at(90)
+async def arun_forecast(db, price_history: list[dict], offload: Callable[..., Awaitable]) -> dict:
+    """
+    run_forecast through a Motor database, for a history the caller holds.
+    `offload(fn, *args)` runs the forecaster fit off the event loop — the
+    only CPU-bound step.
+    """
+    if not _has_history(price_history):
+        return market_trend_forecast(await _alatest_market_months(db, 3))
 
-    pct_30 = round((fc_30 - last_price) / last_price * 100, 2)
-    pct_90 = round((fc_90 - last_price) / last_price * 100, 2)
+    fingerprint = forecast_fingerprint(price_history)
+    cached = await _forecast_cache.aget(fingerprint, db)
+    record_cache("forecast_cache", cached is not None)
+    if cached is not None:
+        return cached
 
-    # Seasonality note: find the month with the highest yhat in the next 90 days
-    future_fc = forecast[forecast["ds"] > last_date].copy()
-    peak_month = future_fc.loc[future_fc["yhat"].idxmax(), "ds"].strftime("%B")
+    forecast = await offload(_forecaster.forecast, price_history)
+    if forecast is None:
+        return market_trend_forecast(await _alatest_market_months(db, 3))
+    if "error" not in forecast:
+        await _forecast_cache.aset(fingerprint, forecast, db)
+    return forecast
+
+
+def get_precomputed_forecast(make: str, model: str, year: int, price_history: list[dict]) -> dict | None:
+    """
+    Forecast written by scripts/batch_forecast.py, or None when the vehicle
+    has no batch result or its history has changed since the batch ran.
+    """
+    if not _has_history(price_history):
+        return None
+    doc      = _db["forecasts"].find_one(vehicle_filter(make, model, year), BATCH_FIELDS)
+    forecast = batch_forecast(doc, forecast_fingerprint(price_history))
+    record_cache("batch_forecast", forecast is not None)
+    return forecast
 
-    return {
-        "last_known_price":   round(last_price, 2),
-        "forecast_30d":       fc_30,
-        "forecast_90d":       fc_90,
-        "trend_direction":    "rising" if pct_30 > 0 else "falling",
-        "trend_pct_change":   pct_30,
-        "trend_pct_90d":      pct_90,
-        "seasonality_note":   f"Prices expected to peak around {peak_month} in the forecast window",
-        "method":             "prophet",
-    }
+
+async def aget_precomputed_forecast(db, make: str, model: str, year: int, price_history: list[dict]) -> dict | None:
+    """get_precomputed_forecast through a Motor database."""
+    if not _has_history(price_history):
+        return None
+    query_counter.record("forecasts.find")
+    doc      = await db["forecasts"].find_one(vehicle_filter(make, model, year), BATCH_FIELDS)
+    forecast = batch_forecast(doc, forecast_fingerprint(price_history))
+    record_cache("batch_forecast", forecast is not None)
+    return forecast
+
+
+def forecast_fingerprint(price_history: list[dict]) -> str:
+    """Cache / batch key of a history under the configured forecaster."""
+    return history_fingerprint(price_history, _forecaster.tag)
+
+
+def refresh_snapshot_store() -> dict:
+    """(Re)load price_snapshots into the in-memory store; returns its stats."""
+    return snapshot_store.load(_db["price_snapshots"])
+
+
+def watch_snapshot_store(interval: float) -> None:
+    """Refresh the in-memory store every `interval` seconds in the background."""
+    snapshot_store.watch(interval, _db["price_snapshots"])
+
+
+def forecast_cache_stats() -> dict:
+    """Hit / miss / eviction counters of the forecast cache."""
+    return _forecast_cache.stats()
 
 
 def run_price_prediction(
@@ -239,114 +269,107 @@ def run_price_prediction(
     condition: str,
     region: str,
 ) -> dict:
-    """Load XGBoost model, predict price, return top-3 SHAP factors."""
-    row = {
-        "make":        make.lower(),
-        "model":       model.lower(),
-        "year":        year,
-        "odometer":    mileage,
-        "condition":   condition.lower(),
-        "region":      region.lower(),
-        "fuel":        "gas",          # reasonable default
-        "transmission": "automatic",
-        "drive":       "fwd",
-        "type":        "sedan",
-        "title_status": "clean",
-        "cylinders":   "4 cylinders",
-        "paint_color": "white",
-        "state":       region[:2].lower(),
-    }
-    predicted = predict_price(row)
-    shap_factors = explain_prediction(row)
+    """
+    Predict price and return top-3 SHAP factors and the model version.
+
+    Popular vehicles at typical mileages are answered from the precomputed
+    fair-value grid (scripts/price_grid.py); off-grid queries run XGBoost.
+    """
+    pred = predict_from_grid(make, model, year, mileage, condition, region)
+    source = "grid"
+    if pred is None:
+        pred   = predict_and_explain(listing_row(make, model, year, mileage, condition, region))
+        source = "model"
 
     return {
-        "predicted_price": round(predicted, 2),
-        "shap_factors":    shap_factors,   # [{feature, value, impact, direction}]
+        "predicted_price": round(pred["predicted_price"], 2),
+        "shap_factors":    pred["shap_factors"],   # [{feature, value, impact, direction}]
+        "price_source":    source,                 # "grid" | "model"
+        "model_version":   pred["model_version"],
     }
 
 
+def _global_price_range() -> tuple[float, float] | None:
+    """Min / max avg_price over all of price_snapshots, or None for an empty DB."""
+    return global_memo.get(
+        "price_range",
+        lambda: price_range(list(_db["price_snapshots"].aggregate(price_range_pipeline()))),
+    )
+
+
+async def _aglobal_price_range(db) -> tuple[float, float] | None:
+    async def load() -> tuple[float, float] | None:
+        query_counter.record("price_snapshots.aggregate")
+        return price_range(await db["price_snapshots"].aggregate(price_range_pipeline()).to_list(1))
+    return await global_memo.aget("price_range", load)
+
+
+def _global_market_context() -> dict | None:
+    """Materialized fallback for unknown vehicles, or None before the first ingest."""
+    return global_memo.get(
+        "market_context",
+        lambda: _db["market_context"].find_one(GLOBAL_FILTER, CONTEXT_FIELDS),
+    )
+
+
+async def _aglobal_market_context(db) -> dict | None:
+    async def load() -> dict | None:
+        query_counter.record("market_context.find")
+        return await db["market_context"].find_one(GLOBAL_FILTER, CONTEXT_FIELDS)
+    return await global_memo.aget("market_context", load)
+
+
 def get_market_context(make: str, model: str, year: int) -> dict:
     """Return inventory count, trend, price-vs-median, and regional range.
 
+    Served from the `market_context` collection built by
+    scripts/mongo_ingest.py — one indexed find_one.  Before that collection
+    exists, the same summary is computed live in one aggregation round trip.
+
     Fallback chain when no make/model/year data exists in MongoDB:
-      1. Try global price_snapshots average for a market-wide price range.
+      1. Global price_snapshots min/max for a market-wide price range
+         (the materialized global document, or aggregated; memoized per process
+         for GLOBALS_TTL_SECONDS).
       2. If that's also empty, use CSV-derived industry averages.
     price_vs_median_pct is left as 0.0 here; synthesize_recommendation
     derives a proxy from XGBoost vs the industry average in that case.
     """
-    # Industry-average constants derived from cleaned_cars.csv (328k listings)
-    _INDUSTRY_AVG  = 19_384.0
-    _INDUSTRY_MIN  =  7_995.0
-    _INDUSTRY_MAX  = 45_000.0
-
-    make_l  = make.lower()
-    model_l = model.lower()
-    filter_ = {"make": make_l, "model": model_l, "year": year}
-
-    # Current listing count from listings collection
-    total_count = _db["listings"].count_documents(filter_)
-
-    # Inventory trend: compare snapshot listing_count across most recent 2 periods
-    recent = list(
-        _db["price_snapshots"]
-        .find(filter_, {"_id": 0, "year_month": 1, "listing_count": 1, "avg_price": 1})
-        .sort("year_month", -1)
-        .limit(2)
+    filter_ = vehicle_filter(make, model, year)
+
+    doc = _db["market_context"].find_one(filter_, CONTEXT_FIELDS)
+    if doc is not None:
+        return doc
+    fallback = _global_market_context()
+    if fallback is not None:
+        return dict(fallback)
+
+    # Un-materialized DB: live summary in one round trip
+    recent, stats, inventory = context_inputs(
+        list(_db["price_snapshots"].aggregate(market_context_pipeline(filter_)))
     )
+    return summarize(recent, stats, inventory, None if stats else _global_price_range())
 
-    inventory_trend = "unknown"
-    price_vs_median_pct = 0.0
-    if len(recent) == 2:
-        curr_cnt  = recent[0].get("listing_count", 0)
-        prev_cnt  = recent[1].get("listing_count", 1)
-        inventory_trend = "rising" if curr_cnt >= prev_cnt else "falling"
-
-    # Overall median price for this make/model/year
-    pipeline = [
-        {"$match": filter_},
-        {"$group": {
-            "_id": None,
-            "overall_avg": {"$avg": "$avg_price"},
-            "min_price":   {"$min": "$avg_price"},
-            "max_price":   {"$max": "$avg_price"},
-        }},
-    ]
-    agg = list(_db["price_snapshots"].aggregate(pipeline))
-    if agg:
-        overall_avg = agg[0]["overall_avg"] or 0
-        min_price   = round(agg[0]["min_price"], 2)
-        max_price   = round(agg[0]["max_price"], 2)
-        # latest avg vs overall avg → negative means currently below market
-        latest_avg  = recent[0].get("avg_price", overall_avg) if recent else overall_avg
-        price_vs_median_pct = round((latest_avg - overall_avg) / overall_avg * 100, 2) if overall_avg else 0.0
-    else:
-        # No make-specific data — try global snapshot average for price range display
-        global_agg = list(_db["price_snapshots"].aggregate([
-            {"$group": {"_id": None,
-                        "avg": {"$avg": "$avg_price"},
-                        "mn":  {"$min": "$avg_price"},
-                        "mx":  {"$max": "$avg_price"}}},
-        ]))
-        if global_agg:
-            g = global_agg[0]
-            min_price = round(g["mn"], 2)
-            max_price = round(g["mx"], 2)
-        else:
-            # Pure industry fallback (no DB data at all)
-            min_price = _INDUSTRY_MIN
-            max_price = _INDUSTRY_MAX
-        # price_vs_median_pct stays 0.0 — synthesize_recommendation will derive
-        # a proxy from XGBoost predicted price vs _INDUSTRY_AVG
 
-    return {
-        "current_inventory_count": total_count,
-        "inventory_trend":         inventory_trend,
-        "price_vs_median_pct":     price_vs_median_pct,   # negative = below market (good deal)
-        "regional_price_range":    {"min": min_price, "max": max_price},
-    }
+async def aget_market_context(db, make: str, model: str, year: int) -> dict:
+    """get_market_context through a Motor database."""
+    filter_ = vehicle_filter(make, model, year)
 
+    query_counter.record("market_context.find")
+    doc = await db["market_context"].find_one(filter_, CONTEXT_FIELDS)
+    if doc is not None:
+        return doc
+    fallback = await _aglobal_market_context(db)
+    if fallback is not None:
+        return dict(fallback)
 
-def run_llm_price_analysis(
+    query_counter.record("price_snapshots.aggregate")
+    recent, stats, inventory = context_inputs(
+        await db["price_snapshots"].aggregate(market_context_pipeline(filter_)).to_list(1)
+    )
+    return summarize(recent, stats, inventory, None if stats else await _aglobal_price_range(db))
+
+
+def _price_analysis_request(
     make: str,
     model: str,
     year: int,
@@ -361,14 +384,7 @@ def run_llm_price_analysis(
     inventory_trend: str,
     price_vs_median_pct: float,
 ) -> dict:
-    """
-    GPT-4o-mini powered price analysis that synthesises all available data
-    (XGBoost value, statistical forecast, inventory signals) to produce
-    AI-enhanced 30 and 90-day price forecasts.
-
-    Returns blended forecast values, a trend call, confidence, key insight,
-    and a best-time-to-buy signal — all used by synthesize_recommendation.
-    """
+    """chat.completions.create kwargs for the price analysis (sync and async clients)."""
     current_month = datetime.now().strftime("%B")
     prompt = (
         f"You are an expert automotive market analyst. Analyse this used car and forecast prices.\n\n"
@@ -394,38 +410,105 @@ def run_llm_price_analysis(
         f'  "best_time_to_buy": "now" | "30_days" | "90_days" | "wait"\n'
         f'}}'
     )
+    return {
+        "model": MODEL,
+        "messages": [
+            {"role": "system", "content": "You are an expert automotive market analyst. Always respond with valid JSON only."},
+            {"role": "user",   "content": prompt},
+        ],
+        "temperature": 0.15,
+        "response_format": {"type": "json_object"},
+    }
 
+
+def _parse_price_analysis(resp, exc: Exception | None, **inputs) -> dict:
+    """LLM response → analysis dict, or the statistical fallback when the call failed."""
+    stat_forecast_30d = inputs["stat_forecast_30d"]
+    stat_forecast_90d = inputs["stat_forecast_90d"]
+    trend_direction   = inputs["trend_direction"]
+    if exc is None:
+        try:
+            data = json.loads(resp.choices[0].message.content)
+            return {
+                "forecast_30d":       float(data.get("forecast_30d", stat_forecast_30d)),
+                "forecast_90d":       float(data.get("forecast_90d", stat_forecast_90d)),
+                "trend_direction":    str(data.get("trend_direction", trend_direction)),
+                "confidence":         str(data.get("confidence", "MODERATE")),
+                "key_insight":        str(data.get("key_insight", "")),
+                "best_time_to_buy":   str(data.get("best_time_to_buy", "neutral")),
+                "method":             "llm_analysis",
+            }
+        except Exception as parse_exc:
+            exc = parse_exc
+    # Graceful fallback — return statistical values so the pipeline continues
+    return {
+        "forecast_30d":     stat_forecast_30d,
+        "forecast_90d":     stat_forecast_90d,
+        "trend_direction":  trend_direction,
+        "confidence":       "LOW",
+        "key_insight":      f"LLM analysis unavailable ({exc}); using statistical forecast.",
+        "best_time_to_buy": "neutral",
+        "method":           "llm_fallback",
+    }
+
+
+def run_llm_price_analysis(
+    make: str,
+    model: str,
+    year: int,
+    mileage: int,
+    condition: str,
+    region: str,
+    current_price: float,
+    stat_forecast_30d: float,
+    stat_forecast_90d: float,
+    trend_direction: str,
+    trend_pct_30d: float,
+    inventory_trend: str,
+    price_vs_median_pct: float,
+) -> dict:
+    """
+    GPT-4o-mini powered price analysis that synthesises all available data
+    (XGBoost value, statistical forecast, inventory signals) to produce
+    AI-enhanced 30 and 90-day price forecasts.
+
+    Returns blended forecast values, a trend call, confidence, key insight,
+    and a best-time-to-buy signal — all used by synthesize_recommendation.
+    """
+    inputs  = dict(locals())
+    request = _price_analysis_request(**inputs)
     try:
-        resp = _oai.chat.completions.create(
-            model=MODEL,
-            messages=[
-                {"role": "system", "content": "You are an expert automotive market analyst. Always respond with valid JSON only."},
-                {"role": "user",   "content": prompt},
-            ],
-            temperature=0.15,
-            response_format={"type": "json_object"},
-        )
-        data = json.loads(resp.choices[0].message.content)
-        return {
-            "forecast_30d":       float(data.get("forecast_30d", stat_forecast_30d)),
-            "forecast_90d":       float(data.get("forecast_90d", stat_forecast_90d)),
-            "trend_direction":    str(data.get("trend_direction", trend_direction)),
-            "confidence":         str(data.get("confidence", "MODERATE")),
-            "key_insight":        str(data.get("key_insight", "")),
-            "best_time_to_buy":   str(data.get("best_time_to_buy", "neutral")),
-            "method":             "llm_analysis",
-        }
-    except Exception as exc:
-        # Graceful fallback — return statistical values so the pipeline continues
-        return {
-            "forecast_30d":     stat_forecast_30d,
-            "forecast_90d":     stat_forecast_90d,
-            "trend_direction":  trend_direction,
-            "confidence":       "LOW",
-            "key_insight":      f"LLM analysis unavailable ({exc}); using statistical forecast.",
-            "best_time_to_buy": "neutral",
-            "method":           "llm_fallback",
-        }
+        resp, exc = _oai.chat.completions.create(**request), None
+        record_llm_usage(resp)
+    except Exception as err:
+        resp, exc = None, err
+    return _parse_price_analysis(resp, exc, **inputs)
+
+
+async def run_llm_price_analysis_async(
+    make: str,
+    model: str,
+    year: int,
+    mileage: int,
+    condition: str,
+    region: str,
+    current_price: float,
+    stat_forecast_30d: float,
+    stat_forecast_90d: float,
+    trend_direction: str,
+    trend_pct_30d: float,
+    inventory_trend: str,
+    price_vs_median_pct: float,
+) -> dict:
+    """run_llm_price_analysis on the AsyncOpenAI client (async orchestrator)."""
+    inputs  = dict(locals())
+    request = _price_analysis_request(**inputs)
+    try:
+        resp, exc = await _aoai.chat.completions.create(**request), None
+        record_llm_usage(resp)
+    except Exception as err:
+        resp, exc = None, err
+    return _parse_price_analysis(resp, exc, **inputs)
 
 
 def synthesize_recommendation(
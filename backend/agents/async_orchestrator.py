@@ -0,0 +1,156 @@
+# backend/agents/async_orchestrator.py
+"""Async OrchestratorAgent — the same stage graph, natively on the event loop.
+
+Selected in main.py with ORCHESTRATOR_MODE=async.  Instead of pinning a
+default-executor thread for the whole analysis:
+  * MongoDB reads — fallbacks included — use the API's Motor client,
+    through backend/agent.py's async tool twins (aget_*, arun_forecast),
+  * the LLM stages use AsyncOpenAI,
+  * only CPU-bound work (forecast fit, XGBoost) runs on a dedicated bounded
+    executor (ORCHESTRATOR_CPU_WORKERS, default = CPU count),
+and the report is assembled by the same code as the threaded path.
+"""
+from __future__ import annotations
+import asyncio
+import contextvars
+import functools
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(_ROOT))
+
+from backend.agents import (
+    data_agent, trend_agent, forecast_agent,
+    risk_agent, decision_agent, explanation_agent, ethics_agent,
+)
+from backend.agents.instrumentation import acharged, instrumented, ledger, record_cache
+from backend.agents.orchestrator import assemble_report, is_demo_vehicle, run_orchestrator
+from backend.agent import (
+    aget_market_context, aget_precomputed_forecast, aget_price_history, arun_forecast,
+    run_price_prediction,
+)
+from backend.utils.dag import Stage, run_dag_async
+from backend.utils.query_counter import counting
+
+_CPU_POOL = ThreadPoolExecutor(
+    max_workers=int(os.environ.get("ORCHESTRATOR_CPU_WORKERS", "0")) or os.cpu_count(),
+    thread_name_prefix="agent-cpu",
+)
+
+
+async def _offload(fn: Callable, *args, **kwargs) -> Any:
+    """Run a blocking call on the bounded CPU pool, keeping the request's contextvars."""
+    call = functools.partial(contextvars.copy_context().run, fn, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(_CPU_POOL, call)
+
+
+class AsyncDataContext:
+    """Per-request memo of Motor reads (async counterpart of agents/context.py).
+
+    Each read is started once; concurrent stages await the same task.  The
+    reads themselves are backend/agent.py's a-prefixed tools.
+    """
+
+    def __init__(self, db, make: str, model: str, year: int):
+        self.db = db
+        self.make, self.model, self.year = make, model, year
+        self._tasks: dict[str, asyncio.Future] = {}
+
+    def _once(self, name: str, factory: Callable[[], Awaitable]) -> Awaitable:
+        record_cache(f"context.{name}", name in self._tasks)
+        if name not in self._tasks:
+            self._tasks[name] = asyncio.ensure_future(factory())
+        return self._tasks[name]
+
+    def price_history(self) -> Awaitable[list[dict]]:
+        return self._once(
+            "price_history", lambda: aget_price_history(self.db, self.make, self.model, self.year),
+        )
+
+    def market_context(self) -> Awaitable[dict]:
+        return self._once(
+            "market_context", lambda: aget_market_context(self.db, self.make, self.model, self.year),
+        )
+
+    def precomputed_forecast(self) -> Awaitable[dict | None]:
+        async def _fetch() -> dict | None:
+            history = await self.price_history()
+            return await aget_precomputed_forecast(self.db, self.make, self.model, self.year, history)
+        return self._once("precomputed_forecast", _fetch)
+
+
+async def run_orchestrator_async(
+    db, make: str, model: str, year: int,
+    mileage: int = 50_000, condition: str = "good", region: str = "california",
+) -> dict:
+    """Async run_orchestrator: `db` is the API's Motor database handle."""
+    if is_demo_vehicle(make, model):
+        return run_orchestrator(make, model, year, mileage, condition, region)   # no I/O
+
+    vehicle_name = f"{year} {make.title()} {model.title()}"
+    with counting() as queries:
+        ctx = AsyncDataContext(db, make, model, year)
+
+        @instrumented("TrendAnalysisAgent")
+        async def _trend(r: dict) -> dict:
+            # Nightly batch first; fit live (CPU pool) only on a miss
+            forecast = await ctx.precomputed_forecast()
+            source   = "batch" if forecast is not None else "live"
+            if forecast is None:
+                forecast = await arun_forecast(db, r["history"], _offload)
+            return trend_agent.derive(forecast, r["history"], source)
+
+        async def _now(value: Any) -> Any:
+            return value
+
+        stages = [
+            Stage("history", acharged("DataAgent", lambda r: ctx.price_history())),
+            Stage("market",  acharged("DataAgent", lambda r: ctx.market_context())),
+            Stage("data",    lambda r: _now(data_agent.summarize(make, model, year, r["history"], r["market"])),
+                  ("history", "market")),
+            Stage("trend",   _trend, ("history",)),
+            Stage("price",   acharged("ForecastAgent", lambda r: _offload(
+                run_price_prediction, make, model, year, mileage, condition, region))),
+            Stage("forecast", lambda r: forecast_agent.arun(
+                make=make, model=model, year=year,
+                mileage=mileage, condition=condition, region=region,
+                forecast=r["trend"]["forecast"], market_context=r["market"],
+                xgb_result=r["price"],
+            ), ("trend", "market", "price")),
+            Stage("risk", lambda r: _now(risk_agent.run(
+                predicted_price=r["forecast"]["predicted_price"], forecast_90d=r["forecast"]["forecast_90d"],
+                confidence_base=r["forecast"]["confidence_base"],
+                inventory_trend=r["market"].get("inventory_trend", "unknown"),
+                has_price_history=r["data"]["has_history"],
+            )), ("forecast", "data")),
+            Stage("decision", lambda r: _now(decision_agent.run(
+                predicted_90_day_change=r["risk"]["predicted_90_day_change"],
+                confidence_score=r["forecast"]["confidence_base"], volatility_index=r["risk"]["volatility_index"],
+                price_vs_median_pct=float(r["market"].get("price_vs_median_pct", 0.0)),
+            )), ("risk",)),
+            Stage("explanation", lambda r: explanation_agent.arun(
+                make=make, model=model, year=year, mileage=mileage,
+                condition=condition, region=region, predicted_price=r["forecast"]["predicted_price"],
+                predicted_90_day_change=r["risk"]["predicted_90_day_change"],
+                confidence_score=r["forecast"]["confidence_base"], volatility_index=r["risk"]["volatility_index"],
+                final_recommendation=r["decision"]["final_recommendation"],
+                decision_rationale=r["decision"]["decision_rationale"],
+                llm_key_insight=r["forecast"]["llm_analysis"].get("key_insight", ""),
+                trend_direction=r["trend"]["trend_data"]["direction"],
+                inventory_trend=r["market"].get("inventory_trend", "unknown"),
+            ), ("decision", "trend")),
+            Stage("ethics", lambda r: _now(ethics_agent.run(
+                make=make, model=model, year=year, forecast_method=r["forecast"]["forecast_method"],
+                confidence_score=r["forecast"]["confidence_base"], volatility_index=r["risk"]["volatility_index"],
+                has_price_history=r["data"]["has_history"],
+                inventory_trend=r["market"].get("inventory_trend", "unknown"),
+            )), ("forecast", "risk", "data")),
+        ]
+        with ledger():
+            results, timings = await run_dag_async(stages)
+
+    return assemble_report(vehicle_name, make, model, year, results, queries, timings)
@@ -0,0 +1,81 @@
+# backend/agents/context.py
+"""DataContext — per-request memo of every MongoDB read the agents make.
+
+run_orchestrator creates one per invocation and hands it to the agents, so
+price history, market context and the stored forecast are each fetched at
+most once per vehicle however many agents need them.  Commands actually
+sent to MongoDB are counted for the agent log.
+"""
+from __future__ import annotations
+import sys
+import threading
+from collections import Counter
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any, Callable
+
+_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(_ROOT))
+from backend.agent import get_price_history, get_market_context, get_precomputed_forecast, run_forecast
+from backend.agents.instrumentation import record_cache
+from backend.utils.query_counter import counting
+
+
+class DataContext:
+    """Memoized data access for one (make, model, year) request.
+
+    Use as a context manager to count the Mongo commands issued inside it.
+    """
+
+    def __init__(self, make: str, model: str, year: int, price_history: list[dict] | None = None):
+        self.make, self.model, self.year = make, model, year
+        self.queries: Counter = Counter()
+        self._memo:  dict[str, Any] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()                # creates the per-read locks
+        self._stack = ExitStack()
+        if price_history is not None:                 # already fetched by the caller
+            self._memo["price_history"] = price_history
+
+    def __enter__(self) -> "DataContext":
+        self.queries = self._stack.enter_context(counting())
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stack.close()
+
+    @property
+    def query_count(self) -> int:
+        return sum(self.queries.values())
+
+    def _once(self, name: str, fn: Callable[[], Any]) -> Any:
+        # Per-read lock: concurrent pipeline stages wait for one fetch
+        # instead of each issuing their own, while different reads overlap.
+        record_cache(f"context.{name}", name in self._memo)
+        if name not in self._memo:
+            with self._guard:
+                lock = self._locks.setdefault(name, threading.Lock())
+            with lock:
+                if name not in self._memo:
+                    self._memo[name] = fn()
+        return self._memo[name]
+
+    # ── Reads ─────────────────────────────────────────────────────────────────
+    def price_history(self) -> list[dict]:
+        return self._once("price_history", lambda: get_price_history(self.make, self.model, self.year))
+
+    def market_context(self) -> dict:
+        return self._once("market_context", lambda: get_market_context(self.make, self.model, self.year))
+
+    def precomputed_forecast(self) -> dict | None:
+        return self._once(
+            "precomputed_forecast",
+            lambda: get_precomputed_forecast(self.make, self.model, self.year, self.price_history()),
+        )
+
+    def forecast(self) -> dict:
+        """Live forecast fitted on the already-fetched history."""
+        return self._once(
+            "forecast",
+            lambda: run_forecast(self.make, self.model, self.year, price_history=self.price_history()),
+        )
@@ -6,12 +6,17 @@ from pathlib import Path
 
 _ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(_ROOT))
-from backend.agent import get_price_history, get_market_context
+from backend.agents.context import DataContext
+from backend.agents.instrumentation import instrumented
 
 
-def run(make: str, model: str, year: int) -> dict:
+@instrumented("DataAgent")
+def run(make: str, model: str, year: int, ctx: DataContext | None = None) -> dict:
     """Fetch price history and market context for the given vehicle.
 
+    Reads go through `ctx` (the orchestrator's per-request DataContext) so
+    later agents reuse them without another round trip.
+
     Returns
     -------
     {
@@ -21,9 +26,13 @@ def run(make: str, model: str, year: int) -> dict:
         "agent_log_entry": {"agent": "DataAgent", "message": str, "output": dict},
     }
     """
-    price_history  = get_price_history(make, model, year)
-    market_context = get_market_context(make, model, year)
+    ctx = ctx or DataContext(make, model, year)
+    return summarize(make, model, year, ctx.price_history(), ctx.market_context())
+
 
+@instrumented("DataAgent")
+def summarize(make: str, model: str, year: int, price_history: list[dict], market_context: dict) -> dict:
+    """Agent output for data fetched elsewhere (e.g. by the async orchestrator)."""
     has_history = bool(price_history) and "error" not in price_history[0]
     n_months    = len(price_history) if has_history else 0
 
@@ -1,8 +1,10 @@
 # backend/agents/decision_agent.py
 """DecisionAgent — three-rule deterministic decision engine."""
 from __future__ import annotations
+from backend.agents.instrumentation import instrumented
 
 
+@instrumented("DecisionAgent")
 def run(
     predicted_90_day_change: float,
     confidence_score: int,
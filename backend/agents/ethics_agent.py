@@ -1,6 +1,7 @@
 # backend/agents/ethics_agent.py
 """EthicsAgent — pure Python transparency notes, bias statements, and disclaimers."""
 from __future__ import annotations
+from backend.agents.instrumentation import instrumented
 
 
 _MAKE_BIAS_NOTES: dict[str, str] = {
@@ -28,6 +29,7 @@ _ETHICS_DISCLAIMER = (
 )
 
 
+@instrumented("EthicsAgent")
 def run(
     make: str,
     model: str,
@@ -52,6 +54,7 @@ def run(
     # ── Transparency note (method + data quality) ─────────────────────────────
     _method_labels = {
         "prophet":          "Facebook Prophet time-series model (3+ months of price history)",
+        "holt":             "damped-trend seasonal smoothing model (3+ months of price history)",
         "llm_blended":      "XGBoost + GPT-4o-mini blended forecast (statistical + AI reasoning)",
         "linear":           "linear extrapolation (limited 1–2 months of data)",
         "statistical":      "statistical model with blended AI analysis",
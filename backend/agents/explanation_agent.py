@@ -6,15 +6,17 @@ from pathlib import Path
 
 _ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(_ROOT))
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from dotenv import load_dotenv
+from backend.agents.instrumentation import instrumented, record_llm_usage
 
 load_dotenv(_ROOT / ".env")
-_oai = OpenAI(api_key=os.environ["OPENAI_API_KEY"])
+_oai  = OpenAI(api_key=os.environ["OPENAI_API_KEY"])
+_aoai = AsyncOpenAI(api_key=os.environ["OPENAI_API_KEY"])
 MODEL = "gpt-4o-mini"
 
 
-def run(
+def _request(
     make: str,
     model: str,
     year: int,
@@ -31,18 +33,7 @@ def run(
     trend_direction: str,
     inventory_trend: str,
 ) -> dict:
-    """Generate a 3-bullet reasoning summary using GPT-4o-mini.
-
-    Falls back to a deterministic template if the LLM call fails.
-
-    Returns
-    -------
-    {
-        "reasoning_summary": ["sentence 1", "sentence 2", "sentence 3"],
-        "explanation_text": str,   # legacy flat explanation string
-        "agent_log_entry": {...},
-    }
-    """
+    """chat.completions.create kwargs (shared by the sync and async clients)."""
     prompt = (
         f"You are a car market analyst. Summarise this analysis in exactly 3 concise bullet sentences.\n\n"
         f"Vehicle: {year} {make.title()} {model.title()}\n"
@@ -57,17 +48,20 @@ def run(
         f'{{ "reasoning": ["sentence1", "sentence2", "sentence3"] }}\n'
         f"Each sentence must be direct, cite specific numbers, and be ≤ 25 words."
     )
+    return {
+        "model": MODEL,
+        "messages": [
+            {"role": "system", "content": "You are an expert automotive analyst. Return JSON only."},
+            {"role": "user",   "content": prompt},
+        ],
+        "temperature": 0.1,
+        "response_format": {"type": "json_object"},
+    }
+
 
+def _result(resp, **inputs) -> dict:
+    """LLM response (None if the call failed) → agent output, with a deterministic fallback."""
     try:
-        resp = _oai.chat.completions.create(
-            model=MODEL,
-            messages=[
-                {"role": "system", "content": "You are an expert automotive analyst. Return JSON only."},
-                {"role": "user",   "content": prompt},
-            ],
-            temperature=0.1,
-            response_format={"type": "json_object"},
-        )
         data    = json.loads(resp.choices[0].message.content)
         bullets = data.get("reasoning", [])
         if isinstance(bullets, list) and len(bullets) >= 3:
@@ -76,16 +70,18 @@ def run(
             raise ValueError("Unexpected LLM response shape")
     except Exception:
         # Deterministic fallback
-        direction_word = "rise" if predicted_90_day_change > 0 else "fall"
+        year, make, model = inputs["year"], inputs["make"], inputs["model"]
+        change         = inputs["predicted_90_day_change"]
+        direction_word = "rise" if change > 0 else "fall"
         summary = [
-            f"Fair market value for this {year} {make.title()} {model.title()} is ${predicted_price:,.0f}.",
-            f"Prices are forecast to {direction_word} {abs(predicted_90_day_change):.1f}% over 90 days with {confidence_score}% confidence.",
-            decision_rationale,
+            f"Fair market value for this {year} {make.title()} {model.title()} is ${inputs['predicted_price']:,.0f}.",
+            f"Prices are forecast to {direction_word} {abs(change):.1f}% over 90 days with {inputs['confidence_score']}% confidence.",
+            inputs["decision_rationale"],
         ]
 
     explanation_text = " ".join(summary)
 
-    msg = f"Generated 3-sentence reasoning for {final_recommendation} recommendation."
+    msg = f"Generated 3-sentence reasoning for {inputs['final_recommendation']} recommendation."
 
     return {
         "reasoning_summary": summary,
@@ -97,3 +93,70 @@ def run(
             "output":  {"reasoning_summary": summary},
         },
     }
+
+
+@instrumented("ExplanationAgent")
+def run(
+    make: str,
+    model: str,
+    year: int,
+    mileage: int,
+    condition: str,
+    region: str,
+    predicted_price: float,
+    predicted_90_day_change: float,
+    confidence_score: int,
+    volatility_index: str,
+    final_recommendation: str,
+    decision_rationale: str,
+    llm_key_insight: str,
+    trend_direction: str,
+    inventory_trend: str,
+) -> dict:
+    """Generate a 3-bullet reasoning summary using GPT-4o-mini.
+
+    Falls back to a deterministic template if the LLM call fails.
+
+    Returns
+    -------
+    {
+        "reasoning_summary": ["sentence 1", "sentence 2", "sentence 3"],
+        "explanation_text": str,   # legacy flat explanation string
+        "agent_log_entry": {...},
+    }
+    """
+    inputs = dict(locals())
+    try:
+        resp = _oai.chat.completions.create(**_request(**inputs))
+        record_llm_usage(resp)
+    except Exception:
+        resp = None
+    return _result(resp, **inputs)
+
+
+@instrumented("ExplanationAgent")
+async def arun(
+    make: str,
+    model: str,
+    year: int,
+    mileage: int,
+    condition: str,
+    region: str,
+    predicted_price: float,
+    predicted_90_day_change: float,
+    confidence_score: int,
+    volatility_index: str,
+    final_recommendation: str,
+    decision_rationale: str,
+    llm_key_insight: str,
+    trend_direction: str,
+    inventory_trend: str,
+) -> dict:
+    """`run` on the AsyncOpenAI client, for the async orchestrator."""
+    inputs = dict(locals())
+    try:
+        resp = await _aoai.chat.completions.create(**_request(**inputs))
+        record_llm_usage(resp)
+    except Exception:
+        resp = None
+    return _result(resp, **inputs)
@@ -6,9 +6,11 @@ from pathlib import Path
 
 _ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(_ROOT))
-from backend.agent import run_price_prediction, run_llm_price_analysis
+from backend.agent import run_price_prediction, run_llm_price_analysis, run_llm_price_analysis_async
+from backend.agents.instrumentation import instrumented
 
 
+@instrumented("ForecastAgent")
 def run(
     make: str,
     model: str,
@@ -18,9 +20,13 @@ def run(
     region: str,
     forecast: dict,
     market_context: dict,
+    xgb_result: dict | None = None,
 ) -> dict:
     """Run XGBoost inference then blend with LLM-enhanced price analysis.
 
+    Pass `xgb_result` (run_price_prediction output) when the orchestrator
+    has already computed it concurrently with the trend stage.
+
     Returns
     -------
     {
@@ -30,35 +36,73 @@ def run(
         "forecast_method": str,
         "confidence_base": int,      # base confidence 0-100 before adjustments
         "shap_factors": [...],
+        "model_version": str,        # price model version used
         "llm_analysis": {...},
         "agent_log_entry": {...},
     }
     """
     # ── XGBoost inference ─────────────────────────────────────────────────────
-    xgb_result = run_price_prediction(make, model, year, mileage, condition, region)
-    predicted_price = float(xgb_result.get("predicted_price", 0.0))
-    shap_factors    = xgb_result.get("shap_factors", [])
+    if xgb_result is None:
+        xgb_result = run_price_prediction(make, model, year, mileage, condition, region)
 
     # ── LLM analysis ──────────────────────────────────────────────────────────
-    stat_30d     = float(forecast.get("forecast_30d", predicted_price))
-    stat_90d     = float(forecast.get("forecast_90d", predicted_price))
-    trend_dir    = forecast.get("trend_direction", "stable")
-    trend_pct    = float(forecast.get("trend_pct_change", 0.0))
-    inv_trend    = market_context.get("inventory_trend", "unknown")
-    pct_vs_med   = float(market_context.get("price_vs_median_pct", 0.0))
-
-    llm_analysis = run_llm_price_analysis(
+    llm_analysis = run_llm_price_analysis(**_llm_inputs(
+        make, model, year, mileage, condition, region, forecast, market_context, xgb_result,
+    ))
+    return _blend(forecast, xgb_result, llm_analysis)
+
+
+@instrumented("ForecastAgent")
+async def arun(
+    make: str,
+    model: str,
+    year: int,
+    mileage: int,
+    condition: str,
+    region: str,
+    forecast: dict,
+    market_context: dict,
+    xgb_result: dict,
+) -> dict:
+    """`run` for the async orchestrator: LLM call on the AsyncOpenAI client.
+
+    XGBoost inference is CPU-bound, so the caller runs it on its executor
+    and passes `xgb_result` in.
+    """
+    llm_analysis = await run_llm_price_analysis_async(**_llm_inputs(
+        make, model, year, mileage, condition, region, forecast, market_context, xgb_result,
+    ))
+    return _blend(forecast, xgb_result, llm_analysis)
+
+
+def _llm_inputs(
+    make: str, model: str, year: int, mileage: int, condition: str, region: str,
+    forecast: dict, market_context: dict, xgb_result: dict,
+) -> dict:
+    """Keyword arguments for run_llm_price_analysis(_async)."""
+    predicted_price = float(xgb_result.get("predicted_price", 0.0))
+    return dict(
         make=make, model=model, year=year,
         mileage=mileage, condition=condition, region=region,
         current_price=predicted_price,
-        stat_forecast_30d=stat_30d,
-        stat_forecast_90d=stat_90d,
-        trend_direction=trend_dir,
-        trend_pct_30d=trend_pct,
-        inventory_trend=inv_trend,
-        price_vs_median_pct=pct_vs_med,
+        stat_forecast_30d=float(forecast.get("forecast_30d", predicted_price)),
+        stat_forecast_90d=float(forecast.get("forecast_90d", predicted_price)),
+        trend_direction=forecast.get("trend_direction", "stable"),
+        trend_pct_30d=float(forecast.get("trend_pct_change", 0.0)),
+        inventory_trend=market_context.get("inventory_trend", "unknown"),
+        price_vs_median_pct=float(market_context.get("price_vs_median_pct", 0.0)),
     )
 
+
+def _blend(forecast: dict, xgb_result: dict, llm_analysis: dict) -> dict:
+    """Blend the statistical and LLM forecasts and derive base confidence."""
+    predicted_price = float(xgb_result.get("predicted_price", 0.0))
+    shap_factors    = xgb_result.get("shap_factors", [])
+    model_version   = xgb_result.get("model_version")
+    stat_30d        = float(forecast.get("forecast_30d", predicted_price))
+    stat_90d        = float(forecast.get("forecast_90d", predicted_price))
+    trend_dir       = forecast.get("trend_direction", "stable")
+
     # ── Blend: 40% statistical + 60% LLM for 30d; 30/70 for 90d ─────────────
     llm_30d = float(llm_analysis.get("forecast_30d", stat_30d))
     llm_90d = float(llm_analysis.get("forecast_90d", stat_90d))
@@ -75,6 +119,7 @@ def run(
     # ── Base confidence from forecast method ──────────────────────────────────
     _method_conf = {
         "prophet":          80,
+        "holt":             80,
         "llm_blended":      78,
         "linear":           72,
         "statistical":      75,
@@ -109,6 +154,7 @@ def run(
         "forecast_method":  forecast_method,
         "confidence_base":  conf_base,
         "shap_factors":     shap_factors,
+        "model_version":    model_version,
         "llm_analysis":     llm_analysis,
         "agent_log_entry": {
             "agent":   "ForecastAgent",
@@ -121,6 +167,8 @@ def run(
                 "forecast_method":  forecast_method,
                 "confidence_base":  conf_base,
                 "llm_best_time":    btb,
+                "model_version":    model_version,
+                "price_source":     xgb_result.get("price_source", "model"),
             },
         },
     }
@@ -0,0 +1,282 @@
+# backend/agents/instrumentation.py
+"""Per-agent timing and resource instrumentation.
+
+`@instrumented("DataAgent")` wraps an agent's run / arun.  While the agent
+runs, a probe in a ContextVar collects what the call cost, and the wrapper
+adds four fields to the returned agent_log_entry:
+
+  duration_ms : wall-clock time of the call
+  db_calls    : MongoDB commands issued (backend/utils/query_counter.py)
+  llm_tokens  : OpenAI prompt + completion tokens (record_llm_usage)
+  cache       : {cache name: "hit" | "miss"} for lookups made (record_cache)
+
+Every call is also folded into process-wide per-agent histograms, exported
+by GET /api/metrics through `metrics()`.  Nested instrumented calls (run →
+summarize) are measured once, by the outermost wrapper.
+
+The orchestrators run some of an agent's work as separate DAG stages (the
+DataAgent's Mongo reads, the ForecastAgent's XGBoost inference).  Inside a
+`ledger()` block, a stage wrapped with `charged(agent, fn)` /
+`acharged(agent, fn)` is probed the same way and its cost is added to that
+agent's entry and histograms when the agent itself finishes.
+"""
+from __future__ import annotations
+import functools
+import inspect
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterator
+
+_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(_ROOT))
+from backend.utils.query_counter import counting
+
+# Histogram upper bounds (a final +Inf bucket is implied)
+_DURATION_BUCKETS = (5, 10, 25, 50, 100, 250, 500, 1_000, 2_500, 5_000, 10_000, 30_000)
+_DB_BUCKETS       = (0, 1, 2, 3, 5, 10, 25)
+_TOKEN_BUCKETS    = (0, 250, 500, 1_000, 2_000, 4_000, 8_000)
+
+
+class _Probe:
+    """Resources used by one agent call (or one stage charged to it)."""
+
+    def __init__(self, db: Counter):
+        self.db                    = db
+        self.llm_tokens            = 0
+        self.cache: dict[str, str] = {}
+        self.charged_ms            = 0.0     # time of stages charged to the agent
+
+    def absorb(self, other: "_Probe", duration_ms: float) -> None:
+        self.db.update(other.db)
+        self.llm_tokens += other.llm_tokens
+        self.cache.update(other.cache)
+        self.charged_ms += duration_ms
+
+
+class _Ledger:
+    """Per-request costs of stages charged to an agent, awaiting that agent."""
+
+    def __init__(self):
+        self._lock  = threading.Lock()
+        self._costs: dict[str, _Probe] = {}
+
+    def add(self, agent: str, probe: _Probe, duration_ms: float) -> None:
+        with self._lock:
+            total = self._costs.setdefault(agent, _Probe(Counter()))
+            total.absorb(probe, duration_ms)
+
+    def take(self, agent: str) -> _Probe | None:
+        with self._lock:
+            return self._costs.pop(agent, None)
+
+
+_probe:  ContextVar[_Probe | None]  = ContextVar("agent_probe", default=None)
+_ledger: ContextVar[_Ledger | None] = ContextVar("agent_ledger", default=None)
+
+
+def record_llm_usage(resp) -> None:
+    """Add an OpenAI response's token usage to the running agent (if any)."""
+    probe = _probe.get()
+    usage = getattr(resp, "usage", None)
+    if probe is not None and usage is not None:
+        probe.llm_tokens += int(getattr(usage, "total_tokens", 0) or 0)
+
+
+def record_cache(name: str, hit: bool) -> None:
+    """Note a cache lookup made by the running agent (if any)."""
+    probe = _probe.get()
+    if probe is not None:
+        probe.cache[name] = "hit" if hit else "miss"
+
+
+# ── Aggregates ─────────────────────────────────────────────────────────────────
+class Histogram:
+    """Fixed-bucket histogram; quantiles are bucket upper bounds (capped at max)."""
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count  = 0
+        self.sum    = 0.0
+        self.max    = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum   += value
+        self.max    = max(self.max, value)
+
+    def quantile(self, q: float) -> float | None:
+        if not self.count:
+            return None
+        rank, seen = q * self.count, 0
+        for bound, n in zip(self.bounds, self.counts):
+            seen += n
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> dict:
+        return {
+            "buckets": {
+                **{f"le_{b:g}": n for b, n in zip(self.bounds, self.counts)},
+                "le_inf": self.counts[-1],
+            },
+            "count": self.count,
+            "sum":   round(self.sum, 1),
+            "mean":  round(self.sum / self.count, 1) if self.count else None,
+            "p50":   self.quantile(0.50),
+            "p95":   self.quantile(0.95),
+            "max":   round(self.max, 1),
+        }
+
+
+class _AgentStats:
+    def __init__(self):
+        self.errors      = 0
+        self.duration_ms = Histogram(_DURATION_BUCKETS)
+        self.db_calls    = Histogram(_DB_BUCKETS)
+        self.llm_tokens  = Histogram(_TOKEN_BUCKETS)
+        self.cache: defaultdict[str, Counter] = defaultdict(Counter)
+
+
+_stats: defaultdict[str, _AgentStats] = defaultdict(_AgentStats)
+_lock = threading.Lock()
+
+
+def _observe(agent: str, duration_ms: float, probe: _Probe, failed: bool) -> None:
+    with _lock:
+        stats = _stats[agent]
+        stats.errors += failed
+        stats.duration_ms.observe(duration_ms)
+        stats.db_calls.observe(sum(probe.db.values()))
+        stats.llm_tokens.observe(probe.llm_tokens)
+        for name, outcome in probe.cache.items():
+            stats.cache[name][outcome] += 1
+
+
+def metrics() -> dict:
+    """Per-agent histograms of duration_ms / db_calls / llm_tokens, plus cache hit counts."""
+    with _lock:
+        return {
+            agent: {
+                "calls":       stats.duration_ms.count,
+                "errors":      stats.errors,
+                "duration_ms": stats.duration_ms.to_dict(),
+                "db_calls":    stats.db_calls.to_dict(),
+                "llm_tokens":  stats.llm_tokens.to_dict(),
+                "cache":       {name: dict(c) for name, c in stats.cache.items()},
+            }
+            for agent, stats in sorted(_stats.items())
+        }
+
+
+# ── Decorator ──────────────────────────────────────────────────────────────────
+@contextmanager
+def _measuring(agent: str) -> Iterator[Callable[[Any], Any]]:
+    """Probe the block; yields `finish(result)`, which annotates the log entry."""
+    t0 = time.perf_counter()
+    with counting() as db:
+        probe  = _Probe(db)
+        token  = _probe.set(probe)
+        failed = True
+
+        def _settle() -> float:
+            # Own wall time plus the stages charged to this agent
+            ledger  = _ledger.get()
+            charged = ledger.take(agent) if ledger is not None else None
+            if charged is not None:
+                probe.absorb(charged, charged.charged_ms)
+            return (time.perf_counter() - t0) * 1e3 + probe.charged_ms
+
+        def finish(result: Any) -> Any:
+            nonlocal failed
+            failed = False
+            duration_ms = _settle()
+            entry = result.get("agent_log_entry") if isinstance(result, dict) else None
+            if entry is not None:
+                entry.update({
+                    "duration_ms": round(duration_ms, 1),
+                    "db_calls":    sum(db.values()),
+                    "llm_tokens":  probe.llm_tokens,
+                    "cache":       dict(probe.cache),
+                })
+            _observe(agent, duration_ms, probe, failed=False)
+            return result
+
+        try:
+            yield finish
+        finally:
+            _probe.reset(token)
+            if failed:
+                _observe(agent, _settle(), probe, failed=True)
+
+
+@contextmanager
+def ledger() -> Iterator[None]:
+    """Scope for one orchestrator run: charged stages report to the agents inside it."""
+    token = _ledger.set(_Ledger())
+    try:
+        yield
+    finally:
+        _ledger.reset(token)
+
+
+@contextmanager
+def _charging(agent: str) -> Iterator[None]:
+    t0 = time.perf_counter()
+    with counting() as db:
+        probe = _Probe(db)
+        token = _probe.set(probe)
+        try:
+            yield
+        finally:
+            _probe.reset(token)
+            ledger = _ledger.get()
+            if ledger is not None:
+                ledger.add(agent, probe, (time.perf_counter() - t0) * 1e3)
+
+
+def charged(agent: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a sync DAG stage so its cost is added to `agent`'s log entry."""
+    @functools.wraps(fn)
+    def _stage(*args, **kwargs):
+        with _charging(agent):
+            return fn(*args, **kwargs)
+    return _stage
+
+
+def acharged(agent: str, fn: Callable[..., Awaitable]) -> Callable[..., Awaitable]:
+    """charged() for an async DAG stage (`fn` returns an awaitable)."""
+    async def _stage(*args, **kwargs):
+        with _charging(agent):
+            return await fn(*args, **kwargs)
+    return _stage
+
+
+def instrumented(agent: str) -> Callable[[Callable], Callable]:
+    """Decorate an agent's run / arun (sync or coroutine function)."""
+    def wrap(fn: Callable) -> Callable:
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def _async(*args, **kwargs):
+                if _probe.get() is not None:
+                    return await fn(*args, **kwargs)
+                with _measuring(agent) as finish:
+                    return finish(await fn(*args, **kwargs))
+            return _async
+
+        @functools.wraps(fn)
+        def _sync(*args, **kwargs):
+            if _probe.get() is not None:
+                return fn(*args, **kwargs)
+            with _measuring(agent) as finish:
+                return finish(fn(*args, **kwargs))
+        return _sync
+    return wrap
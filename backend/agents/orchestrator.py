@@ -10,7 +10,10 @@ Demo override table (deterministic, always returned for matched vehicles):
   bmw 3 series   → WAIT    (−5.6%, confidence 78, High)
 """
 from __future__ import annotations
+import os
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 _ROOT = Path(__file__).parent.parent.parent
@@ -20,6 +23,20 @@ from backend.agents import (
     data_agent, trend_agent, forecast_agent,
     risk_agent, decision_agent, explanation_agent, ethics_agent,
 )
+from backend.agents.context import DataContext
+from backend.agent import run_price_prediction
+from backend.agents.instrumentation import charged, ledger
+from backend.utils.dag import Stage, run_dag
+from scripts.model_utils import model_version
+
+# Threads for independent pipeline stages (Mongo reads, forecast, XGBoost,
+# LLM), shared by all requests in the process
+_DAG_WORKERS = int(os.environ.get("ORCHESTRATOR_WORKERS", "32"))
+_DAG_POOL    = ThreadPoolExecutor(max_workers=_DAG_WORKERS, thread_name_prefix="agent-dag")
+
+# Tagged on every cached prediction; bump when agent logic or the report
+# shape changes so entries from older pipelines are ignored on read
+PIPELINE_VERSION = "3"
 
 # ── Demo overrides ─────────────────────────────────────────────────────────────
 _DEMO_OVERRIDES: dict[str, dict] = {
@@ -126,6 +143,11 @@ def _normalise(make: str, model: str) -> str:
     return f"{make.strip().lower()} {model.strip().lower()}"
 
 
+def is_demo_vehicle(make: str, model: str) -> bool:
+    """Whether run_orchestrator answers this vehicle from the demo override table."""
+    return _normalise(make, model) in _DEMO_OVERRIDES
+
+
 def _build_demo_agent_log(make: str, model: str, year: int, ov: dict) -> list[dict]:
     """Build a realistic full agent_log for demo overrides."""
     chg        = float(ov["predicted_90_day_change"])
@@ -263,10 +285,87 @@ def run_orchestrator(
                 "run_llm_price_analysis": {"forecast_30d": round(curr_price * (1 + chg / 300), 2), "forecast_90d": proj_price, "trend_direction": "falling" if chg < 0 else "rising", "key_insight": ov["reasoning_summary"][1], "best_time_to_buy": "now" if ov["final_recommendation"] == "BUY NOW" else "wait" if ov["final_recommendation"] == "WAIT" else "30_days"},
                 "synthesize_recommendation": {"recommendation": ov["recommendation"], "confidence": ov["confidence"]},
             },
-            "shap_factors": [],
+            "shap_factors":  [],
+            "model_version": model_version(),
         }
 
     # ── Live pipeline ─────────────────────────────────────────────────────────
+    with DataContext(make, model, year) as ctx:
+        return _run_live(ctx, make, model, year, mileage, condition, region, vehicle_name)
+
+
+def _run_live(
+    ctx: DataContext,
+    make: str, model: str, year: int,
+    mileage: int, condition: str, region: str, vehicle_name: str,
+) -> dict:
+    """
+    The 7-agent pipeline as a dependency graph (backend/utils/dag.py); every
+    MongoDB read goes through the shared ctx.  Log entries keep the
+    sequential agent order regardless of completion order.
+    """
+    # ── Stage graph ───────────────────────────────────────────────────────────
+    # The two Mongo reads, the statistical forecast and the XGBoost
+    # prediction are independent; the LLM blend waits for all of them, and
+    # the explanation (LLM) overlaps with the ethics review.  The reads and
+    # the XGBoost call run outside their agents, so their cost is charged to
+    # DataAgent / ForecastAgent.
+    stages = [
+        Stage("history", charged("DataAgent", lambda r: ctx.price_history())),
+        Stage("market",  charged("DataAgent", lambda r: ctx.market_context())),
+        Stage("data",    lambda r: data_agent.run(make, model, year, ctx=ctx), ("history", "market")),
+        Stage("trend",   lambda r: trend_agent.run(make, model, year, r["history"], ctx=ctx), ("history",)),
+        Stage("price",   charged("ForecastAgent",
+                                 lambda r: run_price_prediction(make, model, year, mileage, condition, region))),
+        Stage("forecast", lambda r: forecast_agent.run(
+            make=make, model=model, year=year,
+            mileage=mileage, condition=condition, region=region,
+            forecast=r["trend"]["forecast"], market_context=r["market"],
+            xgb_result=r["price"],
+        ), ("trend", "market", "price")),
+        Stage("risk", lambda r: risk_agent.run(
+            predicted_price=r["forecast"]["predicted_price"], forecast_90d=r["forecast"]["forecast_90d"],
+            confidence_base=r["forecast"]["confidence_base"],
+            inventory_trend=r["market"].get("inventory_trend", "unknown"),
+            has_price_history=r["data"]["has_history"],
+        ), ("forecast", "data")),
+        Stage("decision", lambda r: decision_agent.run(
+            predicted_90_day_change=r["risk"]["predicted_90_day_change"],
+            confidence_score=r["forecast"]["confidence_base"], volatility_index=r["risk"]["volatility_index"],
+            price_vs_median_pct=float(r["market"].get("price_vs_median_pct", 0.0)),
+        ), ("risk",)),
+        Stage("explanation", lambda r: explanation_agent.run(
+            make=make, model=model, year=year, mileage=mileage,
+            condition=condition, region=region, predicted_price=r["forecast"]["predicted_price"],
+            predicted_90_day_change=r["risk"]["predicted_90_day_change"],
+            confidence_score=r["forecast"]["confidence_base"], volatility_index=r["risk"]["volatility_index"],
+            final_recommendation=r["decision"]["final_recommendation"],
+            decision_rationale=r["decision"]["decision_rationale"],
+            llm_key_insight=r["forecast"]["llm_analysis"].get("key_insight", ""),
+            trend_direction=r["trend"]["trend_data"]["direction"],
+            inventory_trend=r["market"].get("inventory_trend", "unknown"),
+        ), ("decision", "trend")),
+        Stage("ethics", lambda r: ethics_agent.run(
+            make=make, model=model, year=year, forecast_method=r["forecast"]["forecast_method"],
+            confidence_score=r["forecast"]["confidence_base"], volatility_index=r["risk"]["volatility_index"],
+            has_price_history=r["data"]["has_history"],
+            inventory_trend=r["market"].get("inventory_trend", "unknown"),
+        ), ("forecast", "risk", "data")),
+    ]
+    with ledger():
+        results, timings = run_dag(stages, _DAG_POOL)
+    return assemble_report(vehicle_name, make, model, year, results, ctx.queries, timings)
+
+
+def assemble_report(
+    vehicle_name: str, make: str, model: str, year: int,
+    results: dict, queries: Counter, timings: dict,
+) -> dict:
+    """
+    Agent log + response payload from the stage outputs (keys: data, trend,
+    forecast, risk, decision, explanation, ethics).  Shared by the threaded
+    and the async orchestrator so both return the same shape.
+    """
     agent_log: list[dict] = []
     agent_log.append({
         "agent": "OrchestratorAgent", "status": "ok",
@@ -274,25 +373,19 @@ def run_orchestrator(
         "output": {"make": make, "model": model, "year": year},
     })
 
-    data_out       = data_agent.run(make, model, year)
+    data_out       = results["data"]
     agent_log.append(data_out["agent_log_entry"])
     price_history  = data_out["price_history"]
     market_context = data_out["market_context"]
     has_history    = data_out["has_history"]
-    inventory_trend = market_context.get("inventory_trend", "unknown")
-    pct_vs_med      = float(market_context.get("price_vs_median_pct", 0.0))
 
-    trend_out = trend_agent.run(make, model, year, price_history)
+    trend_out = results["trend"]
     agent_log.append(trend_out["agent_log_entry"])
     forecast_raw  = trend_out["forecast"]
     trend_data    = trend_out["trend_data"]
     data_features = trend_out["data_features"]
 
-    fc_out = forecast_agent.run(
-        make=make, model=model, year=year,
-        mileage=mileage, condition=condition, region=region,
-        forecast=forecast_raw, market_context=market_context,
-    )
+    fc_out = results["forecast"]
     agent_log.append(fc_out["agent_log_entry"])
     predicted_price = fc_out["predicted_price"]
     forecast_30d    = fc_out["forecast_30d"]
@@ -300,54 +393,41 @@ def run_orchestrator(
     forecast_method = fc_out["forecast_method"]
     confidence_base = fc_out["confidence_base"]
     shap_factors    = fc_out["shap_factors"]
+    price_model_ver = fc_out["model_version"]
     llm_analysis    = fc_out["llm_analysis"]
     llm_key_insight = llm_analysis.get("key_insight", "")
 
-    risk_out = risk_agent.run(
-        predicted_price=predicted_price, forecast_90d=forecast_90d,
-        confidence_base=confidence_base, inventory_trend=inventory_trend,
-        has_price_history=has_history,
-    )
+    risk_out = results["risk"]
     agent_log.append(risk_out["agent_log_entry"])
     volatility_index        = risk_out["volatility_index"]
     risk_score              = risk_out["risk_score"]
     uncertainty_range       = risk_out["uncertainty_range"]
     predicted_90_day_change = risk_out["predicted_90_day_change"]
 
-    dec_out = decision_agent.run(
-        predicted_90_day_change=predicted_90_day_change,
-        confidence_score=confidence_base, volatility_index=volatility_index,
-        price_vs_median_pct=pct_vs_med,
-    )
+    dec_out = results["decision"]
     agent_log.append(dec_out["agent_log_entry"])
     final_recommendation = dec_out["final_recommendation"]
     decision_rationale   = dec_out["decision_rationale"]
     _rec_map             = {"BUY NOW": "BUY", "WAIT": "WAIT", "MONITOR": "NEUTRAL"}
     legacy_rec           = _rec_map.get(final_recommendation, "NEUTRAL")
 
-    exp_out = explanation_agent.run(
-        make=make, model=model, year=year, mileage=mileage,
-        condition=condition, region=region, predicted_price=predicted_price,
-        predicted_90_day_change=predicted_90_day_change,
-        confidence_score=confidence_base, volatility_index=volatility_index,
-        final_recommendation=final_recommendation, decision_rationale=decision_rationale,
-        llm_key_insight=llm_key_insight, trend_direction=trend_data["direction"],
-        inventory_trend=inventory_trend,
-    )
+    exp_out = results["explanation"]
     agent_log.append(exp_out["agent_log_entry"])
     reasoning_summary = exp_out["reasoning_summary"]
     explanation_text  = exp_out["explanation_text"]
 
-    eth_out = ethics_agent.run(
-        make=make, model=model, year=year, forecast_method=forecast_method,
-        confidence_score=confidence_base, volatility_index=volatility_index,
-        has_price_history=has_history, inventory_trend=inventory_trend,
-    )
+    eth_out = results["ethics"]
     agent_log.append(eth_out["agent_log_entry"])
     agent_log.append({
         "agent": "OrchestratorAgent", "status": "ok",
-        "message": f"Pipeline complete. Final recommendation: {final_recommendation}.",
-        "output": {"final_recommendation": final_recommendation, "confidence_score": confidence_base, "steps_completed": 7},
+        "message": f"Pipeline complete. Final recommendation: {final_recommendation}. "
+                   f"{sum(queries.values())} MongoDB queries. Critical path {timings['critical_path_ms']:,.0f} ms "
+                   f"({' → '.join(timings['critical_path'])}) vs {timings['serial_ms']:,.0f} ms serial.",
+        "output": {
+            "final_recommendation": final_recommendation, "confidence_score": confidence_base, "steps_completed": 7,
+            "db_queries": sum(queries.values()), "db_queries_by_command": dict(queries),
+            "stage_timings": timings,
+        },
     })
 
     legacy_conf = "HIGH" if confidence_base >= 75 else "MODERATE" if confidence_base >= 55 else "LOW"
@@ -381,9 +461,10 @@ def run_orchestrator(
             "get_price_history":         price_history,
             "run_forecast":              forecast_raw,
             "get_market_context":        market_context,
-            "run_price_prediction":      {"predicted_price": predicted_price, "shap_factors": shap_factors},
+            "run_price_prediction":      {"predicted_price": predicted_price, "shap_factors": shap_factors, "model_version": price_model_ver},
             "run_llm_price_analysis":    llm_analysis,
             "synthesize_recommendation": {"recommendation": legacy_rec, "confidence": legacy_conf, "rationale": decision_rationale, "predicted_price": predicted_price, "forecast_30d": forecast_30d, "forecast_90d": forecast_90d},
         },
-        "shap_factors": shap_factors,
+        "shap_factors":  shap_factors,
+        "model_version": price_model_ver,
     }
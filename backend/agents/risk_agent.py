@@ -1,9 +1,11 @@
 # backend/agents/risk_agent.py
 """RiskAssessmentAgent — pure Python volatility, risk, and uncertainty calculation."""
 from __future__ import annotations
+from backend.agents.instrumentation import instrumented
 from backend.utils.smoothing import bound
 
 
+@instrumented("RiskAssessmentAgent")
 def run(
     predicted_price: float,
     forecast_90d: float,
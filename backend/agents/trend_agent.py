@@ -6,17 +6,25 @@ from pathlib import Path
 
 _ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(_ROOT))
-from backend.agent import run_forecast
+from backend.agents.context import DataContext
+from backend.agents.instrumentation import instrumented
 from backend.utils.smoothing import moving_average, bound
 
 
-def run(make: str, model: str, year: int, price_history: list[dict]) -> dict:
+@instrumented("TrendAnalysisAgent")
+def run(
+    make: str, model: str, year: int, price_history: list[dict],
+    ctx: DataContext | None = None,
+) -> dict:
     """Run statistical forecast and derive trend metrics.
 
+    The forecast is fitted on `price_history`; with the orchestrator's
+    DataContext the stored-forecast lookup is memoized as well.
+
     Returns
     -------
     {
-        "forecast": {...},          # raw output from run_forecast
+        "forecast": {...},          # raw output from run_forecast (or the nightly batch)
         "trend_data": {
             "direction": str,
             "strength": str,
@@ -31,7 +39,21 @@ def run(make: str, model: str, year: int, price_history: list[dict]) -> dict:
         "agent_log_entry": {...},
     }
     """
-    forecast = run_forecast(make, model, year)
+    # Nightly batch (scripts/batch_forecast.py) first; fit live only on a miss
+    ctx = ctx or DataContext(make, model, year, price_history=price_history)
+    forecast = ctx.precomputed_forecast()
+    source   = "batch" if forecast is not None else "live"
+    if forecast is None:
+        forecast = ctx.forecast()
+    return derive(forecast, price_history, source)
+
+
+@instrumented("TrendAnalysisAgent")
+def derive(forecast: dict, price_history: list[dict], source: str) -> dict:
+    """Trend metrics and agent output for an already-obtained forecast.
+
+    source : "batch" (precomputed) or "live" — reported in the agent log.
+    """
 
     trend_pct   = float(forecast.get("trend_pct_change", 0.0))
     trend_90d   = float(forecast.get("trend_pct_90d", 0.0))
@@ -78,7 +100,7 @@ def run(make: str, model: str, year: int, price_history: list[dict]) -> dict:
     seasonal_factor = round(last_price / ma_90, 3) if ma_90 > 0 else 1.0
 
     msg = (
-        f"Forecast method: {method}. "
+        f"Forecast method: {method} ({source}). "
         f"Trend: {direction} ({trend_pct:+.1f}% / 30d). "
         f"Momentum score: {momentum_score}/100."
     )
@@ -101,12 +123,13 @@ def run(make: str, model: str, year: int, price_history: list[dict]) -> dict:
             "status":  "ok",
             "message": msg,
             "output": {
-                "direction":      direction,
-                "strength":       strength,
-                "momentum_score": momentum_score,
-                "method":         method,
-                "trend_pct_30d":  trend_pct,
-                "trend_pct_90d":  trend_90d,
+                "direction":       direction,
+                "strength":        strength,
+                "momentum_score":  momentum_score,
+                "method":          method,
+                "forecast_source": source,
+                "trend_pct_30d":   trend_pct,
+                "trend_pct_90d":   trend_90d,
             },
         },
     }
@@ -1,43 +1,242 @@
 """
 main.py — FastAPI backend for Car Price Intelligence
-Endpoints: /health  /api/cars  /api/predict  /api/market-overview
-           /api/shap-importance  /api/clear-cache  /api/seed-market
+Endpoints: /health  /ready  /api/cars  /api/predict  /api/market-overview
+           /api/shap-importance  /api/clear-cache  /api/seed-market  /api/metrics
+           /api/admin/reload-model  /api/admin/reload-snapshots
+
+Model warm-up: the XGBoost artefacts are loaded and exercised once in a
+startup hook, with timings reported by /health.  Set MODEL_PRELOAD=1 to do
+it at import time instead, so a pre-forking server shares the loaded pages
+copy-on-write across workers:
+    gunicorn backend.main:app -k uvicorn.workers.UvicornWorker -w 4 --preload
+(uvicorn --workers spawns fresh interpreters, so each worker warms itself.)
+
+Admin endpoints (/api/admin/*) require an X-Admin-Token header matching
+ADMIN_TOKEN, and are disabled when ADMIN_TOKEN is unset.
+
+Model hot reload: POST /api/admin/reload-model, or MODEL_WATCH_SECONDS=<n>
+to poll models/ for new artefacts.  Every cached prediction is tagged with
+the model and pipeline version that produced it; entries from other
+versions are ignored on read (never wiped at startup).  A swap is published
+to model_state and every worker follows it within MODEL_SYNC_SECONDS;
+old-version predictions are purged once all live workers (api_workers
+heartbeats) report the new version.  /ready returns 503 until the startup warm-up tasks
+have finished.
+
+Snapshot store: SNAPSHOT_STORE=1 loads price_snapshots into memory at
+startup so price histories are served without a MongoDB round trip.
+Refresh with POST /api/admin/reload-snapshots or SNAPSHOT_REFRESH_SECONDS=<n>.
+
+Orchestrator: ORCHESTRATOR_MODE=async runs /api/predict natively on the
+event loop (Motor reads, AsyncOpenAI, CPU stages on a bounded pool sized by
+ORCHESTRATOR_CPU_WORKERS); the default "thread" mode runs the threaded
+pipeline in a worker thread.
+
+Metrics: every agent log entry carries duration_ms / db_calls / llm_tokens /
+cache; GET /api/metrics returns their per-agent histograms since startup.
+
+Single flight: concurrent /api/predict misses for the same cache key share
+one orchestrator run.  PREDICT_LOCK=1 extends this across workers with a
+lock document per key in predict_locks (TTL: PREDICT_LOCK_TTL seconds).
+
+Response cache: serialized /api/predict bodies are kept in an in-process
+LRU (RESPONSE_CACHE_SIZE entries, RESPONSE_CACHE_TTL seconds) in front of
+predictions_cache, so hot vehicles are served without a MongoDB read.
+/api/clear-cache and model swaps empty it (in the worker handling them;
+other workers' copies age out after the TTL).
+
+Cache keys: backend/utils/cache_key.py normalises each request (case,
+whitespace, mileage rounded to PREDICT_MILEAGE_BUCKET) and prefixes the
+hash with the schema and model version.
+
+Stale-while-revalidate: a prediction younger than PREDICT_SOFT_TTL is
+fresh; up to PREDICT_HARD_TTL it is still served at once while a refresh
+runs in the background (single flight), and only older entries make the
+request wait for the pipeline.  Responses carry computed_at, age_seconds
+and stale, plus an HTTP Age header.
+
+Market overview: a background task recomputes the overview every
+MARKET_OVERVIEW_REFRESH_SECONDS and shortly after predictions are written,
+keeps the serialized result in memory and stores it as a single document
+(market_overview, _id "current") so a restarted worker serves it at once.
+/api/market-overview answers from memory with an ETag (304 on
+If-None-Match) and Cache-Control: max-age=MARKET_OVERVIEW_MAX_AGE.
 """
-import os, sys, asyncio, hashlib, json
+import os, sys, asyncio, gc, hashlib, hmac, json, socket, time
+from collections import Counter
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
 import joblib, numpy as np
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, Header, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReplaceOne, UpdateOne
+from pymongo.errors import DuplicateKeyError
 from dotenv import load_dotenv
 
 _ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(_ROOT))
-from backend.agents.orchestrator import run_orchestrator
+from backend.agents.orchestrator import PIPELINE_VERSION, run_orchestrator
+from backend.agents.async_orchestrator import run_orchestrator_async
+from backend.agents.instrumentation import metrics as agent_metrics
+from backend.agent import forecast_cache_stats, refresh_snapshot_store, watch_snapshot_store
+from backend.utils.cache import LRUCache
+from backend.utils.cache_key import cache_key, canonical_request
+from backend.utils.snapshot_store import store as snapshot_store
 from backend.utils.validation import validate_predict_params
 from backend.car_catalog import CATALOG as _CAR_CATALOG
+from scripts.model_utils import warm_up, registry, model_version
 
 load_dotenv(_ROOT / ".env")
 
 app = FastAPI(title="Car Price Intelligence API")
 
+# ── Readiness ──────────────────────────────────────────────────────────────────
+# Startup tasks that must finish before /ready reports 200.
+_READY: dict[str, bool] = {"model": False, "snapshot_store": False, "seeds": False}
+_startup_tasks: list[asyncio.Task] = []
+
+# ── Model warm-up ──────────────────────────────────────────────────────────────
+_WARMUP: dict | None = None
+if os.environ.get("MODEL_PRELOAD", "") == "1":
+    _WARMUP = {**warm_up(), "preloaded": True}
+    gc.freeze()   # keep the loaded model out of GC passes → pages stay shared after fork
+
+
+@app.on_event("startup")
+async def _warm_up_model():
+    """Load the price model and run a dummy prediction + explanation."""
+    global _WARMUP
+    if _WARMUP is None:
+        _WARMUP = {**await asyncio.to_thread(warm_up), "preloaded": False}
+    print(f"[startup] Model warm-up: {_WARMUP}")
+    _READY["model"] = True
+
+    loop = asyncio.get_running_loop()
+    registry.on_swap(
+        lambda prev, new: asyncio.run_coroutine_threadsafe(_on_model_swap(new), loop)
+    )
+    await _db["api_workers"].create_index("seen_at", expireAfterSeconds=3600, name="ttl_seen_at")
+    await _heartbeat()
+    _startup_tasks.append(asyncio.ensure_future(_model_sync_loop()))
+    watch_secs = float(os.environ.get("MODEL_WATCH_SECONDS", "0") or 0)
+    if watch_secs > 0:
+        registry.watch(watch_secs)
+        print(f"[startup] Watching models/ every {watch_secs:g}s for new artefacts")
+
+
+@app.on_event("startup")
+async def _load_snapshot_store():
+    """Load price_snapshots into the in-memory columnar store (SNAPSHOT_STORE=1)."""
+    if os.environ.get("SNAPSHOT_STORE", "") != "1":
+        _READY["snapshot_store"] = True
+        return
+    stats = await asyncio.to_thread(refresh_snapshot_store)
+    print(f"[startup] Snapshot store loaded: {stats}")
+    _READY["snapshot_store"] = True
+    refresh_secs = float(os.environ.get("SNAPSHOT_REFRESH_SECONDS", "0") or 0)
+    if refresh_secs > 0:
+        watch_snapshot_store(refresh_secs)
+        print(f"[startup] Refreshing snapshot store every {refresh_secs:g}s")
+
+
+# ── Model version across workers ───────────────────────────────────────────────
+# A reload only swaps the worker that ran it.  That worker publishes the new
+# version to model_state; every worker heartbeats its own version into
+# api_workers and reloads from disk when the published one differs.
+_MODEL_SYNC_SECONDS = float(os.environ.get("MODEL_SYNC_SECONDS", "15"))
+_purge_pending: str | None = None     # version whose purge waits for other workers
+_sync_failed:   tuple | None = None   # model_state this worker failed to load
+
+
+async def _heartbeat() -> None:
+    await _db["api_workers"].replace_one(
+        {"_id": _WORKER_ID},
+        {"model_version": model_version(), "seen_at": datetime.now(timezone.utc)},
+        upsert=True,
+    )
+
+
+async def _on_model_swap(new: str) -> None:
+    await _db["model_state"].replace_one(
+        {"_id": "active"},
+        {"version": new, "published_at": datetime.now(timezone.utc), "by": _WORKER_ID},
+        upsert=True,
+    )
+    await _purge_model_versions(new)
+
+
+async def _model_sync_loop() -> None:
+    """
+    Follow the published model version; retry a deferred purge.  A published
+    state this worker could not load (different models/ on disk, canary
+    rejection) is not retried until model_state changes.
+    """
+    global _sync_failed
+    while True:
+        await asyncio.sleep(_MODEL_SYNC_SECONDS)
+        try:
+            await _heartbeat()
+            state = await _db["model_state"].find_one({"_id": "active"})
+            published = (state["version"], state.get("published_at")) if state else None
+            if state and state["version"] != model_version():
+                if published == _sync_failed:
+                    continue
+                result = await asyncio.to_thread(registry.reload)
+                print(f"[model_registry] Following published model {state['version']}: {result}")
+                if model_version() != state["version"]:
+                    _sync_failed = published
+                    print(f"[model_registry] Could not load {state['version']}; "
+                          "not retrying until model_state changes")
+            elif _purge_pending == model_version():
+                await _purge_model_versions(_purge_pending)
+        except Exception as exc:
+            print(f"[model_registry] Version sync failed: {exc}")
+
+
+async def _purge_model_versions(current: str) -> None:
+    """
+    Drop cached predictions made by any model version other than `current`,
+    once every live worker serves `current` (deferred to the sync loop
+    until then, so lagging workers' entries are not deleted under them).
+    """
+    global _purge_pending
+    _response_cache.clear()
+    _overview_dirty.set()
+    await _heartbeat()
+    live_since = datetime.now(timezone.utc) - timedelta(seconds=3 * _MODEL_SYNC_SECONDS)
+    lagging = await _db["api_workers"].count_documents(
+        {"seen_at": {"$gte": live_since}, "model_version": {"$ne": current}}
+    )
+    if lagging:
+        _purge_pending = current
+        print(f"[model_registry] Active model {current}; purge deferred, {lagging} worker(s) on an older model")
+        return
+    _purge_pending = None
+    r = await _db["predictions_cache"].delete_many(
+        {"is_seed": {"$ne": True}, "model_version": {"$ne": current}}
+    )
+    print(f"[model_registry] Active model {current}; purged {r.deleted_count} cached predictions")
+
 
 @app.on_event("startup")
-async def _clean_stale_cache():
+async def _refresh_seeds():
     """
-    On every server restart:
-      1. Wipe ALL non-seed prediction cache entries so stale results
-         (wrong signals, bad forecasts, old logic) never linger.
-      2. Force-refresh all seed BUY opportunities so Tab-2 always has data.
-    This is intentional for the demo environment — analyses are fast enough
-    that re-running them on demand is preferable to serving stale results.
+    Force-refresh the seed BUY opportunities in the background so Tab-2
+    always has data.  Cached predictions are kept: entries from another
+    model or pipeline version are skipped on read (_usable) and recomputed
+    on demand, so a restart does not cold-start the cache.
     """
-    r = await _db["predictions_cache"].delete_many({"is_seed": {"$ne": True}})
-    print(f"[startup] Cleared {r.deleted_count} stale prediction cache entries")
-    seeded = await _seed_market_data(force=True)
-    print(f"[startup] Refreshed {seeded} seed BUY entries")
+    async def _run() -> None:
+        try:
+            seeded = await _seed_market_data(force=True)
+            print(f"[startup] Refreshed {seeded} seed BUY entries")
+        except Exception as exc:
+            print(f"[startup] Seed refresh failed: {exc}")
+        _READY["seeds"] = True
+
+    _startup_tasks.append(asyncio.ensure_future(_run()))
 
 
 _CORS_ORIGINS = ["http://localhost:5173"]
@@ -53,6 +252,13 @@ app.add_middleware(
 )
 
 _db   = AsyncIOMotorClient(os.environ["MONGO_URI"])["carmarket"]
+_ORCHESTRATOR_MODE = os.environ.get("ORCHESTRATOR_MODE", "thread")   # "thread" | "async"
+_SOFT_TTL = float(os.environ.get("PREDICT_SOFT_TTL", "3600"))    # fresh
+_HARD_TTL = float(os.environ.get("PREDICT_HARD_TTL", "86400"))   # servable while revalidating
+_response_cache = LRUCache(   # cache_key → (computed_at epoch, serialized body)
+    maxsize = int(os.environ.get("RESPONSE_CACHE_SIZE", "512")),
+    ttl     = float(os.environ.get("RESPONSE_CACHE_TTL", "300")),   # ≤ predictions_cache expiry
+)
 _shap = joblib.load(_ROOT / "models" / "shap_data.pkl") if (_ROOT / "models" / "shap_data.pkl").exists() else None
 
 # ── Fallback seasonality (US used-car market industry averages) ─────────────
@@ -181,12 +387,57 @@ def _safe(doc: dict) -> dict:
     doc.pop("_id", None); doc.pop("expires_at", None); doc.pop("cache_key", None)
     return json.loads(json.dumps(doc, default=str))
 
+def _serialize(doc: dict) -> bytes:
+    """_safe(doc) encoded once as a JSON response body."""
+    body = {k: v for k, v in doc.items() if k not in ("_id", "expires_at", "cache_key")}
+    return json.dumps(body, default=str, ensure_ascii=False, separators=(",", ":")).encode()
+
+def _json(computed_at: float, body: bytes) -> Response:
+    """Serialized prediction + per-request freshness (spliced in, not re-encoded)."""
+    age  = max(0, int(time.time() - computed_at))
+    tail = f',"age_seconds":{age},"stale":{"true" if age > _SOFT_TTL else "false"}}}'.encode()
+    return Response(content=body[:-1] + tail, media_type="application/json", headers={"Age": str(age)})
+
+def _computed_at(doc: dict) -> float:
+    """Epoch seconds the prediction was computed (0.0 for entries predating computed_at)."""
+    ts = doc.get("computed_at")
+    if not isinstance(ts, datetime):
+        return 0.0
+    return (ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)).timestamp()
+
 
 # ── Health ─────────────────────────────────────────────────────────────────────
 @app.get("/health")
 async def health():
     await _db.command("ping")
-    return {"status": "ok", "db": "connected"}
+    return {
+        "status":       "ok",
+        "db":           "connected",
+        "model_warmup": _WARMUP or "pending",
+        "model":        {"version": model_version(), "last_reload": registry.last_reload},
+        "forecast_cache": forecast_cache_stats(),
+        "snapshot_store": snapshot_store.stats(),
+    }
+
+
+@app.get("/ready")
+async def ready():
+    """Readiness probe: 200 once every startup warm-up task has finished, else 503."""
+    pending = [name for name, done in _READY.items() if not done]
+    if pending:
+        raise HTTPException(status_code=503, detail={"ready": False, "pending": pending})
+    return {"ready": True, "model_version": model_version(), "pipeline_version": PIPELINE_VERSION}
+
+
+@app.get("/api/metrics")
+async def metrics():
+    """Per-agent latency / MongoDB / LLM-token histograms, cache hits and coalesced requests."""
+    return {
+        "agents":         agent_metrics(),
+        "forecast_cache": forecast_cache_stats(),
+        "response_cache": _response_cache.stats(),
+        "predict":        {**_PREDICT_STATS, "inflight": len(_inflight), "cross_worker_lock": _PREDICT_LOCK},
+    }
 
 
 # ── Cars catalogue ─────────────────────────────────────────────────────────────
@@ -221,42 +472,184 @@ async def predict(
     if errors:
         raise HTTPException(status_code=422, detail="; ".join(errors))
 
-    key = hashlib.md5(f"{make}{model}{year}{mileage}{condition}{region}".encode()).hexdigest()
-    cached = await _db["predictions_cache"].find_one({"cache_key": key})
+    # Normalised (case, whitespace, mileage bucket) — the pipeline runs on these values
+    request = canonical_request(make, model, year, mileage, condition, region)
+    key     = cache_key(request, model_version())
+    compute = lambda: _compute_prediction(key, **request)
+
+    entry = _response_cache.get(key)
+    if entry is not None and time.time() - entry[0] >= _HARD_TTL:
+        _response_cache.pop(key)               # past servable age — refetch / recompute
+        entry = None
+    if entry is None:
+        cached = await _db["predictions_cache"].find_one({"cache_key": key})
+        if _usable(cached) and time.time() - _computed_at(cached) < _HARD_TTL:
+            entry = _remember(key, cached)
+
+    if entry is not None:
+        if time.time() - entry[0] > _SOFT_TTL:
+            _revalidate(key, compute)
+        return _json(*entry)
+
+    try:
+        entry = await asyncio.shield(_flight(key, compute))
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=str(exc))
+    return _json(*entry)
+
+
+def _remember(key: str, doc: dict) -> tuple[float, bytes]:
+    """Serialize a predictions_cache document into the in-process response cache."""
+    entry = (_computed_at(doc), _serialize(doc))
+    _response_cache.set(key, entry)
+    return entry
+
+
+def _usable(cached: dict | None) -> bool:
+    """Whether a predictions_cache document can be served as-is."""
+    if not cached:
+        return False
     # Reject cache if forecast errored
     _forecast_errored = bool(
-        (cached or {}).get("tool_outputs", {}).get("run_forecast", {}).get("error")
+        cached.get("tool_outputs", {}).get("run_forecast", {}).get("error")
     )
     # Accept cache if it has a final_recommendation (new schema) or legacy recommendation
     _has_result = bool(
-        (cached or {}).get("final_recommendation") or
-        (cached or {}).get("recommendation") in ("BUY", "WAIT", "NEUTRAL")
+        cached.get("final_recommendation") or
+        cached.get("recommendation") in ("BUY", "WAIT", "NEUTRAL")
+    )
+    # Reject cache produced by a different price model or pipeline version
+    _stale_version = (
+        cached.get("model_version") != model_version() or
+        cached.get("pipeline_version") != PIPELINE_VERSION
     )
-    if cached and _has_result and not _forecast_errored:
-        return _safe(cached)
+    return _has_result and not _forecast_errored and not _stale_version
 
+
+def _current_versions() -> dict:
+    """Query filter matching predictions from the active model and pipeline."""
+    return {"model_version": model_version(), "pipeline_version": PIPELINE_VERSION}
+
+
+# ── Single flight ──────────────────────────────────────────────────────────────
+# The first miss for a cache key (leader) starts the orchestrator run; misses
+# arriving before it finishes (followers) await the same future.  The run is
+# shielded, so a disconnecting client does not cancel it for the others.
+_inflight: dict[str, asyncio.Future] = {}
+_PREDICT_STATS = Counter()   # leaders, coalesced, lock_waits, lock_wait_hits, stale_served, revalidations
+
+_PREDICT_LOCK      = os.environ.get("PREDICT_LOCK", "") == "1"
+_PREDICT_LOCK_TTL  = float(os.environ.get("PREDICT_LOCK_TTL", "120"))
+_LOCK_POLL_SECONDS = 0.5
+_WORKER_ID         = f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _flight(key: str, factory) -> asyncio.Future:
+    """The in-flight run for `key`, started from `factory()` if there is none."""
+    fut = _inflight.get(key)
+    if fut is None:
+        _PREDICT_STATS["leaders"] += 1
+        fut = asyncio.ensure_future(factory())
+        _inflight[key] = fut
+        fut.add_done_callback(lambda _: _inflight.pop(key, None))
+    else:
+        _PREDICT_STATS["coalesced"] += 1
+    return fut
+
+
+def _revalidate(key: str, factory) -> None:
+    """Refresh a stale entry in the background (joins a run already in flight)."""
+    _PREDICT_STATS["stale_served"] += 1
+    if key in _inflight:
+        return
+    _PREDICT_STATS["revalidations"] += 1
+
+    def _report(fut: asyncio.Future) -> None:
+        if not fut.cancelled() and fut.exception() is not None:
+            print(f"[predict] Background refresh failed for {key}: {fut.exception()}")
+
+    _flight(key, factory).add_done_callback(_report)
+
+
+async def _acquire_lock(key: str) -> bool:
+    """Insert-if-absent predict_locks doc; an expired lock is taken over."""
+    now = datetime.now(timezone.utc)
     try:
-        result = await asyncio.to_thread(
-            run_orchestrator, make, model, year, mileage, condition, region
+        await _db["predict_locks"].update_one(
+            {"_id": key, "expires_at": {"$lt": now}},
+            {"$set": {"owner": _WORKER_ID, "expires_at": now + timedelta(seconds=_PREDICT_LOCK_TTL)}},
+            upsert=True,
         )
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=str(exc))
+        return True
+    except DuplicateKeyError:            # live lock held by another worker
+        return False
+
+
+async def _await_peer(key: str) -> dict | None:
+    """Poll predictions_cache while another worker holds the lock for `key`."""
+    _PREDICT_STATS["lock_waits"] += 1
+    deadline = asyncio.get_running_loop().time() + _PREDICT_LOCK_TTL
+    while asyncio.get_running_loop().time() < deadline:
+        await asyncio.sleep(_LOCK_POLL_SECONDS)
+        cached = await _db["predictions_cache"].find_one({"cache_key": key})
+        if _usable(cached) and time.time() - _computed_at(cached) < _SOFT_TTL:
+            _PREDICT_STATS["lock_wait_hits"] += 1
+            return cached
+        if await _db["predict_locks"].find_one({"_id": key}, {"_id": 1}) is None:
+            return None                  # released without a usable result
+    return None
 
-    doc = {
-        **result,
-        # ── include vehicle identity so market page can display make/model/year ──
-        "make":       make.lower(),
-        "model":      model.lower(),
-        "year":       year,
-        "mileage":    mileage,
-        "condition":  condition,
-        "region":     region,
-        "cache_key":  key,
-        "expires_at": datetime.now(timezone.utc) + timedelta(hours=1),
-    }
-    # Upsert so stale/error cache entries are replaced
-    await _db["predictions_cache"].replace_one({"cache_key": key}, doc, upsert=True)
-    return _safe(doc)
+
+@app.on_event("startup")
+async def _ensure_lock_index():
+    """TTL index so locks left by a crashed worker are removed (PREDICT_LOCK=1)."""
+    if _PREDICT_LOCK:
+        await _db["predict_locks"].create_index("expires_at", expireAfterSeconds=0, name="ttl_expires_at")
+
+
+async def _compute_prediction(
+    key: str, make: str, model: str, year: int,
+    mileage: int, condition: str, region: str,
+) -> tuple[float, bytes]:
+    """Run the orchestrator on a canonical request, write predictions_cache and the response cache."""
+    locked = False
+    if _PREDICT_LOCK:
+        locked = await _acquire_lock(key)
+        if not locked:
+            doc = await _await_peer(key)
+            if doc is not None:
+                return _remember(key, doc)
+            locked = await _acquire_lock(key)   # peer gave up; best effort
+    try:
+        if _ORCHESTRATOR_MODE == "async":
+            result = await run_orchestrator_async(_db, make, model, year, mileage, condition, region)
+        else:
+            result = await asyncio.to_thread(
+                run_orchestrator, make, model, year, mileage, condition, region
+            )
+
+        now = datetime.now(timezone.utc)
+        doc = {
+            **result,
+            # ── include vehicle identity so market page can display make/model/year ──
+            "make":             make,
+            "model":            model,
+            "year":             year,
+            "mileage":          mileage,
+            "condition":        condition,
+            "region":           region,
+            "cache_key":        key,
+            "pipeline_version": PIPELINE_VERSION,
+            "computed_at":      now,
+            "expires_at":       now + timedelta(seconds=_HARD_TTL),   # TTL index deletes at this time
+        }
+        # Upsert so stale/error cache entries are replaced
+        await _db["predictions_cache"].replace_one({"cache_key": key}, doc, upsert=True)
+        _overview_dirty.set()
+        return _remember(key, doc)
+    finally:
+        if locked:
+            await _db["predict_locks"].delete_one({"_id": key, "owner": _WORKER_ID})
 
 
 # ── Industry baseline constants (derived from cleaned_cars.csv, 328k listings) ─
@@ -264,31 +657,37 @@ _INDUSTRY_AVG_PRICE = 18_500.0   # US median used-car price
 _INDUSTRY_MOM_PCT   =     0.3    # ~3.6 % annual appreciation
 
 # ── Seed market data (helper + endpoint) ───────────────────────────────────────
+_seeds_verified = False   # seeds known to be present in this process
+
+
 async def _seed_market_data(force: bool = False) -> int:
     """
     Upsert pre-computed BUY opportunities for popular vehicles into
-    predictions_cache. Uses replace_one(upsert=True) so seeds are always
-    refreshed when force=True or when the "Refresh Seeds" button is pressed.
+    predictions_cache in one bulk_write.  force=True (startup, "Refresh
+    Seeds" button) replaces every seed; otherwise only missing seeds are
+    inserted ($setOnInsert), leaving existing ones untouched.
     Returns the number of documents upserted/inserted.
     """
-    upserted = 0
+    global _seeds_verified
+    expires_at = datetime.now(timezone.utc) + timedelta(days=90)
+    ops = []
     for seed in _SEED_BUYS:
         seed_key = f"seed_{seed['make']}_{seed['model']}_{seed['year']}"
-        if not force:
-            existing = await _db["predictions_cache"].find_one({"cache_key": seed_key})
-            if existing:
-                continue
         doc = {
             **seed,
             "is_seed":      True,
             "cache_key":    seed_key,
             "tool_outputs": {},   # no tool trace for seeds
-            "expires_at":   datetime.now(timezone.utc) + timedelta(days=90),
+            "expires_at":   expires_at,
         }
-        res = await _db["predictions_cache"].replace_one({"cache_key": seed_key}, doc, upsert=True)
-        if res.upserted_id or res.modified_count:
-            upserted += 1
-    return upserted
+        if force:
+            ops.append(ReplaceOne({"cache_key": seed_key}, doc, upsert=True))
+        else:
+            ops.append(UpdateOne({"cache_key": seed_key}, {"$setOnInsert": doc}, upsert=True))
+    res = await _db["predictions_cache"].bulk_write(ops, ordered=False)
+    _seeds_verified = True
+    _overview_dirty.set()
+    return res.upserted_count + res.modified_count
 
 
 @app.post("/api/seed-market")
@@ -304,12 +703,93 @@ async def seed_market():
 
 
 # ── Market overview ────────────────────────────────────────────────────────────
+_OVERVIEW_VERSION  = 1   # bump when the overview payload changes shape
+_OVERVIEW_REFRESH  = float(os.environ.get("MARKET_OVERVIEW_REFRESH_SECONDS", "300"))
+_OVERVIEW_MAX_AGE  = int(os.environ.get("MARKET_OVERVIEW_MAX_AGE", "60"))
+_OVERVIEW_DEBOUNCE = 5.0   # seconds to coalesce bursts of prediction writes
+
+_overview: dict | None = None        # {"etag", "body", "computed_at"}
+_overview_dirty = asyncio.Event()    # set when predictions_cache changes
+
+
 @app.get("/api/market-overview")
-async def market_overview():
-    # ── Always ensure seed data exists ───────────────────────────────────────
-    seed_count = await _db["predictions_cache"].count_documents({"is_seed": True, "recommendation": "BUY"})
-    if seed_count < len(_SEED_BUYS):
-        await _seed_market_data(force=False)   # fills any missing seeds
+async def market_overview(request: Request):
+    """Serve the precomputed overview snapshot (computed now if there is none yet)."""
+    snap = _overview or await _refresh_market_overview()
+    headers = {"ETag": snap["etag"], "Cache-Control": f"public, max-age={_OVERVIEW_MAX_AGE}"}
+    if _etag_matches(request.headers.get("if-none-match"), snap["etag"]):
+        return Response(status_code=304, headers=headers)
+    return Response(content=snap["body"], media_type="application/json", headers=headers)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match check (RFC 9110): a comma-separated list or "*", compared weakly."""
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag == "*" or tag.removeprefix("W/") == opaque
+        for tag in (t.strip() for t in if_none_match.split(","))
+    )
+
+
+async def _refresh_market_overview() -> dict:
+    """Recompute the overview, swap it into memory and persist it."""
+    global _overview
+    payload = await _compute_market_overview()
+    body    = json.dumps(payload, default=str, ensure_ascii=False, separators=(",", ":")).encode()
+    snap    = {
+        "etag":        f'"{hashlib.blake2b(body, digest_size=12).hexdigest()}"',
+        "body":        body,
+        "computed_at": datetime.now(timezone.utc),
+    }
+    _overview = snap
+    await _db["market_overview"].replace_one(
+        {"_id": "current"},
+        {**snap, "version": _OVERVIEW_VERSION, "model_version": model_version(),
+         "pipeline_version": PIPELINE_VERSION},
+        upsert=True,
+    )
+    return snap
+
+
+@app.on_event("startup")
+async def _start_market_overview():
+    """Serve the stored snapshot right away, then keep it fresh in the background."""
+    global _overview
+    stored = await _db["market_overview"].find_one({"_id": "current"})
+    if stored and (stored.get("version"), stored.get("model_version"), stored.get("pipeline_version")) == (
+        _OVERVIEW_VERSION, model_version(), PIPELINE_VERSION
+    ):
+        _overview = {k: stored[k] for k in ("etag", "body", "computed_at")}
+        print(f"[startup] Market overview loaded (computed {stored['computed_at']})")
+    _startup_tasks.append(asyncio.ensure_future(_market_overview_loop()))
+
+
+async def _market_overview_loop() -> None:
+    """Refresh on schedule, or after predictions are written (debounced)."""
+    while True:
+        try:
+            await _refresh_market_overview()
+        except Exception as exc:       # keep serving the previous snapshot
+            print(f"[market_overview] refresh failed: {exc}")
+        _overview_dirty.clear()
+        try:
+            await asyncio.wait_for(_overview_dirty.wait(), timeout=_OVERVIEW_REFRESH)
+            await asyncio.sleep(_OVERVIEW_DEBOUNCE)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def _compute_market_overview() -> dict:
+    global _seeds_verified
+    # ── Ensure seed data exists (checked once per process) ───────────────────
+    if not _seeds_verified:
+        seed_count = await _db["predictions_cache"].count_documents({"is_seed": True, "recommendation": "BUY"})
+        if seed_count < len(_SEED_BUYS):
+            await _seed_market_data(force=False)   # fills any missing seeds
+        else:
+            _seeds_verified = True
 
     # ── Avg price: seed avg as stable baseline; real predictions update it live ─
     # We deliberately ignore price_snapshots (2021 Craigslist data → corrupt).
@@ -320,7 +800,7 @@ async def market_overview():
     seed_avg = round(seed_agg[0]["avg"], 2) if seed_agg else _INDUSTRY_AVG_PRICE
 
     real_agg = await _db["predictions_cache"].aggregate([
-        {"$match": {"is_seed": {"$ne": True}, "predicted_price": {"$gt": 0}}},
+        {"$match": {"is_seed": {"$ne": True}, "predicted_price": {"$gt": 0}, **_current_versions()}},
         {"$group": {"_id": None, "avg": {"$avg": "$predicted_price"}, "count": {"$sum": 1}}},
     ]).to_list(1)
 
@@ -337,7 +817,7 @@ async def market_overview():
 
     # ── Top BUY opportunities (seeds + real predictions, sorted by price) ────
     top_buys = await _db["predictions_cache"].find(
-        {"recommendation": "BUY"},
+        {"recommendation": "BUY", "$or": [{"is_seed": True}, _current_versions()]},
         {"_id": 0, "cache_key": 0, "expires_at": 0, "tool_outputs": 0},
     ).sort("predicted_price", 1).limit(10).to_list(10)
 
@@ -359,8 +839,40 @@ async def market_overview():
 # ── Clear predictions cache ────────────────────────────────────────────────────
 @app.delete("/api/clear-cache")
 async def clear_cache():
+    global _seeds_verified
     result = await _db["predictions_cache"].delete_many({})
-    return {"deleted": result.deleted_count, "message": "Predictions cache cleared"}
+    evicted = _response_cache.clear()
+    _seeds_verified = False   # seeds were deleted too; re-check on next overview
+    _overview_dirty.set()
+    return {"deleted": result.deleted_count, "evicted": evicted, "message": "Predictions cache cleared"}
+
+
+# ── Admin ──────────────────────────────────────────────────────────────────────
+_ADMIN_TOKEN = os.environ.get("ADMIN_TOKEN", "")
+
+
+def _require_admin(x_admin_token: str | None = Header(None)) -> None:
+    """Dependency of the /api/admin endpoints: X-Admin-Token must match ADMIN_TOKEN."""
+    if not _ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled (ADMIN_TOKEN unset)")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token.encode(), _ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=401, detail="Invalid or missing X-Admin-Token")
+
+
+# ── Model hot reload ───────────────────────────────────────────────────────────
+@app.post("/api/admin/reload-model", dependencies=[Depends(_require_admin)])
+async def reload_model(force: bool = False):
+    """Load, canary-check and atomically swap in the artefacts now in models/."""
+    result = await asyncio.to_thread(registry.reload, force)
+    if result["status"] in ("error", "rejected"):
+        raise HTTPException(status_code=409, detail=result)
+    return result
+
+
+@app.post("/api/admin/reload-snapshots", dependencies=[Depends(_require_admin)])
+async def reload_snapshots():
+    """Reload price_snapshots into the in-memory store (loads it if it was off)."""
+    return await asyncio.to_thread(refresh_snapshot_store)
 
 
 # ── SHAP global importance ─────────────────────────────────────────────────────
@@ -0,0 +1,111 @@
+# backend/utils/cache.py
+"""Bounded in-process caches shared by the agent pipeline and the API."""
+from __future__ import annotations
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class LRUCache:
+    """Thread-safe LRU cache with an optional per-entry TTL and hit/miss counters.
+
+    maxsize : entries kept before the least-recently-used one is evicted.
+    ttl     : seconds an entry stays valid (None → never expires).
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None):
+        self.maxsize   = maxsize
+        self.ttl       = ttl
+        self.hits      = 0
+        self.misses    = 0
+        self.evictions = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None and self.ttl is not None and time.monotonic() - item[0] > self.ttl:
+                del self._data[key]
+                self.evictions += 1
+                item = None
+            if item is None:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable) -> Any:
+        with self._lock:
+            item = self._data.pop(key, None)
+            return item[1] if item else None
+
+    def clear(self) -> int:
+        with self._lock:
+            n = len(self._data)
+            self._data.clear()
+            return n
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size":      len(self._data),
+            "maxsize":   self.maxsize,
+            "hits":      self.hits,
+            "misses":    self.misses,
+            "evictions": self.evictions,
+            "hit_rate":  round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+class TTLMemo:
+    """Named values, each recomputed after `ttl` seconds.
+
+    Unlike LRUCache, a None result is remembered too, so a miss (e.g. an
+    empty collection) isn't re-queried on every call.  `get` takes a sync
+    loader and `aget` an async one; both share the same entries.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl   = ttl
+        self._data: dict[Hashable, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _lookup(self, name: Hashable) -> tuple[bool, Any]:
+        with self._lock:
+            item = self._data.get(name)
+        if item is None or time.monotonic() - item[0] > self.ttl:
+            return False, None
+        return True, item[1]
+
+    def _store(self, name: Hashable, value: Any) -> Any:
+        with self._lock:
+            self._data[name] = (time.monotonic(), value)
+        return value
+
+    def get(self, name: Hashable, load: Callable[[], Any]) -> Any:
+        found, value = self._lookup(name)
+        return value if found else self._store(name, load())
+
+    async def aget(self, name: Hashable, load: Callable[[], Awaitable[Any]]) -> Any:
+        found, value = self._lookup(name)
+        return value if found else self._store(name, await load())
+
+    def clear(self) -> int:
+        with self._lock:
+            n = len(self._data)
+            self._data.clear()
+            return n
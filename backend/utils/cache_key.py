@@ -0,0 +1,60 @@
+# backend/utils/cache_key.py
+"""Canonical /api/predict request and its predictions_cache key.
+
+Requests are normalised before hashing, so that equivalent queries share
+one cache entry:
+  * make / model / condition / region: lower-case, whitespace collapsed
+  * mileage: rounded to the nearest PREDICT_MILEAGE_BUCKET miles (default
+    5,000; 1 keeps exact mileage), and the pipeline runs on that value, so
+    the cached analysis matches every request in the bucket
+
+The key is "<schema>:<model version>:<digest>".  The digest is taken over
+a JSON encoding of the fields, which is unambiguous ("f-1501", 2019 can't
+collide with "f-150", 12019).  It uses xxh3_128 when xxhash is installed
+and blake2b otherwise.
+"""
+from __future__ import annotations
+import json
+import os
+
+try:
+    import xxhash
+    def _digest(data: bytes) -> str:
+        return xxhash.xxh3_128_hexdigest(data)
+except ImportError:                      # optional dep — stdlib fallback
+    from hashlib import blake2b
+    def _digest(data: bytes) -> str:
+        return blake2b(data, digest_size=16).hexdigest()
+
+SCHEMA_VERSION = "p2"     # bump when the cached response shape changes
+MILEAGE_BUCKET = max(1, int(os.environ.get("PREDICT_MILEAGE_BUCKET", "5000")))
+
+
+def _norm(text: str) -> str:
+    return " ".join(str(text).split()).lower()
+
+
+def bucket_mileage(mileage: int) -> int:
+    """Round to the nearest MILEAGE_BUCKET miles."""
+    return int(round(int(mileage) / MILEAGE_BUCKET)) * MILEAGE_BUCKET
+
+
+def canonical_request(
+    make: str, model: str, year: int,
+    mileage: int, condition: str, region: str,
+) -> dict:
+    """Normalised request fields — the pipeline's inputs and the cache key's."""
+    return {
+        "make":      _norm(make),
+        "model":     _norm(model),
+        "year":      int(year),
+        "mileage":   bucket_mileage(mileage),
+        "condition": _norm(condition),
+        "region":    _norm(region),
+    }
+
+
+def cache_key(request: dict, model_version: str) -> str:
+    """predictions_cache key of a canonical request under `model_version`."""
+    payload = json.dumps(request, sort_keys=True, separators=(",", ":")).encode()
+    return f"{SCHEMA_VERSION}:{model_version}:{_digest(payload)}"
@@ -0,0 +1,153 @@
+# backend/utils/dag.py
+"""Minimal dependency-graph runner for the agent pipeline.
+
+run_dag runs each stage on the caller's long-lived executor (one pool per
+process, not per request) as soon as the stages it depends on have
+finished, inside a copy of the caller's contextvars (so per-request state
+such as the Mongo query counter follows it); run_dag_async does the same
+with coroutine stages as asyncio tasks.  Start / end offsets of every
+stage are recorded and the critical path — the dependency chain that
+determined the total latency — is reported.
+"""
+from __future__ import annotations
+import asyncio
+import contextvars
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from typing import Any, Callable
+
+
+class Stage:
+    """One node: `fn(results)` runs after every stage named in `deps`."""
+
+    def __init__(self, name: str, fn: Callable[[dict[str, Any]], Any], deps: tuple[str, ...] = ()):
+        self.name, self.fn, self.deps = name, fn, tuple(deps)
+
+
+def run_dag(stages: list[Stage], pool: Executor) -> tuple[dict[str, Any], dict]:
+    """
+    Execute `stages` concurrently on `pool`, respecting dependencies.
+
+    A stage must not itself wait on work submitted to `pool`, or a full
+    pool can deadlock.
+
+    Returns
+    -------
+    (results, timings)
+      results : {stage name: return value}
+      timings : {
+          "stages":           {name: {"start_ms", "end_ms", "duration_ms"}},
+          "critical_path":    [stage names, first → last],
+          "critical_path_ms": float,   # wall-clock latency of the whole graph
+          "serial_ms":        float,   # sum of stage durations (sequential cost)
+      }
+
+    The first stage to raise cancels the remaining ones and re-raises.
+    """
+    by_name = {s.name: s for s in stages}
+    for s in stages:
+        missing = [d for d in s.deps if d not in by_name]
+        if missing:
+            raise ValueError(f"stage {s.name!r} depends on unknown {missing}")
+
+    results: dict[str, Any]        = {}
+    spans:   dict[str, list[float]] = {}
+    pending = dict(by_name)
+    running: dict[Future, str]     = {}
+    t0      = time.perf_counter()
+
+    def _timed(stage: Stage) -> Any:
+        spans[stage.name] = [time.perf_counter() - t0, 0.0]
+        try:
+            return stage.fn(results)
+        finally:
+            spans[stage.name][1] = time.perf_counter() - t0
+
+    while pending or running:
+        ready = [s for s in pending.values() if all(d in results for d in s.deps)]
+        for stage in ready:
+            del pending[stage.name]
+            ctx = contextvars.copy_context()
+            running[pool.submit(ctx.run, _timed, stage)] = stage.name
+        if not running:
+            raise ValueError(f"dependency cycle among {sorted(pending)}")
+
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for fut in done:
+            name = running.pop(fut)
+            exc  = fut.exception()
+            if exc is not None:
+                for other in running:
+                    other.cancel()
+                raise exc
+            results[name] = fut.result()
+
+    return results, _timings(by_name, spans)
+
+
+async def run_dag_async(stages: list[Stage]) -> tuple[dict[str, Any], dict]:
+    """
+    run_dag for stages whose `fn(results)` returns an awaitable.
+
+    Every stage becomes a task that awaits its dependencies' tasks; returns
+    the same (results, timings) pair.  A failing stage cancels the rest.
+    """
+    by_name = {s.name: s for s in stages}
+    results: dict[str, Any]        = {}
+    spans:   dict[str, list[float]] = {}
+    tasks:   dict[str, asyncio.Task] = {}
+    t0      = time.perf_counter()
+
+    async def _run(stage: Stage) -> None:
+        if stage.deps:
+            await asyncio.gather(*(tasks[d] for d in stage.deps))
+        spans[stage.name] = [time.perf_counter() - t0, 0.0]
+        try:
+            results[stage.name] = await stage.fn(results)
+        finally:
+            spans[stage.name][1] = time.perf_counter() - t0
+
+    def _task(name: str, seen: tuple = ()) -> asyncio.Task:
+        if name in seen:
+            raise ValueError(f"dependency cycle through {name!r}")
+        if name not in tasks:
+            stage = by_name.get(name)
+            if stage is None:
+                raise ValueError(f"unknown stage {name!r}")
+            for dep in stage.deps:
+                _task(dep, seen + (name,))
+            tasks[name] = asyncio.ensure_future(_run(stage))
+        return tasks[name]
+
+    for name in by_name:
+        _task(name)
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        raise
+
+    return results, _timings(by_name, spans)
+
+
+def _timings(by_name: dict[str, Stage], spans: dict[str, list[float]]) -> dict:
+    # Walk back from the last stage to finish, each time through the
+    # dependency that finished last — that chain bounded the total latency.
+    path: list[str] = []
+    node = max(spans, key=lambda n: spans[n][1]) if spans else None
+    while node is not None:
+        path.append(node)
+        deps = by_name[node].deps
+        node = max(deps, key=lambda n: spans[n][1]) if deps else None
+
+    ms = lambda sec: round(sec * 1e3, 1)
+    return {
+        "stages": {
+            name: {"start_ms": ms(start), "end_ms": ms(end), "duration_ms": ms(end - start)}
+            for name, (start, end) in sorted(spans.items(), key=lambda kv: kv[1][0])
+        },
+        "critical_path":    path[::-1],
+        "critical_path_ms": ms(max((end for _, end in spans.values()), default=0.0)),
+        "serial_ms":        ms(sum(end - start for start, end in spans.values())),
+    }
@@ -0,0 +1,104 @@
+# backend/utils/forecast_cache.py
+"""Forecast cache keyed by a fingerprint of the price-history series.
+
+price_snapshots only changes at ingest time, so a forecast fitted on a given
+history stays valid until that history changes.  Tiers:
+  1. in-process LRU (always on)
+  2. Mongo ``forecast_cache`` collection (optional, shared across workers)
+"""
+from __future__ import annotations
+import hashlib
+from datetime import datetime, timezone
+
+from backend.utils.cache import LRUCache
+from backend.utils.query_counter import record
+
+
+def history_fingerprint(price_history: list[dict], namespace: str = "") -> str:
+    """Stable hash of the (date, avg_price) series a forecast is fitted on.
+
+    namespace : forecaster name/params, so changing the model invalidates keys.
+    """
+    h = hashlib.sha1(namespace.encode())
+    for point in price_history:
+        h.update(f"|{point.get('date')}:{point.get('avg_price')!r}".encode())
+    return h.hexdigest()
+
+
+# forecasts collection (scripts/batch_forecast.py) → batch_forecast()
+BATCH_FIELDS = {"_id": 0, "fingerprint": 1, "forecast": 1}
+
+
+def batch_forecast(doc: dict | None, fingerprint: str) -> dict | None:
+    """The forecast of a `forecasts` document, if it was fitted on `fingerprint`."""
+    return doc["forecast"] if doc and doc.get("fingerprint") == fingerprint else None
+
+
+class ForecastCache:
+    """
+    Two-tier cache of forecast dicts keyed by history fingerprint.
+
+    collection : name of the Mongo tier, or None for the LRU only.  Callers
+                 pass their database handle — pymongo to get / set, Motor to
+                 aget / aset — so both share one LRU and one document shape.
+    """
+
+    def __init__(self, maxsize: int = 2048, collection: str | None = None):
+        self._lru        = LRUCache(maxsize)
+        self._collection = collection
+        self.mongo_hits  = 0
+
+    # ── Shared by the sync and async tiers ────────────────────────────────────
+    def _local(self, fingerprint: str) -> tuple[dict | None, bool]:
+        """(LRU forecast, whether the Mongo tier should be read)."""
+        forecast = self._lru.get(fingerprint)
+        return forecast, forecast is None and self._collection is not None
+
+    def _found(self, fingerprint: str, doc: dict | None) -> dict | None:
+        if not doc:
+            return None
+        self._lru.set(fingerprint, doc["forecast"])
+        self.mongo_hits += 1
+        return doc["forecast"]
+
+    @staticmethod
+    def _doc(forecast: dict) -> dict:
+        return {"forecast": forecast, "created_at": datetime.now(timezone.utc)}
+
+    # ── pymongo ───────────────────────────────────────────────────────────────
+    def get(self, fingerprint: str, db) -> dict | None:
+        forecast, remote = self._local(fingerprint)
+        if remote:
+            doc      = db[self._collection].find_one({"_id": fingerprint}, {"_id": 0, "forecast": 1})
+            forecast = self._found(fingerprint, doc)
+        return dict(forecast) if forecast is not None else None
+
+    def set(self, fingerprint: str, forecast: dict, db) -> None:
+        self._lru.set(fingerprint, dict(forecast))
+        if self._collection is not None:
+            db[self._collection].replace_one({"_id": fingerprint}, self._doc(forecast), upsert=True)
+
+    # ── Motor (commands bypass the listener, so they are counted here) ───────
+    async def aget(self, fingerprint: str, db) -> dict | None:
+        forecast, remote = self._local(fingerprint)
+        if remote:
+            record(f"{self._collection}.find")
+            doc      = await db[self._collection].find_one({"_id": fingerprint}, {"_id": 0, "forecast": 1})
+            forecast = self._found(fingerprint, doc)
+        return dict(forecast) if forecast is not None else None
+
+    async def aset(self, fingerprint: str, forecast: dict, db) -> None:
+        self._lru.set(fingerprint, dict(forecast))
+        if self._collection is not None:
+            record(f"{self._collection}.update")
+            await db[self._collection].replace_one({"_id": fingerprint}, self._doc(forecast), upsert=True)
+
+    def clear(self) -> int:
+        return self._lru.clear()
+
+    def stats(self) -> dict:
+        return {
+            **self._lru.stats(),
+            "mongo_tier": self._collection is not None,
+            "mongo_hits": self.mongo_hits,
+        }
@@ -0,0 +1,348 @@
+# backend/utils/forecasting.py
+"""Side-effect-free price forecasting shared by the API and the batch job.
+
+Nothing here touches MongoDB or OpenAI, so the functions can be imported by
+worker processes (scripts/batch_forecast.py) without credentials.
+
+Forecasters (selected with the FORECASTER env var, default "prophet"):
+  prophet  — Facebook Prophet, yearly seasonality, fitted per series
+  holt     — NumPy damped-trend exponential smoothing on log prices with a
+             monthly seasonal index; vectorised over many series at once
+
+Both return the same dict shape and share the 0-point / 1–2-month fallbacks.
+"""
+from __future__ import annotations
+import calendar
+import math
+import os
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+
+# price_snapshots projection read by history_from_snapshots (sort on year_month)
+SNAPSHOT_FIELDS = {"_id": 0, "year_month": 1, "avg_price": 1, "median_price": 1, "listing_count": 1}
+
+
+def history_from_snapshots(docs) -> list[dict]:
+    """price_snapshots documents (sorted by year_month) → price-history points."""
+    return [
+        {
+            "date":          doc["year_month"],
+            "avg_price":     round(doc.get("avg_price", 0), 2),
+            "median_price":  round(doc.get("median_price", 0), 2),
+            "listing_count": doc.get("listing_count", 0),
+        }
+        for doc in docs
+    ]
+
+
+def _points(price_history: list[dict]) -> tuple[list[datetime], list[float]]:
+    """Usable (month, avg_price) pairs — points with a bad date or a missing,
+    non-finite or non-positive price are dropped."""
+    dates, prices = [], []
+    for point in price_history:
+        try:
+            ds = datetime.strptime(str(point.get("date")), "%Y-%m")
+            y  = float(point.get("avg_price"))
+        except (TypeError, ValueError):
+            continue
+        if math.isfinite(y) and y > 0:
+            dates.append(ds)
+            prices.append(y)
+    return dates, prices
+
+
+def _linear(prices: list[float]) -> dict:
+    """Linear fallback for sparse data (1–2 months)."""
+    last_price  = prices[-1]
+    first_price = prices[0]
+    n_months    = max(1, len(prices) - 1)
+    mom_rate    = (last_price - first_price) / first_price / n_months  # per-month rate
+
+    fc_30 = round(last_price * (1 + mom_rate), 2)
+    fc_90 = round(last_price * (1 + mom_rate * 3), 2)
+    pct_30 = round(mom_rate * 100, 2)
+
+    return {
+        "last_known_price":  round(last_price, 2),
+        "forecast_30d":      fc_30,
+        "forecast_90d":      fc_90,
+        "trend_direction":   "rising" if pct_30 > 0 else "falling",
+        "trend_pct_change":  pct_30,
+        "trend_pct_90d":     round(mom_rate * 3 * 100, 2),
+        "seasonality_note":  "Linear extrapolation (only 2 months of data — Prophet needs ≥ 3)",
+        "method":            "linear",
+    }
+
+
+def market_trend_forecast(recent: list[dict]) -> dict:
+    """
+    Fallback for a vehicle without history: a forecast from the market-wide
+    monthly average price (`recent`: latest months first, see
+    market_context.latest_months_pipeline).  US used-car industry averages
+    when there are no months at all.
+    """
+    # Industry default when DB has no global data
+    if len(recent) == 0:
+        last_price = 18500.0   # US median used car price
+        mom_rate   = 0.003     # ~3.6% annual appreciation
+        return {
+            "last_known_price": last_price,
+            "forecast_30d":     round(last_price * (1 + mom_rate), 2),
+            "forecast_90d":     round(last_price * (1 + mom_rate * 3), 2),
+            "trend_direction":  "rising",
+            "trend_pct_change": round(mom_rate * 100, 2),
+            "trend_pct_90d":    round(mom_rate * 3 * 100, 2),
+            "seasonality_note": "Industry default estimate (no market data in DB yet)",
+            "method":           "industry_default",
+        }
+
+    last_price = float(recent[0]["avg_price"])
+
+    if len(recent) < 2:
+        mom_rate = 0.003
+    else:
+        prev_price = float(recent[1]["avg_price"])
+        mom_rate   = (last_price - prev_price) / prev_price if prev_price else 0.003
+
+    fc_30  = round(last_price * (1 + mom_rate), 2)
+    fc_90  = round(last_price * (1 + mom_rate * 3), 2)
+    pct_30 = round(mom_rate * 100, 2)
+
+    return {
+        "last_known_price": round(last_price, 2),
+        "forecast_30d":     fc_30,
+        "forecast_90d":     fc_90,
+        "trend_direction":  "rising" if pct_30 > 0 else "falling",
+        "trend_pct_change": pct_30,
+        "trend_pct_90d":    round(mom_rate * 3 * 100, 2),
+        "seasonality_note": "Market-wide trend estimate (no model-specific price history in DB)",
+        "method":           "market_avg",
+    }
+
+
+def _result(last_price: float, fc_30: float, fc_90: float, peak_month: str, method: str) -> dict:
+    pct_30 = round((fc_30 - last_price) / last_price * 100, 2)
+    pct_90 = round((fc_90 - last_price) / last_price * 100, 2)
+    return {
+        "last_known_price":   round(last_price, 2),
+        "forecast_30d":       fc_30,
+        "forecast_90d":       fc_90,
+        "trend_direction":    "rising" if pct_30 > 0 else "falling",
+        "trend_pct_change":   pct_30,
+        "trend_pct_90d":      pct_90,
+        "seasonality_note":   f"Prices expected to peak around {peak_month} in the forecast window",
+        "method":             method,
+    }
+
+
+# ── Forecaster interface ──────────────────────────────────────────────────────
+class Forecaster(ABC):
+    """
+    Base class: subclasses implement _fit for series with ≥ 3 usable months.
+
+    name    : value reported as forecast["method"]
+    version : bump when parameters change — part of the cache fingerprint
+    """
+
+    name    = ""
+    version = 1
+
+    @property
+    def tag(self) -> str:
+        return f"{self.name}-v{self.version}"
+
+    def forecast(self, price_history: list[dict]) -> dict | None:
+        """
+        Forecast dict for one history, or None when no point has a usable
+        date and price (the caller falls back to the market-wide trend).
+        """
+        dates, prices = _points(price_history)
+        if not prices:
+            return None
+        if len(prices) < 3:
+            return _linear(prices)
+        return self._fit(dates, prices)
+
+    def forecast_many(self, histories: list[list[dict]]) -> list[dict | None]:
+        return [self.forecast(h) for h in histories]
+
+    @abstractmethod
+    def _fit(self, dates: list[datetime], prices: list[float]) -> dict:
+        ...
+
+
+class ProphetForecaster(Forecaster):
+    name = "prophet"
+
+    def forecast(self, price_history: list[dict]) -> dict | None:
+        try:
+            import prophet  # noqa: F401 — lazy import, heavy dep
+        except ImportError:
+            return {"error": "prophet not installed. Run: pip install prophet"}
+        return super().forecast(price_history)
+
+    def _fit(self, dates: list[datetime], prices: list[float]) -> dict:
+        from prophet import Prophet
+
+        df = pd.DataFrame({"ds": dates, "y": prices})
+        m = Prophet(
+            yearly_seasonality=True,
+            weekly_seasonality=False,
+            daily_seasonality=False,
+            changepoint_prior_scale=0.3,
+        )
+        m.fit(df)
+
+        future   = m.make_future_dataframe(periods=90, freq="D")
+        forecast = m.predict(future)
+
+        last_price = float(df["y"].iloc[-1])
+        last_date  = df["ds"].max()
+
+        def _price_at(days: int) -> float:
+            target = last_date + timedelta(days=days)
+            idx    = (forecast["ds"] - target).abs().idxmin()
+            return round(float(forecast.loc[idx, "yhat"]), 2)
+
+        # Seasonality note: find the month with the highest yhat in the next 90 days
+        future_fc  = forecast[forecast["ds"] > last_date]
+        peak_month = future_fc.loc[future_fc["yhat"].idxmax(), "ds"].strftime("%B")
+
+        return _result(last_price, _price_at(30), _price_at(90), peak_month, self.name)
+
+
+class HoltForecaster(Forecaster):
+    """
+    Damped-trend exponential smoothing (Gardner–McKenzie) on log prices,
+    after removing a monthly seasonal index.
+
+    The index is estimated from each series' month-over-month log changes,
+    shrunk toward zero by `shrink` pseudo-observations per calendar month,
+    so short series are effectively non-seasonal.  Forecasts are monthly:
+    30d = 1 step ahead, 90d = 3 steps ahead.
+    """
+
+    name = "holt"
+
+    def __init__(self, alpha: float = 0.5, beta: float = 0.2, phi: float = 0.9, shrink: float = 6.0):
+        self.alpha, self.beta, self.phi, self.shrink = alpha, beta, phi, shrink
+
+    def forecast_batch(self, Y: np.ndarray, M: np.ndarray) -> np.ndarray:
+        """
+        Vectorised forecast of n series.
+
+        Y : (n, T) prices, right-aligned (last observation in column T-1),
+            NaN-padded on the left for shorter series; ≥ 2 points per row.
+        M : (n, T) calendar month (0–11) of each observation.
+
+        Returns
+        -------
+        (n, 3) array of 1-, 2- and 3-month-ahead price forecasts.
+        """
+        n, T  = Y.shape
+        valid = ~np.isnan(Y)
+        Z     = np.log(np.where(valid, Y, 1.0))
+        M     = np.where(valid, M, 0).astype(np.intp)
+        rows  = np.arange(n)
+
+        # ── Monthly seasonal index from demeaned log changes ─────────────────
+        step  = valid[:, 1:] & valid[:, :-1]
+        D     = np.where(step, Z[:, 1:] - Z[:, :-1], 0.0)
+        n_d   = step.sum(axis=1)
+        D     = np.where(step, D - (D.sum(axis=1) / np.maximum(n_d, 1))[:, None], 0.0)
+        sums  = np.zeros((n, 12))
+        cnts  = np.zeros((n, 12))
+        r_idx = np.broadcast_to(rows[:, None], D.shape)
+        np.add.at(sums, (r_idx[step], M[:, 1:][step]), D[step])
+        np.add.at(cnts, (r_idx[step], M[:, 1:][step]), 1.0)
+        drift  = sums / (cnts + self.shrink)
+        drift -= drift.mean(axis=1, keepdims=True)
+        season  = np.cumsum(drift, axis=1)
+        season -= season.mean(axis=1, keepdims=True)
+
+        Zs = Z - season[rows[:, None], M]
+
+        # ── Damped-trend recursion, column by column ─────────────────────────
+        level = np.full(n, np.nan)
+        trend = np.zeros(n)
+        seen  = np.zeros(n, dtype=int)
+        a, b, phi = self.alpha, self.beta, self.phi
+        for t in range(T):
+            z   = Zs[:, t]
+            obs = valid[:, t]
+            first  = obs & (seen == 0)
+            second = obs & (seen == 1)
+            later  = obs & (seen >= 2)
+
+            level[first]  = z[first]
+            trend[second] = z[second] - level[second]
+            level[second] = z[second]
+
+            prev          = level[later] + phi * trend[later]
+            new_level     = a * z[later] + (1 - a) * prev
+            trend[later]  = b * (new_level - level[later]) + (1 - b) * phi * trend[later]
+            level[later]  = new_level
+            seen += obs
+
+        h       = np.arange(1, 4)
+        damp    = np.cumsum(phi ** h)                                 # Σ φ^i, i=1..h
+        month_h = (M[:, -1][:, None] + h) % 12
+        path    = level[:, None] + trend[:, None] * damp + season[rows[:, None], month_h]
+        return np.exp(path)
+
+    def forecast_many(self, histories: list[list[dict]]) -> list[dict | None]:
+        out    = [None] * len(histories)
+        index  = []
+        series = []
+        for i, history in enumerate(histories):
+            dates, prices = _points(history)
+            if len(prices) >= 3:
+                index.append(i)
+                series.append((dates, prices))
+            elif prices:
+                out[i] = _linear(prices)
+        for i, result in zip(index, self._fit_many(series)):
+            out[i] = result
+        return out
+
+    def _fit(self, dates: list[datetime], prices: list[float]) -> dict:
+        return self._fit_many([(dates, prices)])[0]
+
+    def _fit_many(self, series: list[tuple[list[datetime], list[float]]]) -> list[dict]:
+        """Result dicts for (dates, prices) series of ≥ 3 points, in one batch."""
+        if not series:
+            return []
+        T = max(len(p) for _, p in series)
+        Y = np.full((len(series), T), np.nan)
+        M = np.zeros((len(series), T), dtype=np.intp)
+        for r, (dates, prices) in enumerate(series):
+            Y[r, T - len(prices):] = prices
+            M[r, T - len(dates):]  = [d.month - 1 for d in dates]
+
+        path    = self.forecast_batch(Y, M)
+        results = []
+        for r, (dates, prices) in enumerate(series):
+            peak = (dates[-1].month + int(np.argmax(path[r]))) % 12 + 1
+            results.append(_result(
+                prices[-1],
+                round(float(path[r, 0]), 2),
+                round(float(path[r, 2]), 2),
+                calendar.month_name[peak],
+                self.name,
+            ))
+        return results
+
+
+FORECASTERS = {"prophet": ProphetForecaster, "holt": HoltForecaster}
+
+
+def get_forecaster(name: str | None = None) -> Forecaster:
+    """Forecaster by name (default: FORECASTER env var, then "prophet")."""
+    name = (name or os.environ.get("FORECASTER", "prophet")).lower()
+    if name not in FORECASTERS:
+        raise ValueError(f"FORECASTER must be one of {tuple(FORECASTERS)}, got {name!r}")
+    return FORECASTERS[name]()
@@ -0,0 +1,166 @@
+# backend/utils/market_context.py
+"""Market-context summaries shared by ingest (materialized) and the API (live fallback).
+
+scripts/mongo_ingest.py writes one document per (make, model, year) into
+the `market_context` collection plus a global fallback document, and a
+market-wide `market_monthly` rollup; the API reads them through indexes
+and only recomputes from price_snapshots / listings when they have not
+been built yet.
+
+The query specs and result shaping below are shared by the sync (pymongo)
+and async (Motor) readers in backend/agent.py, which only do the I/O.
+Ingest-wide reads are memoized in `global_memo` for GLOBALS_TTL_SECONDS.
+"""
+from __future__ import annotations
+import os
+
+from backend.utils.cache import TTLMemo
+
+# Industry-average constants derived from cleaned_cars.csv (328k listings)
+INDUSTRY_AVG = 19_384.0
+INDUSTRY_MIN =  7_995.0
+INDUSTRY_MAX = 45_000.0
+
+GLOBAL_ID = "global"     # _id of the fallback document for unknown vehicles
+
+# Projection returning a stored document as the get_market_context payload
+CONTEXT_FIELDS = {
+    "_id": 0, "current_inventory_count": 1, "inventory_trend": 1,
+    "price_vs_median_pct": 1, "regional_price_range": 1,
+}
+GLOBAL_FILTER  = {"_id": GLOBAL_ID}
+MONTHLY_FIELDS = {"_id": 0, "year_month": 1, "avg_price": 1}   # market_monthly → months
+
+# Global document, price range and market-wide months change only at ingest;
+# misses are memoized too, and entries expire so a re-ingest is picked up
+global_memo = TTLMemo(float(os.environ.get("GLOBALS_TTL_SECONDS", "300")))
+
+
+def vehicle_filter(make: str, model: str, year: int) -> dict:
+    """Query on the (make, model, year) key of price_snapshots / listings / market_context."""
+    return {"make": make.lower(), "model": model.lower(), "year": year}
+
+
+def summarize(
+    recent: list[dict],
+    stats: dict | None,
+    inventory_count: int,
+    fallback_range: tuple[float, float] | None = None,
+) -> dict:
+    """
+    Build the get_market_context payload.
+
+    recent          : ≤ 2 snapshot docs {listing_count, avg_price}, latest first
+    stats           : {overall_avg, min_price, max_price} over the vehicle's
+                      snapshots, or None when it has none
+    inventory_count : current listings for the vehicle
+    fallback_range  : global (min, max) used when stats is None; industry
+                      averages when that is missing too
+    """
+    # Inventory trend: compare snapshot listing_count across most recent 2 periods
+    inventory_trend = "unknown"
+    price_vs_median_pct = 0.0
+    if len(recent) == 2:
+        curr_cnt  = recent[0].get("listing_count", 0)
+        prev_cnt  = recent[1].get("listing_count", 1)
+        inventory_trend = "rising" if curr_cnt >= prev_cnt else "falling"
+
+    if stats:
+        overall_avg = stats["overall_avg"] or 0
+        min_price   = round(stats["min_price"], 2)
+        max_price   = round(stats["max_price"], 2)
+        # latest avg vs overall avg → negative means currently below market
+        latest_avg  = recent[0].get("avg_price", overall_avg) if recent else overall_avg
+        price_vs_median_pct = round((latest_avg - overall_avg) / overall_avg * 100, 2) if overall_avg else 0.0
+    else:
+        # No make-specific data — market-wide range, or pure industry fallback.
+        # price_vs_median_pct stays 0.0 — synthesize_recommendation will derive
+        # a proxy from XGBoost predicted price vs INDUSTRY_AVG
+        min_price, max_price = fallback_range or (INDUSTRY_MIN, INDUSTRY_MAX)
+
+    return {
+        "current_inventory_count": inventory_count,
+        "inventory_trend":         inventory_trend,
+        "price_vs_median_pct":     price_vs_median_pct,   # negative = below market (good deal)
+        "regional_price_range":    {"min": min_price, "max": max_price},
+    }
+
+
+def price_range_pipeline() -> list[dict]:
+    """price_snapshots → one document with the market-wide min / max avg_price."""
+    return [{"$group": {"_id": None, "mn": {"$min": "$avg_price"}, "mx": {"$max": "$avg_price"}}}]
+
+
+def price_range(docs: list[dict]) -> tuple[float, float] | None:
+    """(min, max) from price_range_pipeline's output, None for an empty DB."""
+    return (round(docs[0]["mn"], 2), round(docs[0]["mx"], 2)) if docs else None
+
+
+def context_inputs(docs: list[dict]) -> tuple[list[dict], dict | None, int]:
+    """(recent, stats, inventory_count) for summarize() from market_context_pipeline's output."""
+    doc = docs[0] if docs else {}
+    return (
+        doc.get("recent", []),
+        doc["stats"][0] if doc.get("stats") else None,
+        doc["inventory"][0]["n"] if doc.get("inventory") else 0,
+    )
+
+
+def market_context_pipeline(filter_: dict) -> list[dict]:
+    """
+    price_snapshots → one document with the inputs of summarize() for one
+    vehicle: its last two periods ("recent"), overall stats ("stats") and,
+    through an uncorrelated $lookup on listings, its live listing count
+    ("inventory").
+    """
+    return [
+        {"$match": filter_},
+        {"$facet": {
+            "recent": [
+                {"$sort": {"year_month": -1}},
+                {"$limit": 2},
+                {"$project": {"_id": 0, "listing_count": 1, "avg_price": 1}},
+            ],
+            "stats": [
+                {"$group": {
+                    "_id": None,
+                    "overall_avg": {"$avg": "$avg_price"},
+                    "min_price":   {"$min": "$avg_price"},
+                    "max_price":   {"$max": "$avg_price"},
+                }},
+            ],
+        }},
+        {"$lookup": {
+            "from":     "listings",
+            "pipeline": [{"$match": filter_}, {"$count": "n"}],
+            "as":       "inventory",
+        }},
+    ]
+
+
+def market_monthly_pipeline() -> list[dict]:
+    """
+    price_snapshots → one document per year_month with the market-wide
+    average listing price (snapshot averages weighted by listing_count).
+    """
+    return [
+        {"$match": {"listing_count": {"$gt": 0}, "avg_price": {"$gt": 0}}},
+        {"$group": {
+            "_id":           "$year_month",
+            "price_total":   {"$sum": {"$multiply": ["$avg_price", "$listing_count"]}},
+            "listing_count": {"$sum": "$listing_count"},
+            "vehicle_count": {"$sum": 1},
+        }},
+        {"$project": {
+            "_id":           0,
+            "year_month":    "$_id",
+            "avg_price":     {"$round": [{"$divide": ["$price_total", "$listing_count"]}, 2]},
+            "listing_count": 1,
+            "vehicle_count": 1,
+        }},
+    ]
+
+
+def latest_months_pipeline(n: int) -> list[dict]:
+    """market_monthly_pipeline's latest n months, newest first (un-materialized DB)."""
+    return market_monthly_pipeline() + [{"$sort": {"year_month": -1}}, {"$limit": n}]
@@ -0,0 +1,55 @@
+# backend/utils/query_counter.py
+"""Count MongoDB commands issued by the current request.
+
+agent.py registers `listener` on its MongoClient; `counting()` scopes a
+Counter to the calling context (a ContextVar, so it follows the request
+through asyncio.to_thread and copied thread contexts).  Scopes nest: a
+command counts toward every enclosing block, e.g. both the request and the
+agent that issued it.  Clients without the listener (Motor) call record().
+"""
+from __future__ import annotations
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from pymongo import monitoring
+
+# Connection / session housekeeping — not data reads.
+_IGNORED = {"hello", "ismaster", "isMaster", "ping", "endSessions", "saslStart", "saslContinue", "buildinfo"}
+
+_current: ContextVar[tuple[Counter, ...]] = ContextVar("mongo_query_counters", default=())
+
+
+def record(label: str) -> None:
+    """Count one `collection.command` against every open counting() block."""
+    for counter in _current.get():
+        counter[label] += 1
+
+
+class _QueryListener(monitoring.CommandListener):
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if not _current.get() or event.command_name in _IGNORED:
+            return
+        collection = event.command.get(event.command_name)
+        record(f"{collection}.{event.command_name}" if isinstance(collection, str) else event.command_name)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        pass
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        pass
+
+
+listener = _QueryListener()
+
+
+@contextmanager
+def counting() -> Iterator[Counter]:
+    """Collect `{"collection.command": n}` for commands started inside the block."""
+    counter = Counter()
+    token   = _current.set(_current.get() + (counter,))
+    try:
+        yield counter
+    finally:
+        _current.reset(token)
@@ -0,0 +1,164 @@
+# backend/utils/snapshot_store.py
+"""In-memory columnar copy of the price_snapshots collection.
+
+price_snapshots is small (monthly aggregates), so with SNAPSHOT_STORE=1 the
+API loads it once at startup into NumPy columns sorted by
+(make, model, year, year_month), plus an offset index per vehicle.  A
+vehicle's history is then a slice of those columns instead of a MongoDB
+round trip.  Reloads build a complete new snapshot and swap it in with one
+assignment, so readers never see a half-loaded store.
+"""
+from __future__ import annotations
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+_PROJECTION = {
+    "_id": 0, "make": 1, "model": 1, "year": 1,
+    "year_month": 1, "avg_price": 1, "median_price": 1, "listing_count": 1,
+}
+_SORT = [("make", 1), ("model", 1), ("year", 1), ("year_month", 1)]
+
+
+class _Snapshot:
+    """Immutable arrays + per-vehicle [start, end) offsets."""
+
+    def __init__(self, docs: list[dict]):
+        n = len(docs)
+        self.year_month    = np.array([d.get("year_month", "") for d in docs], dtype="U7")
+        self.avg_price     = np.fromiter((d.get("avg_price") or 0 for d in docs), dtype=np.float64, count=n)
+        self.median_price  = np.fromiter((d.get("median_price") or 0 for d in docs), dtype=np.float64, count=n)
+        self.listing_count = np.fromiter((d.get("listing_count") or 0 for d in docs), dtype=np.int64, count=n)
+
+        self.offsets: dict[tuple, tuple[int, int]] = {}
+        start = 0
+        for i in range(1, n + 1):
+            if i == n or _key(docs[i]) != _key(docs[start]):
+                self.offsets[_key(docs[start])] = (start, i)
+                start = i
+
+        # Market-wide monthly rollup (same as the market_monthly collection):
+        # snapshot averages weighted by listing_count, months ascending
+        ok = (self.listing_count > 0) & (self.avg_price > 0)
+        self.months, inverse = np.unique(self.year_month[ok], return_inverse=True)
+        weights = self.listing_count[ok].astype(np.float64)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            self.month_avg = np.round(
+                np.bincount(inverse, weights=self.avg_price[ok] * weights, minlength=len(self.months))
+                / np.bincount(inverse, weights=weights, minlength=len(self.months)),
+                2,
+            )
+
+    @property
+    def nbytes(self) -> int:
+        arrays = (self.year_month, self.avg_price, self.median_price, self.listing_count,
+                  self.months, self.month_avg)
+        index  = sys.getsizeof(self.offsets) + sum(
+            sys.getsizeof(k) + sum(sys.getsizeof(p) for p in k) + sys.getsizeof(v)
+            for k, v in self.offsets.items()
+        )
+        return sum(a.nbytes for a in arrays) + index
+
+
+def _key(doc: dict) -> tuple:
+    return doc.get("make"), doc.get("model"), doc.get("year")
+
+
+class SnapshotStore:
+    """Process-wide columnar store; empty until load() is called."""
+
+    def __init__(self):
+        self._snap: _Snapshot | None = None
+        self._lock      = threading.Lock()      # serialises loads, not reads
+        self.loaded_at: str | None = None
+        self.load_ms:   float | None = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._snap is not None
+
+    def load(self, collection) -> dict:
+        """(Re)load every snapshot from `collection` (a pymongo Collection)."""
+        with self._lock:
+            t0   = time.perf_counter()
+            docs = list(collection.find({}, _PROJECTION).sort(_SORT))
+            self._snap     = _Snapshot(docs)
+            self.load_ms   = round((time.perf_counter() - t0) * 1e3, 1)
+            self.loaded_at = datetime.now(timezone.utc).isoformat()
+        return self.stats()
+
+    def watch(self, interval: float, collection) -> threading.Thread:
+        """Reload from `collection` every `interval` seconds in a daemon thread."""
+        def _loop() -> None:
+            while True:
+                time.sleep(interval)
+                try:
+                    print(f"[snapshot_store] refreshed: {self.load(collection)}")
+                except Exception as exc:       # keep serving the previous snapshot
+                    print(f"[snapshot_store] refresh failed: {exc}")
+
+        thread = threading.Thread(target=_loop, name="snapshot-store-refresh", daemon=True)
+        thread.start()
+        return thread
+
+    # ── Reads ─────────────────────────────────────────────────────────────────
+    def columns(self, make: str, model: str, year: int) -> dict[str, np.ndarray] | None:
+        """Zero-copy column slices for one vehicle, or None if it has no snapshots."""
+        snap = self._snap
+        span = snap.offsets.get((make, model, year)) if snap else None
+        if span is None:
+            return None
+        s = slice(*span)
+        return {
+            "year_month":    snap.year_month[s],
+            "avg_price":     snap.avg_price[s],
+            "median_price":  snap.median_price[s],
+            "listing_count": snap.listing_count[s],
+        }
+
+    def history(self, make: str, model: str, year: int) -> list[dict]:
+        """Same points as backend.utils.forecasting.history_from_snapshots (empty if unknown)."""
+        cols = self.columns(make, model, year)
+        if cols is None:
+            return []
+        return [
+            {
+                "date":          ym,
+                "avg_price":     round(avg, 2),
+                "median_price":  round(med, 2),
+                "listing_count": cnt,
+            }
+            for ym, avg, med, cnt in zip(
+                cols["year_month"].tolist(), cols["avg_price"].tolist(),
+                cols["median_price"].tolist(), cols["listing_count"].tolist(),
+            )
+        ]
+
+    def market_monthly(self, n: int) -> list[dict]:
+        """Latest n months of the market-wide average price, newest first."""
+        snap = self._snap
+        if snap is None:
+            return []
+        return [
+            {"year_month": ym, "avg_price": avg}
+            for ym, avg in zip(snap.months[::-1][:n].tolist(), snap.month_avg[::-1][:n].tolist())
+        ]
+
+    def stats(self) -> dict:
+        snap = self._snap
+        if snap is None:
+            return {"loaded": False}
+        return {
+            "loaded":    True,
+            "rows":      int(len(snap.avg_price)),
+            "vehicles":  len(snap.offsets),
+            "memory_mb": round(snap.nbytes / 1_048_576, 2),
+            "load_ms":   self.load_ms,
+            "loaded_at": self.loaded_at,
+        }
+
+
+store = SnapshotStore()
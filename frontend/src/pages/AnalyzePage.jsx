@@ -982,7 +982,7 @@ export default function AnalyzePage() {
                     <span className={`text-xs px-2.5 py-1 rounded-full font-semibold border ${
                       forecastMethod === 'llm_blended'
                         ? 'bg-purple-600 text-white border-purple-500'
-                        : forecastMethod === 'prophet'
+                        : forecastMethod === 'prophet' || forecastMethod === 'holt'
                           ? 'bg-amber-500 text-white border-amber-500'
                           : forecastMethod === 'linear'
                             ? 'bg-amber-500 text-white border-amber-500'
@@ -992,6 +992,7 @@ export default function AnalyzePage() {
                     }`}>
                       {forecastMethod === 'llm_blended'      ? '✦ AI-Enhanced' :
                        forecastMethod === 'prophet'           ? 'Prophet Model' :
+                       forecastMethod === 'holt'              ? 'Damped Trend Model' :
                        forecastMethod === 'statistical'       ? 'Statistical' :
                        forecastMethod === 'linear'            ? 'Linear Extrapolation' :
                        forecastMethod === 'market_avg'        ? 'Market-Wide Trend' :
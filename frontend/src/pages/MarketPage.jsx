@@ -74,6 +74,7 @@ function ForecastBadge({ method }) {
     llm_blended:      { label: 'AI Enhanced', cls: 'bg-purple-600 text-white border-purple-500' },
     statistical:      { label: 'Statistical',  cls: 'bg-orange-600   text-white   border-orange-600'   },
     prophet:          { label: 'Prophet',      cls: 'bg-amber-500 text-white border-amber-500' },
+    holt:             { label: 'Damped Trend', cls: 'bg-amber-500 text-white border-amber-500' },
     linear:           { label: 'Extrapolated', cls: 'bg-amber-500  text-white  border-amber-500'  },
     market_avg:       { label: 'Market Avg',   cls: 'bg-cyan-600   text-white   border-cyan-500/20'   },
     industry_default: { label: 'Industry Est', cls: 'bg-slate-500/15  text-slate-600  border-slate-500/20'  },
@@ -0,0 +1,151 @@
+"""
+batch_forecast.py
+Nightly job: forecast every (make, model, year) series in price_snapshots
+and store the results in the `forecasts` collection, so the request path
+(backend/agents/trend_agent.py) reads a stored forecast instead of fitting
+Prophet live.
+
+Each document carries the fingerprint of the history it was fitted on;
+the API only uses it while that fingerprint still matches the vehicle's
+current price_snapshots, and fits live otherwise.  Series whose stored
+fingerprint is already current are skipped unless --force is given.
+
+Series are fitted in chunks across a process pool; the NumPy "holt"
+forecaster solves a whole chunk as one 2-D array, so it gets larger chunks.
+
+Run after scripts/mongo_ingest.py:
+  python scripts/batch_forecast.py [--workers N] [--force] [--forecaster prophet|holt]
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+from dotenv import load_dotenv
+from pymongo import MongoClient, ASCENDING, ReplaceOne
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from backend.utils.forecast_cache import history_fingerprint
+from backend.utils.forecasting import FORECASTERS, get_forecaster, history_from_snapshots
+
+# ── Config ────────────────────────────────────────────────────────────────────
+load_dotenv()
+
+DB_NAME    = "carmarket"
+BATCH_SIZE = 500                              # forecasts per bulk_write call
+CHUNK_SIZE = {"prophet": 16, "holt": 2_000}   # series per worker task
+
+
+# ── Helpers ───────────────────────────────────────────────────────────────────
+def load_series(db) -> list[tuple[tuple[str, str, int], list[dict]]]:
+    """All price_snapshots series in one aggregation, keyed by (make, model, year)."""
+    pipeline = [
+        {"$sort": {"year_month": ASCENDING}},
+        {"$group": {
+            "_id":  {"make": "$make", "model": "$model", "year": "$year"},
+            "docs": {"$push": {
+                "year_month":    "$year_month",
+                "avg_price":     "$avg_price",
+                "median_price":  "$median_price",
+                "listing_count": "$listing_count",
+            }},
+        }},
+    ]
+    return [
+        ((g["_id"]["make"], g["_id"]["model"], g["_id"]["year"]), history_from_snapshots(g["docs"]))
+        for g in db["price_snapshots"].aggregate(pipeline, allowDiskUse=True)
+    ]
+
+
+def _forecast_safe(forecaster, history: list[dict]) -> dict | None:
+    try:
+        return forecaster.forecast(history)
+    except Exception as exc:                  # one bad series must not kill the batch
+        return {"error": str(exc)}
+
+
+def forecast_chunk(task: tuple[str, list[tuple]]) -> list[tuple]:
+    """Worker: fit one chunk of series.  Pure — no database access in the child process."""
+    name, items = task
+    forecaster  = get_forecaster(name)
+    histories   = [history for _, history, _ in items]
+    try:
+        forecasts = forecaster.forecast_many(histories)
+    except Exception:                         # isolate the failing series
+        forecasts = [_forecast_safe(forecaster, h) for h in histories]
+    return [(key, fingerprint, fc) for (key, _, fingerprint), fc in zip(items, forecasts)]
+
+
+# ── Main ──────────────────────────────────────────────────────────────────────
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="process pool size")
+    parser.add_argument("--force", action="store_true", help="refit series that are already current")
+    parser.add_argument("--forecaster", choices=tuple(FORECASTERS), help="default: FORECASTER env var")
+    args = parser.parse_args()
+    forecaster = get_forecaster(args.forecaster)
+
+    client = MongoClient(os.environ["MONGO_URI"])
+    db     = client[DB_NAME]
+    out    = db["forecasts"]
+    out.create_index(
+        [("make", ASCENDING), ("model", ASCENDING), ("year", ASCENDING)],
+        name="make_model_year", unique=True,
+    )
+
+    t0     = time.perf_counter()
+    series = load_series(db)
+    stored = {} if args.force else {
+        (d["make"], d["model"], d["year"]): d.get("fingerprint")
+        for d in out.find({}, {"_id": 0, "make": 1, "model": 1, "year": 1, "fingerprint": 1})
+    }
+    todo = []
+    for key, history in series:
+        fingerprint = history_fingerprint(history, forecaster.tag)
+        if stored.get(key) != fingerprint:
+            todo.append((key, history, fingerprint))
+    print(f"{len(series):,} series in price_snapshots — {len(todo):,} to fit "
+          f"({len(series) - len(todo):,} already current), {forecaster.tag} on {args.workers} workers")
+
+    size  = CHUNK_SIZE.get(forecaster.name, 16)
+    tasks = [(forecaster.name, todo[i : i + size]) for i in range(0, len(todo), size)]
+
+    written = failed = 0
+    ops: list[ReplaceOne] = []
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        results = (r for chunk in pool.map(forecast_chunk, tasks) for r in chunk)
+        for (make, model, year), fingerprint, forecast in results:
+            if forecast is None or "error" in forecast:
+                failed += 1
+                continue
+            ops.append(ReplaceOne(
+                {"make": make, "model": model, "year": year},
+                {
+                    "make": make, "model": model, "year": year,
+                    "fingerprint": fingerprint,
+                    "forecaster":  forecaster.tag,
+                    "forecast":    forecast,
+                    "created_at":  datetime.now(timezone.utc),
+                },
+                upsert=True,
+            ))
+            if len(ops) >= BATCH_SIZE:
+                out.bulk_write(ops, ordered=False)
+                written += len(ops)
+                ops.clear()
+                print(f"  {written:>7,} / {len(todo):,}  ({time.perf_counter() - t0:,.0f} s)")
+    if ops:
+        out.bulk_write(ops, ordered=False)
+        written += len(ops)
+
+    print(f"\nforecasts — wrote {written:,}, failed {failed:,} "
+          f"in {time.perf_counter() - t0:,.0f} s  (total {out.count_documents({}):,} docs)")
+    client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+bench_encoder.py
+Check the compiled FeatureEncoder against engineer_features and time both.
+
+Parity is exact: the float32 matrices are compared as raw bits, for the
+row-oriented (list of dicts) and column-oriented (DataFrame) entry points,
+on sampled listings plus edge rows (missing / null / unknown fields), and
+for posting_date given as strings, tz-aware timestamps and naive datetime64.
+
+Usage:
+  python scripts/bench_encoder.py [n_rows]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from scripts import model_utils as mu
+from scripts.bench_explain import SEED, sample_rows
+
+EDGE_ROWS = [
+    {"make": "BMW ", "model": None, "year": 2030, "odometer": None},
+    {"make": "toyota", "model": "camry", "year": "2019", "odometer": "48000", "lat": None},
+    {"make": None, "year": 1970, "odometer": 0, "condition": "Like New", "month": 3},
+    {"make": "ford", "model": "f-150", "year": 2024, "odometer": 12_000, "region": "  Texas  "},
+]
+
+# posting_date → month; the first is May in UTC
+DATED_ROWS = [
+    {"make": "honda", "year": 2018, "odometer": 61_000, "posting_date": "2021-04-30T23:30:00-05:00"},
+    {"make": "honda", "year": 2018, "odometer": 61_000, "posting_date": "2021-11-02T08:00:00+00:00"},
+    {"make": "honda", "year": 2018, "odometer": 61_000, "posting_date": None},
+]
+
+
+def reference(rows: list[dict]) -> np.ndarray:
+    X, _ = mu._encode(pd.DataFrame(rows))
+    return X.to_numpy(dtype=np.float32)
+
+
+def bits_equal(a: np.ndarray, b: np.ndarray) -> bool:
+    return a.shape == b.shape and np.array_equal(a.view(np.uint32), b.view(np.uint32))
+
+
+def dates_equal() -> bool:
+    """posting_date parity across the input types encode_columns receives."""
+    ref   = reference(DATED_ROWS)
+    aware = pd.DataFrame(DATED_ROWS)
+    aware["posting_date"] = pd.to_datetime(aware["posting_date"], utc=True)
+    naive = aware.assign(posting_date=aware["posting_date"].dt.tz_localize(None))
+    return all(bits_equal(X, ref) for X in (
+        mu.encode_rows(DATED_ROWS),
+        mu.encode_rows(pd.DataFrame(DATED_ROWS)),
+        mu.encode_rows(aware),
+        mu.encode_rows(naive),                 # datetime64[ns] column
+    ))
+
+
+def per_call_us(fn, arg, repeat: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn(arg)
+    return (time.perf_counter() - t0) / repeat * 1e6
+
+
+def main() -> None:
+    n   = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    rng = np.random.default_rng(SEED)
+    mu._load_artifacts()
+
+    rows = sample_rows(n, rng) + EDGE_ROWS
+    df   = pd.DataFrame(rows)
+    ref  = reference(rows)
+
+    print(f"=== Parity ({len(rows):,} rows) ===")
+    print(f"  rows    : {'bit-identical' if bits_equal(mu.encode_rows(rows), ref) else 'MISMATCH'}")
+    print(f"  columns : {'bit-identical' if bits_equal(mu.encode_rows(df), ref) else 'MISMATCH'}")
+    single = all(bits_equal(mu.encode_rows([r]), reference([r])) for r in rows[:200] + EDGE_ROWS)
+    print(f"  single  : {'bit-identical' if single else 'MISMATCH'}")
+    print(f"  dates   : {'bit-identical' if dates_equal() else 'MISMATCH'}")
+
+    one = rows[:1]
+    print("\n=== Latency ===")
+    print(f"  1 row   engineer_features : {per_call_us(reference, one, 200):>10,.1f} µs")
+    print(f"  1 row   FeatureEncoder    : {per_call_us(mu.encode_rows, one, 2000):>10,.1f} µs")
+    print(f"  {n:,} rows engineer_features : {per_call_us(reference, rows, 3) / 1e3:>8,.1f} ms")
+    print(f"  {n:,} rows encoder (dicts)   : {per_call_us(mu.encode_rows, rows, 3) / 1e3:>8,.1f} ms")
+    print(f"  {n:,} rows encoder (columns) : {per_call_us(mu.encode_rows, df, 3) / 1e3:>8,.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+bench_explain.py
+Compare the two explanation backends in model_utils on the trained model:
+
+  shap     — shap.TreeExplainer
+  xgboost  — booster.predict(..., pred_contribs=True)
+
+Reports cold-start cost (import + explainer build), per-row latency of
+predict_and_explain, and how closely the two backends agree (max |Δ|
+contribution, top-3 feature agreement, price difference), and asserts
+that predict_and_explain prices equal predict_prices under both backends.
+
+Usage:
+  python scripts/bench_explain.py [n_rows]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from scripts import model_utils as mu
+
+SEED = 42
+
+
+def sample_rows(n: int, rng: np.random.Generator) -> list[dict]:
+    """Draw plausible listing dicts from the label vocabulary in feature_meta."""
+    cat_codes = mu._load_artifacts().feature_meta["cat_codes"]
+    vocab     = {col: list(codes) for col, codes in cat_codes.items() if codes}
+    rows = []
+    for _ in range(n):
+        row = {col: labels[rng.integers(len(labels))] for col, labels in vocab.items()}
+        row["year"]     = int(rng.integers(2005, 2023))
+        row["odometer"] = int(rng.integers(5_000, 200_000))
+        rows.append(row)
+    return rows
+
+
+def time_per_row(rows: list[dict], backend: str) -> tuple[float, list]:
+    out = []
+    t0  = time.perf_counter()
+    for row in rows:
+        out.append(mu.predict_and_explain(row, backend=backend))
+    return (time.perf_counter() - t0) / len(rows) * 1e3, out
+
+
+def main() -> None:
+    n   = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    rng = np.random.default_rng(SEED)
+
+    t0 = time.perf_counter()
+    bundle = mu._load_artifacts()
+    print(f"Artifacts loaded in {(time.perf_counter() - t0) * 1e3:,.0f} ms")
+
+    rows = sample_rows(n, rng)
+    X    = mu.encode_rows(rows)
+
+    # ── Cold start ────────────────────────────────────────────────────────────
+    bundle.explainer = None
+    t0 = time.perf_counter()
+    mu._contributions(bundle, X[:1], "shap")
+    shap_cold = (time.perf_counter() - t0) * 1e3
+
+    t0 = time.perf_counter()
+    mu._contributions(bundle, X[:1], "xgboost")
+    native_cold = (time.perf_counter() - t0) * 1e3
+
+    # ── Steady-state latency ──────────────────────────────────────────────────
+    shap_ms,   shap_out   = time_per_row(rows, "shap")
+    native_ms, native_out = time_per_row(rows, "xgboost")
+
+    # ── Agreement ─────────────────────────────────────────────────────────────
+    sv_shap,   base_shap   = mu._contributions(bundle, X, "shap")
+    sv_native, base_native = mu._contributions(bundle, X, "xgboost")
+    max_diff   = float(np.abs(sv_shap - sv_native).max())
+    top3_match = np.mean([
+        [f["feature"] for f in a["shap_factors"]] == [f["feature"] for f in b["shap_factors"]]
+        for a, b in zip(shap_out, native_out)
+    ])
+    price_diff = max(abs(a["predicted_price"] - b["predicted_price"]) for a, b in zip(shap_out, native_out))
+
+    # ── Parity: served price == batch predict, whatever the backend ──────────
+    batch = mu.predict_prices(rows)
+    for name, out in (("shap", shap_out), ("xgboost", native_out)):
+        served = np.array([r["predicted_price"] for r in out])
+        assert np.allclose(served, batch, rtol=1e-6), (
+            f"{name}: predict_and_explain differs from predict_prices by up to "
+            f"${np.abs(served - batch).max():,.2f}"
+        )
+
+    print(f"\n=== Explanation backends ({n:,} rows) ===")
+    print(f"  {'backend':<10} {'cold start':>12} {'per row':>10}")
+    print(f"  {'shap':<10} {shap_cold:>9,.0f} ms {shap_ms:>7.2f} ms")
+    print(f"  {'xgboost':<10} {native_cold:>9,.0f} ms {native_ms:>7.2f} ms")
+    print(f"\n  max |Δ contribution| : {max_diff:.2e}")
+    print(f"  |Δ base value|       : {abs(base_shap - base_native):.2e}")
+    print(f"  top-3 agreement      : {top3_match:.1%}")
+    print(f"  max |Δ price|        : ${price_diff:,.4f}")
+    print(f"  price parity         : OK (both backends == predict_prices)")
+
+
+if __name__ == "__main__":
+    main()
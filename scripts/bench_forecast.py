@@ -0,0 +1,105 @@
+"""
+bench_forecast.py
+Compare the forecasters in backend/utils/forecasting.py on the stored
+price_snapshots series:
+
+  prophet  — Facebook Prophet, one fit per series
+  holt     — NumPy damped trend + monthly seasonal index, batched 2-D
+  naive    — last observed price (reference floor)
+
+Accuracy is a 3-month holdout: each series with ≥ 6 months is fitted on
+all but its last 3 points, then forecast_30d / forecast_90d are scored
+against the 1st and 3rd held-out months (MAPE and direction hit-rate).
+Latency is per series for Prophet, and both per series and for one
+batched call over every series for holt.
+
+Usage:
+  python scripts/bench_forecast.py [n_series]
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from pymongo import MongoClient
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from backend.utils.forecasting import get_forecaster
+from scripts.batch_forecast import DB_NAME, load_series
+
+SEED    = 42
+HOLDOUT = 3
+
+
+def score(forecasts: list[dict], cases: list[tuple]) -> dict:
+    err_30, err_90, hits = [], [], []
+    for fc, (_, train, test) in zip(forecasts, cases):
+        last           = train[-1]["avg_price"]
+        act_30, act_90 = test[0]["avg_price"], test[-1]["avg_price"]
+        err_30.append(abs(fc["forecast_30d"] - act_30) / act_30)
+        err_90.append(abs(fc["forecast_90d"] - act_90) / act_90)
+        hits.append((fc["forecast_90d"] >= last) == (act_90 >= last))
+    return {
+        "mape_30": float(np.mean(err_30)) * 100,
+        "mape_90": float(np.mean(err_90)) * 100,
+        "dir_hit": float(np.mean(hits)) * 100,
+    }
+
+
+def main() -> None:
+    n   = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rng = np.random.default_rng(SEED)
+
+    client = MongoClient(os.environ["MONGO_URI"])
+    series = load_series(client[DB_NAME])
+    client.close()
+
+    cases = [
+        (key, history[:-HOLDOUT], history[-HOLDOUT:])
+        for key, history in series
+        if len(history) >= 3 + HOLDOUT and all(p["avg_price"] > 0 for p in history)
+    ]
+    if not cases:
+        print("No series with enough history for a holdout — run scripts/mongo_ingest.py first.")
+        return
+    sample = [cases[i] for i in rng.choice(len(cases), size=min(n, len(cases)), replace=False)]
+    train  = [c[1] for c in sample]
+    print(f"{len(series):,} series, {len(cases):,} with ≥ {3 + HOLDOUT} months; scoring {len(sample):,}")
+
+    results = {}
+
+    prophet = get_forecaster("prophet")
+    t0      = time.perf_counter()
+    fc      = [prophet.forecast(h) for h in train]
+    if fc and "error" in fc[0]:
+        print(f"  prophet skipped: {fc[0]['error']}")
+    else:
+        results["prophet"] = (score(fc, sample), (time.perf_counter() - t0) / len(train) * 1e3)
+
+    holt = get_forecaster("holt")
+    t0   = time.perf_counter()
+    for h in train:
+        holt.forecast(h)
+    holt_single_ms = (time.perf_counter() - t0) / len(train) * 1e3
+    results["holt"] = (score(holt.forecast_many(train), sample), holt_single_ms)
+
+    naive = [{"forecast_30d": h[-1]["avg_price"], "forecast_90d": h[-1]["avg_price"]} for h in train]
+    results["naive"] = (score(naive, sample), 0.0)
+
+    print(f"\n=== Accuracy / latency ({len(sample):,} series, {HOLDOUT}-month holdout) ===")
+    print(f"  {'forecaster':<10} {'MAPE 30d':>9} {'MAPE 90d':>9} {'dir hit':>8} {'per series':>11}")
+    for name, (s, ms) in results.items():
+        print(f"  {name:<10} {s['mape_30']:>8.2f}% {s['mape_90']:>8.2f}% {s['dir_hit']:>7.1f}% {ms:>8.2f} ms")
+
+    all_hist = [h for _, h in series]
+    t0 = time.perf_counter()
+    holt.forecast_many(all_hist)
+    batch_s = time.perf_counter() - t0
+    print(f"\n  holt batch over all {len(all_hist):,} series : {batch_s * 1e3:,.0f} ms "
+          f"({batch_s / max(len(all_hist), 1) * 1e6:,.1f} µs / series)")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,10 +10,29 @@ Artefacts expected at:  car-price-intelligence/models/
   car_price_model.pkl
   feature_meta.pkl
   shap_data.pkl          (optional — built lazily if missing)
+
+The active model lives in a ModelRegistry: a new artefact version can be
+loaded in the background, validated on a canary batch and swapped in
+atomically (registry.reload() / registry.watch()), without a restart.
+Versions are content hashes of car_price_model.pkl + feature_meta.pkl
+(+ shap_data.pkl when present).  A saved explainer that does not reproduce
+the booster's margins is dropped and rebuilt lazily from the booster.
+
+Explanation backend (env EXPLAIN_BACKEND):
+  shap     — shap.TreeExplainer (default)
+  xgboost  — the booster's native pred_contribs output; no shap import
 """
 
 from __future__ import annotations
 
+import hashlib
+import io
+import os
+import threading
+import time
+from collections.abc import Mapping, Sequence
+from datetime import date, datetime, timezone
+
 import numpy as np
 import pandas as pd
 import joblib
@@ -40,22 +59,206 @@ FEATURE_COLS = [
     "lat", "long",
 ]
 
-# ── Lazy-loaded singletons ────────────────────────────────────────────────────
-_model        = None
-_explainer    = None
-_feature_meta = None
+# ── Model registry ────────────────────────────────────────────────────────────
+_ARTIFACT_FILES = ("car_price_model.pkl", "feature_meta.pkl")
+_OPTIONAL_FILES = ("shap_data.pkl",)          # hashed too when present
+
+
+class ModelBundle:
+    """One loaded model version plus everything derived from it."""
+
+    def __init__(self, model_dir: Path = _MODELS_DIR):
+        # Read each file once so the version hash always matches what was loaded
+        blobs = {name: (model_dir / name).read_bytes() for name in _ARTIFACT_FILES}
+        blobs.update({
+            name: (model_dir / name).read_bytes()
+            for name in _OPTIONAL_FILES if (model_dir / name).exists()
+        })
+        self.version      = hashlib.sha256(b"".join(blobs.values())).hexdigest()[:12]
+        self.model        = joblib.load(io.BytesIO(blobs["car_price_model.pkl"]))
+        self.feature_meta = joblib.load(io.BytesIO(blobs["feature_meta.pkl"]))
+        self.encoder      = FeatureEncoder(self.feature_meta)
+        self.explainer    = None            # shap.TreeExplainer, built lazily if not saved
+        self.loaded_at    = datetime.now(timezone.utc)
+        if "shap_data.pkl" in blobs:
+            self.explainer = joblib.load(io.BytesIO(blobs["shap_data.pkl"])).get("explainer")
+
+    @property
+    def booster(self):
+        return self.model.get_booster() if hasattr(self.model, "get_booster") else self.model
+
+    @property
+    def iteration_range(self) -> tuple[int, int]:
+        """Trees used by the sklearn wrapper's predict (honours early stopping)."""
+        best = getattr(self.model, "best_iteration", None)
+        return (0, best + 1) if best is not None else (0, 0)
+
+
+class ModelRegistry:
+    """
+    Holds the active ModelBundle and swaps it without a restart.
 
+    A new version is loaded off the request path, validated on a canary
+    batch and then published with a single reference assignment, so every
+    in-flight prediction finishes on the bundle it started with.
+    """
 
-def _load_artifacts() -> None:
-    global _model, _explainer, _feature_meta
-    if _model is not None:
+    def __init__(self, model_dir: Path = _MODELS_DIR):
+        self.model_dir   = model_dir
+        self.last_reload: dict | None = None
+        self._active: ModelBundle | None = None
+        self._lock       = threading.Lock()    # serialises loads; never held by predictions
+        self._on_swap: list = []
+
+    def active(self) -> ModelBundle:
+        bundle = self._active
+        if bundle is None:
+            with self._lock:
+                if self._active is None:
+                    self._active = ModelBundle(self.model_dir)
+                bundle = self._active
+        return bundle
+
+    def on_swap(self, callback) -> None:
+        """Register callback(previous_version, new_version), run after every swap."""
+        self._on_swap.append(callback)
+
+    def reload(self, force: bool = False) -> dict:
+        """
+        Load the artefacts currently on disk and swap them in if they are a
+        new version (or force=True) and pass the canary check.
+
+        Returns
+        -------
+        {"status": "swapped" | "unchanged" | "rejected" | "error", "version": str, ...}
+        """
+        with self._lock:
+            current = self._active
+            try:
+                candidate = ModelBundle(self.model_dir)
+            except Exception as exc:
+                result = {"status": "error", "error": f"load failed: {exc}"}
+            else:
+                if current is not None and candidate.version == current.version and not force:
+                    result = {"status": "unchanged", "version": current.version}
+                elif problem := _validate_candidate(candidate, current):
+                    result = {"status": "rejected", "version": candidate.version, "error": problem}
+                else:
+                    self._active = candidate
+                    result = {
+                        "status":   "swapped",
+                        "version":  candidate.version,
+                        "previous": current.version if current else None,
+                    }
+            result["checked_at"] = datetime.now(timezone.utc).isoformat()
+            self.last_reload = result
+
+        if result["status"] == "swapped":
+            for callback in self._on_swap:
+                try:
+                    callback(result["previous"], result["version"])
+                except Exception as exc:
+                    print(f"[model_registry] on_swap callback failed: {exc}")
+        return result
+
+    def _stat(self) -> tuple:
+        stats = []
+        for name in _ARTIFACT_FILES + _OPTIONAL_FILES:
+            try:
+                st = (self.model_dir / name).stat()
+                stats.append((st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                stats.append(None)
+        return tuple(stats)
+
+    def watch(self, interval: float = 30.0) -> threading.Thread:
+        """
+        Poll models/ every `interval` seconds and reload when the artefacts
+        change.  A change must be stable for one extra poll before loading,
+        so a half-copied pickle is never picked up.
+        """
+        def _loop() -> None:
+            seen, pending = self._stat(), None
+            while True:
+                time.sleep(interval)
+                current = self._stat()
+                if current == seen:
+                    pending = None
+                elif current != pending:
+                    pending = current          # still being written — wait one more poll
+                else:
+                    seen, pending = current, None
+                    print(f"[model_registry] artefacts changed: {self.reload()}")
+
+        thread = threading.Thread(target=_loop, name="model-registry-watch", daemon=True)
+        thread.start()
+        return thread
+
+
+# ── Canary validation ─────────────────────────────────────────────────────────
+_CANARY_PRICE_RANGE = (500.0, 500_000.0)
+_CANARY_MAX_SHIFT   = 2.0     # max median price ratio vs the active model
+_EXPLAINER_ATOL     = 1e-3    # max |explainer base + Σsv − booster margin| (log $)
+
+
+def _validate_candidate(candidate: ModelBundle, current: ModelBundle | None) -> str | None:
+    """Return None if the candidate passes the canary batch, else the reason it failed."""
+    try:
+        prices = _predict(candidate, _CANARY_ROWS)
+        _contributions(candidate, candidate.encoder.encode(_CANARY_ROWS[:1]))
+    except Exception as exc:
+        return f"canary batch failed: {exc}"
+
+    lo, hi = _CANARY_PRICE_RANGE
+    if not np.all(np.isfinite(prices)):
+        return "canary batch produced non-finite prices"
+    if prices.min() < lo or prices.max() > hi:
+        return f"canary prices outside ${lo:,.0f}–${hi:,.0f}: {np.round(prices).tolist()}"
+
+    if current is not None:
+        ratio = float(np.median(prices / _predict(current, _CANARY_ROWS)))
+        if not 1 / _CANARY_MAX_SHIFT <= ratio <= _CANARY_MAX_SHIFT:
+            return f"canary median price moved ×{ratio:.2f} vs active model {current.version}"
+
+    try:
+        _check_explainer(candidate)
+    except Exception as exc:
+        return f"explainer check failed: {exc}"
+    return None
+
+
+def _check_explainer(bundle: ModelBundle) -> None:
+    """
+    Drop a saved explainer whose decomposition (base + Σ SHAP values) does
+    not reproduce the booster's log-price margin on the canary rows — e.g.
+    a shap_data.pkl left over from a previous model — so _shap_values
+    rebuilds it from this booster on first use.
+    """
+    if bundle.explainer is None:
         return
-    _model        = joblib.load(_MODELS_DIR / "car_price_model.pkl")
-    _feature_meta = joblib.load(_MODELS_DIR / "feature_meta.pkl")
-    shap_path     = _MODELS_DIR / "shap_data.pkl"
-    if shap_path.exists():
-        shap_data  = joblib.load(shap_path)
-        _explainer = shap_data.get("explainer")
+    X      = bundle.encoder.encode(_CANARY_ROWS)
+    margin = bundle.booster.predict(
+        _dmatrix(bundle, X), output_margin=True, iteration_range=bundle.iteration_range,
+    )
+    sv, base = _shap_values(bundle, X)
+    gap = float(np.abs(base + sv.sum(axis=1) - margin).max())
+    if gap > _EXPLAINER_ATOL:
+        print(f"[model_registry] shap_data.pkl explainer is off by {gap:.4f} log-$ "
+              f"from model {bundle.version}; rebuilding it from the booster")
+        bundle.explainer = None
+
+
+registry = ModelRegistry()
+
+
+def _load_artifacts() -> ModelBundle:
+    """Return the active model bundle, loading it on first use."""
+    return registry.active()
+
+
+def model_version() -> str:
+    """Version tag of the active model."""
+    return registry.active().version
 
 
 # ── Feature engineering ───────────────────────────────────────────────────────
@@ -119,25 +322,397 @@ def engineer_features(
     return d[available], available
 
 
+# ── Compiled inference encoder ────────────────────────────────────────────────
+_COL_IDX = {c: i for i, c in enumerate(FEATURE_COLS)}
+
+
+def _missing(v) -> bool:
+    return v is None or v != v                 # None or NaN
+
+
+def _to_float(v) -> float:
+    """pd.to_numeric(errors="coerce") for a single value."""
+    if _missing(v):
+        return np.nan
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _label(v) -> str:
+    """fillna("unknown").astype(str).str.lower().str.strip() for a single value."""
+    return "unknown" if _missing(v) else str(v).lower().strip()
+
+
+def _is_luxury(v) -> bool:
+    return isinstance(v, str) and v.lower() in LUXURY_MAKES
+
+
+def _month(v) -> int:
+    return 6 if _missing(v) else int(v)
+
+
+def _datetime64_months(arr: np.ndarray) -> np.ndarray:
+    """Month (1-12) of each datetime64 value — naive means UTC, as in
+    pd.to_datetime(utc=True) — and 6 for NaT."""
+    months = arr.astype("datetime64[M]").astype(np.int64) % 12 + 1
+    months[np.isnat(arr)] = 6
+    return months
+
+
+def _posting_month(v) -> int:
+    """UTC month of a posting_date, 6 when missing or unparseable."""
+    if _missing(v):                            # None / NaN / NaT
+        return 6
+    if isinstance(v, np.datetime64):
+        return int(_datetime64_months(np.asarray(v))[()])
+    if isinstance(v, str):
+        try:
+            v = datetime.fromisoformat(v.strip())
+        except ValueError:
+            return 6
+    if isinstance(v, datetime):
+        return v.astimezone(timezone.utc).month if v.tzinfo else v.month
+    if isinstance(v, date):
+        return v.month
+    return 6
+
+
+class FeatureEncoder:
+    """
+    Pandas-free twin of engineer_features for inference.
+
+    Built once from feature_meta.pkl: categorical columns resolve through
+    plain dict lookups and numeric features are NumPy float64 arithmetic,
+    written straight into a C-contiguous float32 matrix in FEATURE_COLS order.
+    The result equals engineer_features(...)[0].to_numpy(np.float32) bit for
+    bit — including the column-level rules (a categorical column absent from
+    every row encodes as -1, present-but-null as "unknown").  Year and
+    odometer are staged in the float32 output, so parity assumes whole
+    numbers below 2**24 (every real reading).
+
+    Inputs are expected to carry categorical fields as strings.  Columns
+    missing from cat_codes encode as -1 rather than the batch-dependent
+    category codes engineer_features fits at training time.
+    """
+
+    def __init__(self, feature_meta: dict):
+        cat_codes        = feature_meta["cat_codes"]
+        self.lat_median  = float(feature_meta.get("lat_median",  37.0))
+        self.long_median = float(feature_meta.get("long_median", -95.0))
+        self._tables     = [
+            (_COL_IDX[col], col, dict(cat_codes.get(col) or {}))
+            for col in CAT_COLS
+        ]
+
+    # ── Output buffer ─────────────────────────────────────────────────────────
+    @staticmethod
+    def _output(n: int, out: np.ndarray | None) -> np.ndarray:
+        shape = (n, len(FEATURE_COLS))
+        if out is None:
+            return np.empty(shape, dtype=np.float32)
+        if out.shape != shape or out.dtype != np.float32 or not out.flags.c_contiguous:
+            raise ValueError(f"out must be a C-contiguous float32 array of shape {shape}")
+        return out
+
+    # ── Numeric block (shared by both entry points) ───────────────────────────
+    @staticmethod
+    def _numeric(out: np.ndarray) -> None:
+        """car_age / log_odometer / mileage_per_year, in place in `out`.
+
+        On entry the car_age column holds the raw year and log_odometer the
+        raw odometer (NaN when missing).  Every step is a ufunc writing into
+        those columns; division and log1p run in float64 (dtype=) and round
+        once on the way out, as engineer_features does.
+        """
+        age = out[:, _COL_IDX["car_age"]]
+        odo = out[:, _COL_IDX["log_odometer"]]
+        mpy = out[:, _COL_IDX["mileage_per_year"]]
+
+        np.subtract(2024.0, age, out=age)
+        np.clip(age, 0, 50, out=age)
+        np.copyto(age, 10, where=age != age)
+        np.copyto(odo, 0, where=odo != odo)
+
+        np.copyto(mpy, odo)                    # age 0 counts as 1 year
+        np.divide(odo, age, out=mpy, where=age != 0, dtype=np.float64)
+        np.log1p(odo, out=odo, dtype=np.float64)
+
+    # ── Row-oriented input ────────────────────────────────────────────────────
+    def encode(self, rows: Sequence[dict], out: np.ndarray | None = None) -> np.ndarray:
+        """Encode a sequence of raw listing dicts into the model feature matrix."""
+        n   = len(rows)
+        out = self._output(n, out)
+        has = lambda col: any(col in row for row in rows)   # column-level presence
+
+        month_col = "month" if has("month") else "posting_date" if has("posting_date") else None
+        present   = []
+        for table in self._tables:
+            if has(table[1]):
+                present.append(table)
+            else:
+                out[:, table[0]] = -1
+
+        i_lux, i_month = _COL_IDX["is_luxury"], _COL_IDX["month"]
+        i_lat, i_long  = _COL_IDX["lat"], _COL_IDX["long"]
+        i_year, i_odo  = _COL_IDX["car_age"], _COL_IDX["log_odometer"]   # staged raw
+
+        for i, row in enumerate(rows):
+            get = row.get
+            out[i, i_year] = _to_float(get("year"))
+            out[i, i_odo]  = _to_float(get("odometer"))
+            out[i, i_lux]  = _is_luxury(get("make"))
+            if month_col == "month":
+                out[i, i_month] = _month(get("month"))
+            elif month_col == "posting_date":
+                out[i, i_month] = _posting_month(get("posting_date"))
+            else:
+                out[i, i_month] = 6
+            lat, lng = _to_float(get("lat")), _to_float(get("long"))
+            out[i, i_lat]  = self.lat_median  if lat != lat else lat
+            out[i, i_long] = self.long_median if lng != lng else lng
+            for j, col, table in present:
+                out[i, j] = table.get(_label(get(col)), -1)
+
+        self._numeric(out)
+        return out
+
+    # ── Column-oriented input ─────────────────────────────────────────────────
+    @staticmethod
+    def _numeric_column(values, n: int, dest: np.ndarray) -> None:
+        """pd.to_numeric(errors="coerce") of a column, written into `dest`."""
+        if values is None:
+            dest[:] = np.nan
+            return
+        arr = np.asarray(values)
+        if arr.dtype.kind in "biuf":
+            dest[:] = arr
+        else:
+            dest[:] = np.fromiter((_to_float(v) for v in arr), dtype=np.float64, count=n)
+
+    @staticmethod
+    def _posting_months(values, n: int) -> np.ndarray:
+        arr = np.asarray(values)
+        if arr.dtype.kind == "M":              # DataFrame datetime64 column
+            return _datetime64_months(arr)
+        return np.fromiter(map(_posting_month, arr), dtype=np.float32, count=n)
+
+    def encode_columns(
+        self,
+        columns: Mapping[str, Sequence],
+        out: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Encode columnar input ({column: array-like}) into the model feature matrix."""
+        n   = len(next(iter(columns.values()))) if columns else 0
+        out = self._output(n, out)
+        get = columns.get
+
+        out[:, _COL_IDX["is_luxury"]] = np.fromiter(
+            (_is_luxury(v) for v in get("make", ())), dtype=np.float32, count=n,
+        ) if "make" in columns else 0
+
+        if "month" in columns:
+            out[:, _COL_IDX["month"]] = np.fromiter(map(_month, columns["month"]), dtype=np.float32, count=n)
+        elif "posting_date" in columns:
+            out[:, _COL_IDX["month"]] = self._posting_months(columns["posting_date"], n)
+        else:
+            out[:, _COL_IDX["month"]] = 6
+
+        for col, fill in (("lat", self.lat_median), ("long", self.long_median)):
+            dest = out[:, _COL_IDX[col]]
+            self._numeric_column(get(col), n, dest)
+            np.copyto(dest, fill, where=dest != dest)
+
+        for j, col, table in self._tables:
+            if col in columns:
+                out[:, j] = np.fromiter(
+                    (table.get(_label(v), -1) for v in columns[col]), dtype=np.float32, count=n,
+                )
+            else:
+                out[:, j] = -1
+
+        self._numeric_column(get("year"),     n, out[:, _COL_IDX["car_age"]])
+        self._numeric_column(get("odometer"), n, out[:, _COL_IDX["log_odometer"]])
+        self._numeric(out)
+        return out
+
+
+# ── Query → listing row ───────────────────────────────────────────────────────
+def listing_row(
+    make: str,
+    model: str,
+    year: int,
+    mileage: int,
+    condition: str,
+    region: str,
+) -> dict:
+    """Raw listing dict for a user query, with defaults for fields the UI does not ask for."""
+    return {
+        "make":        make.lower(),
+        "model":       model.lower(),
+        "year":        year,
+        "odometer":    mileage,
+        "condition":   condition.lower(),
+        "region":      region.lower(),
+        "fuel":        "gas",          # reasonable default
+        "transmission": "automatic",
+        "drive":       "fwd",
+        "type":        "sedan",
+        "title_status": "clean",
+        "cylinders":   "4 cylinders",
+        "paint_color": "white",
+        "state":       region[:2].lower(),
+    }
+
+
 # ── Predict ───────────────────────────────────────────────────────────────────
+def _encode(df: pd.DataFrame) -> tuple[pd.DataFrame, list[str]]:
+    """Run engineer_features with the saved training-time encodings."""
+    meta = _load_artifacts().feature_meta
+    return engineer_features(
+        df,
+        cat_codes   = meta["cat_codes"],
+        lat_median  = meta.get("lat_median",  37.0),
+        long_median = meta.get("long_median", -95.0),
+    )
+
+
+def encode_rows(
+    rows: Sequence[dict] | pd.DataFrame,
+    bundle: ModelBundle | None = None,
+) -> np.ndarray:
+    """Encode listings with the compiled FeatureEncoder (float32, FEATURE_COLS order)."""
+    encoder = (bundle or _load_artifacts()).encoder
+    if isinstance(rows, pd.DataFrame):
+        return encoder.encode_columns({c: rows[c].to_numpy() for c in rows.columns})
+    return encoder.encode(rows if isinstance(rows, Sequence) else list(rows))
+
+
+def _dmatrix(bundle: ModelBundle, X: np.ndarray):
+    """Wrap an encoded matrix for the booster, keeping the training feature names."""
+    import xgboost as xgb
+
+    booster = bundle.booster
+    return xgb.DMatrix(
+        X,
+        feature_names = booster.feature_names or FEATURE_COLS,
+        feature_types = booster.feature_types,
+    )
+
+
+def _predict(bundle: ModelBundle, rows: Sequence[dict] | pd.DataFrame) -> np.ndarray:
+    X = encode_rows(rows, bundle)
+    if len(X) == 0:
+        return np.empty(0, dtype=float)
+    log_prices = bundle.booster.predict(_dmatrix(bundle, X), iteration_range=bundle.iteration_range)
+    return np.expm1(log_prices).astype(float)
+
+
+def predict_prices(rows: list[dict] | pd.DataFrame) -> np.ndarray:
+    """
+    Predict prices (original $) for a batch of listings in one booster call.
+
+    Parameters
+    ----------
+    rows : List of raw listing dicts, or a DataFrame with the same columns.
+
+    Returns
+    -------
+    1-D float array of predicted prices, aligned with the input rows.
+    """
+    return _predict(_load_artifacts(), rows)
+
+
 def predict_price(row_dict: dict) -> float:
     """
     Predict price (original $) for a single listing dict.
     Returns predicted price as a float.
     """
-    _load_artifacts()
-    df = pd.DataFrame([row_dict])
-    X, _ = engineer_features(
-        df,
-        cat_codes   = _feature_meta["cat_codes"],
-        lat_median  = _feature_meta.get("lat_median",  37.0),
-        long_median = _feature_meta.get("long_median", -95.0),
-    )
-    log_price = _model.predict(X)[0]
-    return float(np.expm1(log_price))
+    return float(predict_prices([row_dict])[0])
 
 
 # ── Explain ───────────────────────────────────────────────────────────────────
+EXPLAIN_BACKENDS = ("shap", "xgboost")
+
+
+def _explain_backend() -> str:
+    backend = os.environ.get("EXPLAIN_BACKEND", "shap").strip().lower()
+    if backend not in EXPLAIN_BACKENDS:
+        raise ValueError(f"EXPLAIN_BACKEND must be one of {EXPLAIN_BACKENDS}, got {backend!r}")
+    return backend
+
+
+def _explained_model(bundle: ModelBundle):
+    """
+    The trees predictions actually use.  TreeExplainer walks every tree in
+    the model it is given (xgboost 2.x dropped best_ntree_limit), so with
+    early stopping it gets the booster sliced to iteration_range.
+    """
+    start, end = bundle.iteration_range
+    return bundle.booster[start:end] if end else bundle.model
+
+
+def _shap_values(bundle: ModelBundle, X: np.ndarray) -> tuple[np.ndarray, float]:
+    """Return (SHAP matrix, base value) for an encoded feature matrix."""
+    import shap as _shap
+
+    # Build explainer lazily if shap_data.pkl was not found
+    if bundle.explainer is None:
+        bundle.explainer = _shap.TreeExplainer(_explained_model(bundle))
+
+    X    = pd.DataFrame(X, columns=FEATURE_COLS, copy=False)
+    sv   = np.asarray(bundle.explainer.shap_values(X))   # shape: (n_rows, n_features)
+    base = float(np.ravel(bundle.explainer.expected_value)[0])
+    return sv, base
+
+
+def _native_contribs(bundle: ModelBundle, X: np.ndarray, dm=None) -> tuple[np.ndarray, float]:
+    """
+    Same contract as _shap_values, computed by the booster itself
+    (pred_contribs=True).  The last output column is the bias term.
+    `dm` reuses a DMatrix already built for X.
+    """
+    contribs = bundle.booster.predict(
+        dm if dm is not None else _dmatrix(bundle, X),
+        pred_contribs   = True,
+        iteration_range = bundle.iteration_range,
+    )
+    return contribs[:, :-1], float(contribs[0, -1])
+
+
+def _contributions(
+    bundle: ModelBundle,
+    X: np.ndarray,
+    backend: str | None = None,
+    dm=None,
+) -> tuple[np.ndarray, float]:
+    """Dispatch to the configured explanation backend."""
+    backend = backend or _explain_backend()
+    if backend == "xgboost":
+        return _native_contribs(bundle, X, dm)
+    return _shap_values(bundle, X)
+
+
+def _top_factors(
+    sv: np.ndarray,
+    x: np.ndarray,
+    feature_names: list[str],
+    top_k: int = 3,
+) -> list[dict]:
+    """Format the top-k contributors of one row's SHAP vector."""
+    top = np.argsort(np.abs(sv))[::-1][:top_k]
+    return [
+        {
+            "feature":   feature_names[i],
+            "value":     float(x[i]),
+            "impact":    round(float(abs(sv[i])), 4),
+            "direction": "increases price" if sv[i] > 0 else "decreases price",
+        }
+        for i in top
+    ]
+
+
 def explain_prediction(row_dict: dict) -> list[dict]:
     """
     Return top-3 SHAP contributors for a single listing.
@@ -156,32 +731,90 @@ def explain_prediction(row_dict: dict) -> list[dict]:
           "direction": str,   # "increases price" | "decreases price"
         }
     """
-    import shap as _shap
+    return predict_and_explain(row_dict)["shap_factors"]
 
-    _load_artifacts()
 
-    df = pd.DataFrame([row_dict])
-    X, feature_names = engineer_features(
-        df,
-        cat_codes   = _feature_meta["cat_codes"],
-        lat_median  = _feature_meta.get("lat_median",  37.0),
-        long_median = _feature_meta.get("long_median", -95.0),
-    )
+def predict_and_explain(
+    row_dict: dict,
+    top_k: int = 3,
+    backend: str | None = None,
+) -> dict:
+    """
+    Predict price and return the top-k SHAP contributors in a single pass.
 
-    # Build explainer lazily if shap_data.pkl was not found
-    global _explainer
-    if _explainer is None:
-        _explainer = _shap.TreeExplainer(_model)
+    The row is encoded once into one DMatrix.  The price always comes from
+    the booster over bundle.iteration_range — the same number as
+    predict_price, the price grid and either backend — and the
+    contributions are used only for the factors.
 
-    sv = _explainer.shap_values(X)[0]          # shape: (n_features,)
-    top3 = np.argsort(np.abs(sv))[::-1][:3]
+    backend : "shap" | "xgboost"; defaults to the EXPLAIN_BACKEND env var.
 
-    return [
-        {
-            "feature":   feature_names[i],
-            "value":     float(X.iloc[0, i]),
-            "impact":    round(float(abs(sv[i])), 4),
-            "direction": "increases price" if sv[i] > 0 else "decreases price",
-        }
-        for i in top3
-    ]
+    Returns
+    -------
+    {
+      "predicted_price": float,
+      "shap_factors":    [...],   # explain_prediction format
+      "model_version":   str,     # version of the bundle that produced both
+    }
+    """
+    bundle = _load_artifacts()
+
+    X  = encode_rows([row_dict], bundle)
+    dm = _dmatrix(bundle, X)
+    log_price = float(bundle.booster.predict(dm, iteration_range=bundle.iteration_range)[0])
+    sv, _ = _contributions(bundle, X, backend, dm)
+
+    return {
+        "predicted_price": float(np.expm1(log_price)),
+        "shap_factors":    _top_factors(sv[0], X[0], FEATURE_COLS, top_k),
+        "model_version":   bundle.version,
+    }
+
+
+# ── Warm-up ───────────────────────────────────────────────────────────────────
+_WARMUP_ROW = listing_row("toyota", "camry", 2019, 50_000, "good", "california")
+
+# Canary batch for registry validation: the warm-up row across age / mileage
+# / segment so a broken encoding or a mis-trained booster shows up as an
+# out-of-range or shifted price.
+_CANARY_ROWS = [
+    _WARMUP_ROW,
+    {**_WARMUP_ROW, "year": 2012, "odometer": 140_000, "condition": "fair"},
+    {**_WARMUP_ROW, "make": "ford", "model": "f-150", "type": "truck", "drive": "4wd",
+     "cylinders": "8 cylinders", "region": "texas", "state": "tx"},
+    {**_WARMUP_ROW, "make": "bmw", "model": "3 series", "year": 2020, "odometer": 25_000,
+     "condition": "excellent", "region": "new york", "state": "ne"},
+    {**_WARMUP_ROW, "make": "honda", "model": "civic", "year": 2016, "odometer": 90_000,
+     "region": "florida", "state": "fl"},
+]
+
+
+def warm_up() -> dict:
+    """
+    Load artefacts and run one dummy prediction + explanation so the first
+    real request does not pay for unpickling, the shap import or building
+    the explainer.  Safe to call repeatedly; later calls only re-time the
+    (already warm) predict/explain path.
+
+    Returns
+    -------
+    {"load_ms", "predict_ms", "explain_ms", "total_ms": float,
+     "explain_backend": str, "model_version": str}
+    """
+    t0 = time.perf_counter()
+    bundle = _load_artifacts()
+    if _explain_backend() == "shap":
+        _check_explainer(bundle)      # first load skips the registry canary
+    t1 = time.perf_counter()
+    predict_price(_WARMUP_ROW)
+    t2 = time.perf_counter()
+    predict_and_explain(_WARMUP_ROW)
+    t3 = time.perf_counter()
+    return {
+        "load_ms":         round((t1 - t0) * 1e3, 1),
+        "predict_ms":      round((t2 - t1) * 1e3, 1),
+        "explain_ms":      round((t3 - t2) * 1e3, 1),
+        "total_ms":        round((t3 - t0) * 1e3, 1),
+        "explain_backend": _explain_backend(),
+        "model_version":   bundle.version,
+    }
@@ -1,13 +1,15 @@
 """
 mongo_ingest.py
 Ingest cleaned_cars.csv into MongoDB Atlas — carmarket database.
-Collections: listings, price_snapshots, predictions_cache (TTL)
+Collections: listings, price_snapshots, market_context, market_monthly,
+             predictions_cache (TTL)
 
 M0 free-tier fix: drops fat text columns (url, image_url, description,
 region_url, VIN, county, id) — saves ~200 MB, keeps all analytic fields.
 """
 
 import os
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -15,6 +17,11 @@ import pandas as pd
 from dotenv import load_dotenv
 from pymongo import MongoClient, ASCENDING
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from backend.utils.market_context import (
+    GLOBAL_ID, summarize, market_monthly_pipeline, price_range, price_range_pipeline,
+)
+
 # ── Config ────────────────────────────────────────────────────────────────────
 load_dotenv()
 
@@ -46,6 +53,48 @@ def load_csv(path: Path) -> list[dict]:
     return df.to_dict("records")
 
 
+def build_market_context(db) -> list[dict]:
+    """
+    One get_market_context payload per (make, model, year) seen in listings
+    or price_snapshots, plus the global fallback document.
+    """
+    key_id = {"make": "$make", "model": "$model", "year": "$year"}
+    key    = lambda g: (g["_id"].get("make"), g["_id"].get("model"), g["_id"].get("year"))
+    stats  = {
+        key(g): g
+        for g in db["price_snapshots"].aggregate([
+            {"$sort": {"year_month": -1}},
+            {"$group": {
+                "_id":         key_id,
+                "recent":      {"$push": {"listing_count": "$listing_count", "avg_price": "$avg_price"}},
+                "overall_avg": {"$avg": "$avg_price"},
+                "min_price":   {"$min": "$avg_price"},
+                "max_price":   {"$max": "$avg_price"},
+            }},
+            {"$set": {"recent": {"$slice": ["$recent", 2]}}},
+        ], allowDiskUse=True)
+    }
+    counts = {
+        key(g): g["n"]
+        for g in db["listings"].aggregate(
+            [{"$group": {"_id": key_id, "n": {"$sum": 1}}}], allowDiskUse=True,
+        )
+    }
+
+    global_range = price_range(list(db["price_snapshots"].aggregate(price_range_pipeline())))
+
+    docs = [{"_id": GLOBAL_ID, **summarize([], None, 0, global_range)}]
+    for make, model, year in stats.keys() | counts.keys():
+        if None in (make, model, year):       # unqueryable — and would clash in the unique index
+            continue
+        st = stats.get((make, model, year))
+        docs.append({
+            "make": make, "model": model, "year": year,
+            **summarize(st["recent"] if st else [], st, counts.get((make, model, year), 0), global_range),
+        })
+    return docs
+
+
 def chunked(lst: list, size: int):
     for i in range(0, len(lst), size):
         yield lst[i : i + size]
@@ -114,18 +163,66 @@ def main() -> None:
     )
     print(f"price_snapshots — inserted {snapshots_col.count_documents({}):,} docs")
 
-    # ── 3. predictions_cache — TTL index (expires after 3600 s) ───────────────
+    # ── 2b. market_context — served by get_market_context (one find_one) ─────
+    context_col = db["market_context"]
+    context_col.drop()
+
+    contexts = build_market_context(db)
+    for batch in chunked(contexts, BATCH_SIZE):
+        context_col.insert_many(batch, ordered=False)
+
+    context_col.create_index(
+        [("make", ASCENDING), ("model", ASCENDING), ("year", ASCENDING)],
+        name="make_model_year", unique=True,
+    )
+    print(f"market_context — inserted {len(contexts):,} docs (incl. global fallback)")
+
+    # ── 2c. market_monthly — market-wide avg price per month ─────────────────
+    monthly_col = db["market_monthly"]
+    monthly_col.drop()
+
+    monthly = list(snapshots_col.aggregate(market_monthly_pipeline(), allowDiskUse=True))
+    if monthly:
+        monthly_col.insert_many(monthly, ordered=False)
+
+    monthly_col.create_index([("year_month", ASCENDING)], name="year_month", unique=True)
+    print(f"market_monthly — inserted {len(monthly):,} monthly market averages")
+
+    # ── 3. predictions_cache — TTL index (deleted at each doc's expires_at) ───
+    # The API sets expires_at = computed_at + PREDICT_HARD_TTL and serves
+    # entries past PREDICT_SOFT_TTL while refreshing them in the background.
     cache_col = db["predictions_cache"]
+    ttl_index = cache_col.index_information().get("ttl_expires_at")
+    if ttl_index and ttl_index.get("expireAfterSeconds") != 0:
+        cache_col.drop_index("ttl_expires_at")      # pre-SWR fixed 3600 s expiry
     cache_col.create_index(
         [("expires_at", ASCENDING)],
-        expireAfterSeconds=3600,
+        expireAfterSeconds=0,
+        name="ttl_expires_at",
+    )
+    print(f"predictions_cache — TTL index created (expires at each doc's expires_at)")
+
+    # ── 3b. forecast_cache — fitted forecasts keyed by history fingerprint ────
+    # Re-ingest changes the fingerprints, so old entries simply age out.
+    db["forecast_cache"].create_index(
+        [("created_at", ASCENDING)],
+        expireAfterSeconds=30 * 24 * 3600,
+        name="ttl_created_at",
+    )
+    print(f"forecast_cache — TTL index created (expireAfterSeconds=30d)")
+
+    # ── 3c. predict_locks — cross-worker single-flight locks (PREDICT_LOCK=1) ─
+    # Each lock carries its own deadline; the TTL monitor removes dead ones.
+    db["predict_locks"].create_index(
+        [("expires_at", ASCENDING)],
+        expireAfterSeconds=0,
         name="ttl_expires_at",
     )
-    print(f"predictions_cache — TTL index created (expireAfterSeconds=3600)")
+    print(f"predict_locks — TTL index created (expires at lock deadline)")
 
     # ── 4. Summary ────────────────────────────────────────────────────────────
     print("\n=== Collection counts ===")
-    for name in ["listings", "price_snapshots", "predictions_cache"]:
+    for name in ["listings", "price_snapshots", "market_context", "market_monthly", "predictions_cache"]:
         print(f"  {name:<22} {db[name].count_documents({}):>8,}")
 
     # ── 5. Storage usage (M0 quota check) ────────────────────────────────────
@@ -0,0 +1,200 @@
+"""
+price_grid.py
+Precomputed fair-value grid: XGBoost prices for every catalogue vehicle
+(backend/car_catalog.py) over mileage buckets × conditions × regions.
+
+The live path (backend/agent.py::run_price_prediction) answers from the
+grid — log-linear interpolation between the two nearest mileage buckets —
+and only invokes the booster for off-grid inputs (unknown vehicle,
+condition or region, mileage outside the bucket range) or when the grid
+was built by a different model version.
+
+Build (offline, after every model change):
+  python scripts/price_grid.py
+
+Artefacts (models/price_grid/, memory-mapped at serve time):
+  prices.npy         float32 [vehicle, mileage, condition, region]
+  factor_idx.npy     uint8   [vehicle, mileage, condition, region, 3]  top-3 SHAP features
+  factor_impact.npy  float16 [vehicle, mileage, condition, region, 3]  signed SHAP values
+  meta.json          axes, vehicle list, model version
+
+Set PRICE_GRID=0 to bypass the grid entirely.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from scripts import model_utils as mu
+
+GRID_DIR = mu._MODELS_DIR / "price_grid"
+
+MILEAGE_BUCKETS = [0, 10_000, 20_000, 30_000, 45_000, 60_000, 80_000,
+                   100_000, 125_000, 150_000, 200_000, 250_000]
+CONDITIONS      = ["new", "like new", "excellent", "good", "fair", "poor", "salvage"]
+REGIONS         = ["california", "texas", "florida", "new york", "illinois", "ohio", "georgia"]
+TOP_K           = 3
+
+
+# ── Serving ───────────────────────────────────────────────────────────────────
+class PriceGrid:
+    """Read-only, memory-mapped view of a built grid."""
+
+    def __init__(self, grid_dir: Path = GRID_DIR):
+        meta = json.loads((grid_dir / "meta.json").read_text())
+        self.model_version = meta["model_version"]
+        self.mileage       = np.asarray(meta["mileage_buckets"], dtype=float)
+        self.conditions    = {c: i for i, c in enumerate(meta["conditions"])}
+        self.regions       = {r: i for i, r in enumerate(meta["regions"])}
+        self.vehicles      = {(m, mo, int(y)): i for i, (m, mo, y) in enumerate(meta["vehicles"])}
+        self.prices        = np.load(grid_dir / "prices.npy",        mmap_mode="r")
+        self.factor_idx    = np.load(grid_dir / "factor_idx.npy",    mmap_mode="r")
+        self.factor_impact = np.load(grid_dir / "factor_impact.npy", mmap_mode="r")
+
+    def lookup(
+        self,
+        make: str, model: str, year: int,
+        mileage: float, condition: str, region: str,
+    ) -> tuple[float, np.ndarray, np.ndarray] | None:
+        """
+        Interpolated price plus the nearest bucket's top-k (feature index,
+        signed SHAP value), or None when the query is off-grid.
+        """
+        v = self.vehicles.get((make, model, int(year)))
+        c = self.conditions.get(condition)
+        r = self.regions.get(region)
+        if v is None or c is None or r is None:
+            return None
+        if not self.mileage[0] <= mileage <= self.mileage[-1]:
+            return None
+
+        i = int(np.searchsorted(self.mileage, mileage, side="right")) - 1
+        i = min(max(i, 0), len(self.mileage) - 2)
+        t = (mileage - self.mileage[i]) / (self.mileage[i + 1] - self.mileage[i])
+        p0, p1 = float(self.prices[v, i, c, r]), float(self.prices[v, i + 1, c, r])
+        price  = float(np.exp((1 - t) * np.log(p0) + t * np.log(p1)))
+
+        near = i if t < 0.5 else i + 1
+        return price, self.factor_idx[v, near, c, r], self.factor_impact[v, near, c, r]
+
+
+_grid: PriceGrid | None = None
+_grid_mtime: int | None = None
+
+
+def active_grid() -> PriceGrid | None:
+    """The grid on disk (reloaded when it is rebuilt), or None if absent / disabled."""
+    global _grid, _grid_mtime
+    if os.environ.get("PRICE_GRID", "1") == "0":
+        return None
+    try:
+        mtime = (GRID_DIR / "meta.json").stat().st_mtime_ns
+    except FileNotFoundError:
+        _grid, _grid_mtime = None, None
+        return None
+    if mtime != _grid_mtime:
+        _grid, _grid_mtime = PriceGrid(GRID_DIR), mtime
+    return _grid
+
+
+def predict_from_grid(
+    make: str, model: str, year: int,
+    mileage: int, condition: str, region: str,
+) -> dict | None:
+    """
+    Grid-served equivalent of model_utils.predict_and_explain, or None when
+    the model must be used.  SHAP factors come from the nearest mileage
+    bucket; their "value" is the query's own encoded feature value.
+    """
+    grid = active_grid()
+    if grid is None or grid.model_version != mu.model_version():
+        return None
+    row = mu.listing_row(make, model, year, mileage, condition, region)
+    hit = grid.lookup(row["make"], row["model"], year, mileage, row["condition"], row["region"])
+    if hit is None:
+        return None
+
+    price, idx, impact = hit
+    x = mu.encode_rows([row])[0]
+    return {
+        "predicted_price": price,
+        "shap_factors": [
+            {
+                "feature":   mu.FEATURE_COLS[j],
+                "value":     float(x[j]),
+                "impact":    round(abs(float(sv)), 4),
+                "direction": "increases price" if sv > 0 else "decreases price",
+            }
+            for j, sv in zip(idx.tolist(), impact.tolist())
+        ],
+        "model_version": grid.model_version,
+    }
+
+
+# ── Build ─────────────────────────────────────────────────────────────────────
+def build(grid_dir: Path = GRID_DIR, chunk: int = 64) -> None:
+    from backend.car_catalog import CATALOG
+
+    bundle   = mu._load_artifacts()
+    vehicles = sorted({(r["make"], r["model"], int(r["year"])) for r in CATALOG})
+    shape    = (len(vehicles), len(MILEAGE_BUCKETS), len(CONDITIONS), len(REGIONS))
+    print(f"Scoring {len(vehicles):,} vehicles × {np.prod(shape[1:]):,} cells "
+          f"= {np.prod(shape):,} rows (model {bundle.version})")
+
+    tmp_dir = grid_dir.with_name(grid_dir.name + ".tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir(parents=True)
+
+    open_mm = np.lib.format.open_memmap
+    prices  = open_mm(tmp_dir / "prices.npy",        mode="w+", dtype=np.float32, shape=shape)
+    f_idx   = open_mm(tmp_dir / "factor_idx.npy",    mode="w+", dtype=np.uint8,   shape=shape + (TOP_K,))
+    f_imp   = open_mm(tmp_dir / "factor_impact.npy", mode="w+", dtype=np.float16, shape=shape + (TOP_K,))
+
+    t0 = time.perf_counter()
+    for start in range(0, len(vehicles), chunk):
+        block = vehicles[start : start + chunk]
+        rows  = [
+            mu.listing_row(make, model, year, miles, cond, region)
+            for make, model, year in block
+            for miles in MILEAGE_BUCKETS
+            for cond in CONDITIONS
+            for region in REGIONS
+        ]
+        X        = mu.encode_rows(rows, bundle)
+        sv, base = mu._contributions(bundle, X, "xgboost")
+        top      = np.argsort(-np.abs(sv), axis=1)[:, :TOP_K]
+        end      = start + len(block)
+
+        prices[start:end] = np.expm1(base + sv.sum(axis=1)).reshape((len(block),) + shape[1:])
+        f_idx[start:end]  = top.reshape((len(block),) + shape[1:] + (TOP_K,))
+        f_imp[start:end]  = np.take_along_axis(sv, top, axis=1).reshape((len(block),) + shape[1:] + (TOP_K,))
+        print(f"  {end:>6,} / {len(vehicles):,} vehicles  ({time.perf_counter() - t0:,.0f} s)")
+
+    for arr in (prices, f_idx, f_imp):
+        arr.flush()
+    del prices, f_idx, f_imp
+
+    (tmp_dir / "meta.json").write_text(json.dumps({
+        "model_version":   bundle.version,
+        "mileage_buckets": MILEAGE_BUCKETS,
+        "conditions":      CONDITIONS,
+        "regions":         REGIONS,
+        "vehicles":        [list(v) for v in vehicles],
+    }))
+
+    shutil.rmtree(grid_dir, ignore_errors=True)
+    tmp_dir.rename(grid_dir)
+    size_mb = sum(f.stat().st_size for f in grid_dir.iterdir()) / 1_048_576
+    print(f"Price grid written to {grid_dir} ({size_mb:,.1f} MB)")
+
+
+if __name__ == "__main__":
+    build()